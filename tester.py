@@ -1,26 +1,62 @@
+import ast
+import codecs
+import csv
+import hashlib
+import io
 import json
+import keyword
 import os
 import platform
 import queue
+import random
 import re
 import shutil
+import sqlite3
 import subprocess
 import sys
+import tempfile
 import threading
+import time
+import tokenize
 import difflib
 import tkinter as tk
+import tkinter.font as tkfont
 import zipfile
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import lru_cache
+from itertools import combinations
 from pathlib import Path
-from tkinter import filedialog, messagebox
+from typing import NamedTuple
+from tkinter import filedialog, messagebox, simpledialog
 from tkinter import ttk
 from tkinter.scrolledtext import ScrolledText
 
-from pygments import lex
 from pygments.lexers import PythonLexer
 from pygments.token import Token
 
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+try:
+	from watchdog.observers import Observer
+except ImportError:  # FileWatcherService falls back to polling
+	Observer = None
+
+def atomic_write_text(path: Path, content: str, encoding: str = "utf-8") -> None:
+	"""Write content to path so readers see either the old or the new file, never a torn one."""
+	temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+	try:
+		with open(temp_path, "w", encoding=encoding, newline="") as temp_file:
+			temp_file.write(content)
+			temp_file.flush()
+			os.fsync(temp_file.fileno())
+		os.replace(temp_path, path)
+	except BaseException:
+		try:
+			temp_path.unlink()
+		except OSError:
+			pass
+		raise
 
 def get_base_dir():
 	if getattr(sys, 'frozen', False):
@@ -44,6 +80,13 @@ ASSETS_DIR = BASE_DIR / "assets"
 PREDEFINED_INPUTS_PATH = BASE_DIR / "predefined_inputs.json"
 CONFIG_PATH = BASE_DIR / "config.json"
 FEEDBACK_TEMPLATE_PATH = BASE_DIR / "feedback_template.txt"
+CACHE_DIR = BASE_DIR / "cache"
+ARTIFACT_CACHE_MB = 64
+FEEDBACK_AUTOSAVE_DELAY_MS = 1000
+DASHBOARD_DELIMITER = " │ "
+GRADING_DB_PATH = BASE_DIR / "grading_state.db"
+SUITES_DIR = BASE_DIR / "suites"
+DEFAULT_SUITE_NAME = "Default"
 
 if getattr(sys, 'frozen', False):
 	ICON_PATH = get_resource_path("assets/icon.png")
@@ -65,7 +108,27 @@ GRADE_COLORS = {
     "3": "#b88a00",  
     "2": "#fd7e14", 
     "1": "#a70313",  
-    "F": "#ff0000", 
+    "F": "#ff0000",
+}
+
+CODE_TOKEN_COLORS = {
+	Token.Keyword: "#C586C0",
+	Token.Keyword.Constant: "#569CD6",
+	Token.Keyword.Namespace: "#C586C0",
+	Token.Name.Builtin: "#4EC9B0",
+	Token.Name.Builtin.Pseudo: "#569CD6",
+	Token.Name.Function: "#DCDCAA",
+	Token.Name.Class: "#4EC9B0",
+	Token.Name.Decorator: "#DCDCAA",
+	Token.String: "#CE9178",
+	Token.String.Doc: "#6A9955",
+	Token.Number: "#B5CEA8",
+	Token.Comment: "#6A9955",
+	Token.Comment.Single: "#6A9955",
+	Token.Comment.Multiline: "#6A9955",
+	Token.Operator: "#D4D4D4",
+	Token.Punctuation: "#D4D4D4",
+	Token.Name: "#9CDCFE",
 }
 
 class ToolTip:
@@ -113,6 +176,2643 @@ def get_python_executable():
 	else:
 		return sys.executable
 
+class LazySyntaxHighlighter:
+	"""Highlights Python code in a Text widget, visible lines first and the rest in idle slices.
+
+	The lexer runs as a resumable generator, so every line is lexed at most once no matter
+	where the user scrolls; the finished token spans are kept per line.
+	"""
+
+	MARGIN_LINES = 80
+	SLICE_LINES = 300
+	SLICE_DELAY_MS = 10
+
+	def __init__(self, text_widget: tk.Text, code: str, line_spans: list | None = None, on_complete=None,
+				 comment_font: tkfont.Font | None = None) -> None:
+		self.text_widget = text_widget
+		self.comment_font = comment_font
+		self.code = code
+		self.lines = code.split("\n")
+		self.on_complete = on_complete
+		self.tagged = bytearray(len(self.lines))
+		self.next_untagged = 0
+		if line_spans is not None and len(line_spans) == len(self.lines):
+			self.line_spans = line_spans
+			self.lexed_lines = len(self.lines)
+			self._tokens = iter(())
+		else:
+			self.line_spans = [[] for _ in self.lines]
+			self.lexed_lines = 0
+			self._tokens = PythonLexer().get_tokens_unprocessed(code)
+		self._lex_line = 0
+		self._lex_line_start = 0
+		self._tag_cache: dict = {}
+		self._visible_job = None
+		self._idle_job = None
+
+	@classmethod
+	def lex(cls, code: str) -> list:
+		"""Token spans of every line without a widget, for lexing ahead on a worker thread."""
+		highlighter = cls(None, code)
+		highlighter._lex_until(len(highlighter.lines))
+		return highlighter.line_spans
+
+	def start(self) -> None:
+		self.text_widget.tag_config("highlight_open", background="#1F303A")
+		self.text_widget.tag_config("highlight_close", background="#1F3A1F")
+		self.text_widget.tag_config("highlight_unclosed", background="#4A1F1F")
+		self.configure_tags()
+		self.highlight_visible()
+		self._schedule_idle_slice()
+
+	def configure_tags(self) -> None:
+		comment_font = self.comment_font
+		if comment_font is None:
+			comment_font = tkfont.Font(font=self.text_widget.cget("font"))
+			comment_font.configure(slant="italic")
+			self.comment_font = comment_font
+
+		for token_type, color in CODE_TOKEN_COLORS.items():
+			tag_name = str(token_type)
+			if token_type in Token.Comment:
+				self.text_widget.tag_config(tag_name, foreground=color, font=comment_font)
+			else:
+				self.text_widget.tag_config(tag_name, foreground=color)
+		for tag_name in ("highlight_open", "highlight_close", "highlight_unclosed"):
+			self.text_widget.tag_raise(tag_name)
+
+	def mark_resource_lines(self, report: "ResourceReport") -> None:
+		for tag_name, lines in (("highlight_open", report.open_lines),
+								("highlight_close", report.close_lines),
+								("highlight_unclosed", report.partial_lines + report.unclosed_lines)):
+			self.text_widget.tag_remove(tag_name, "1.0", tk.END)
+			indices = [index for line_num in sorted(set(lines)) for index in (f"{line_num}.0", f"{line_num}.end+1c")]
+			if indices:
+				self.text_widget.tag_add(tag_name, *indices)
+
+	def on_scroll(self) -> None:
+		if self._visible_job is None and not self.is_complete():
+			self._visible_job = self.text_widget.after_idle(self.highlight_visible)
+
+	def is_complete(self) -> bool:
+		return self.next_untagged >= len(self.lines)
+
+	def highlight_visible(self) -> None:
+		self._visible_job = None
+		if not self.text_widget.winfo_exists():
+			return
+		first = int(self.text_widget.index("@0,0").split(".")[0]) - 1
+		last = int(self.text_widget.index(f"@0,{self.text_widget.winfo_height()}").split(".")[0]) - 1
+		self.highlight_lines(first - self.MARGIN_LINES, last + self.MARGIN_LINES)
+
+	def highlight_lines(self, first: int, last: int) -> None:
+		first = max(0, first)
+		last = min(len(self.lines) - 1, last)
+		if first > last:
+			return
+		self._lex_until(last)
+
+		ranges: dict[str, list[str]] = {}
+		for line_idx in range(first, last + 1):
+			if self.tagged[line_idx]:
+				continue
+			self.tagged[line_idx] = 1
+			line_num = line_idx + 1
+			for start_col, end_col, tag_name in self.line_spans[line_idx]:
+				ranges.setdefault(tag_name, []).extend((f"{line_num}.{start_col}", f"{line_num}.{end_col}"))
+
+		for tag_name, indices in ranges.items():
+			self.text_widget.tag_add(tag_name, *indices)
+
+		while self.next_untagged < len(self.lines) and self.tagged[self.next_untagged]:
+			self.next_untagged += 1
+
+	def cancel(self) -> None:
+		for job in (self._visible_job, self._idle_job):
+			if job is not None:
+				try:
+					self.text_widget.after_cancel(job)
+				except tk.TclError:
+					pass
+		self._visible_job = None
+		self._idle_job = None
+
+	def _schedule_idle_slice(self) -> None:
+		if self.is_complete():
+			self._idle_job = None
+			if self.on_complete:
+				self.on_complete(self)
+				self.on_complete = None
+			return
+		self._idle_job = self.text_widget.after(self.SLICE_DELAY_MS, self._idle_slice)
+
+	def _idle_slice(self) -> None:
+		self._idle_job = None
+		if not self.text_widget.winfo_exists():
+			return
+		start = self.next_untagged
+		self.highlight_lines(start, start + self.SLICE_LINES - 1)
+		self._schedule_idle_slice()
+
+	def _resolve_tag(self, token_type) -> str | None:
+		if token_type in self._tag_cache:
+			return self._tag_cache[token_type]
+		resolved = token_type
+		while resolved is not None and resolved not in CODE_TOKEN_COLORS:
+			resolved = resolved.parent
+		tag_name = str(resolved) if resolved is not None else None
+		self._tag_cache[token_type] = tag_name
+		return tag_name
+
+	def _lex_until(self, last_line: int) -> None:
+		"""Resume the lexer until every line up to last_line has its spans."""
+		while self.lexed_lines <= last_line:
+			token = next(self._tokens, None)
+			if token is None:
+				self.lexed_lines = len(self.lines)
+				return
+			position, token_type, value = token
+			tag_name = self._resolve_tag(token_type)
+
+			segment_start = position
+			segments = value.split("\n")
+			for index, segment in enumerate(segments):
+				if segment and tag_name:
+					start_col = segment_start - self._lex_line_start
+					spans = self.line_spans[self._lex_line]
+					if spans and spans[-1][2] == tag_name and spans[-1][1] == start_col:
+						spans[-1] = (spans[-1][0], start_col + len(segment), tag_name)
+					else:
+						spans.append((start_col, start_col + len(segment), tag_name))
+				segment_start += len(segment) + 1
+				if index < len(segments) - 1:
+					# A multi-line token (docstring, triple-quoted string) continues on the next line.
+					self._lex_line += 1
+					self._lex_line_start = segment_start
+					self.lexed_lines = self._lex_line
+
+def estimate_size(value, sample: int = 32) -> int:
+	"""Approximate deep size of value in bytes; long containers are estimated from a sample."""
+	size = sys.getsizeof(value)
+	if isinstance(value, (str, bytes, int, float)) or value is None:
+		return size
+	if isinstance(value, dict):
+		children = [item for pair in value.items() for item in pair]
+	elif isinstance(value, (list, tuple)):
+		children = value
+	elif isinstance(value, (set, frozenset)):
+		children = list(value)
+	elif hasattr(value, "__dict__"):
+		return size + estimate_size(vars(value), sample)
+	else:
+		return size
+	count = len(children)
+	if count <= sample:
+		return size + sum(estimate_size(child, sample) for child in children)
+	sampled = sum(estimate_size(children[i * count // sample], sample) for i in range(sample))
+	return size + sampled * count // sample
+
+class CacheStats(NamedTuple):
+	hits: int
+	misses: int
+	evictions: int
+	entries: int
+	size: int
+	max_size: int
+
+	@property
+	def hit_rate(self) -> float:
+		lookups = self.hits + self.misses
+		return self.hits / lookups if lookups else 0.0
+
+class ArtifactCache:
+	"""Thread-safe LRU of submission artefacts kept under one memory budget.
+
+	File artefacts remember the signature and content hash of every file they were built
+	from: an unchanged signature is a hit without reading, a changed one is re-read and
+	only rebuilt if the content hash differs too; revalidate=True (a watcher event)
+	always re-reads and hashes. Derived artefacts (token spans and the like) are keyed
+	by the hash of the content they describe.
+	"""
+
+	def __init__(self, max_bytes: int = ARTIFACT_CACHE_MB * 1024 * 1024) -> None:
+		self.max_bytes = max_bytes
+		self._entries: OrderedDict[tuple, tuple[tuple, object, int]] = OrderedDict()   # key -> (sources, value, size)
+		self._size = 0
+		self._evict_listeners: dict[str, object] = {}
+		self._lock = threading.Lock()
+		self.hits = 0
+		self.misses = 0
+		self.evictions = 0
+
+	def load(self, kind: str, paths: tuple[Path, ...], build, revalidate: bool = False) -> object:
+		"""The artefact build(raw bytes of paths) makes; only the first path has to exist."""
+		key = (kind, *paths)
+		signatures = [file_signature(path) for path in paths]
+		with self._lock:
+			entry = self._entries.get(key)
+			if not revalidate and entry is not None and [signature for signature, _ in entry[0]] == signatures:
+				self._entries.move_to_end(key)
+				self.hits += 1
+				return entry[1]
+
+		raw = [paths[0].read_bytes()]
+		for path, signature in zip(paths[1:], signatures[1:]):
+			try:
+				raw.append(path.read_bytes() if signature is not None else None)
+			except OSError:
+				raw.append(None)
+		sources = tuple((signature, hashlib.sha1(data).hexdigest() if data is not None else None)
+						for signature, data in zip(signatures, raw))
+		if entry is not None and [content_hash for _, content_hash in entry[0]] == [content_hash for _, content_hash in sources]:
+			with self._lock:
+				self.hits += 1
+			self._store(key, sources, entry[1], entry[2])
+			return entry[1]
+
+		with self._lock:
+			self.misses += 1
+		value = build(raw)
+		self._store(key, sources, value)
+		return value
+
+	def text(self, path: Path) -> str:
+		"""Content of a UTF-8 text file, with newlines translated like Path.read_text."""
+		return self.load("text", (path,), lambda raw: raw[0].decode("utf-8").replace("\r\n", "\n").replace("\r", "\n"))
+
+	def get(self, kind: str, key: str) -> object | None:
+		with self._lock:
+			entry = self._entries.get((kind, key))
+			if entry is None:
+				self.misses += 1
+				return None
+			self._entries.move_to_end((kind, key))
+			self.hits += 1
+			return entry[1]
+
+	def peek(self, kind: str, key: str) -> object | None:
+		"""Like get, without counting a lookup or refreshing the entry."""
+		with self._lock:
+			entry = self._entries.get((kind, key))
+		return entry[1] if entry is not None else None
+
+	def put(self, kind: str, key: str, value) -> None:
+		self._store((kind, key), (), value)
+
+	def on_evict(self, kind: str, listener) -> None:
+		"""Call listener(key, value) for each entry of kind dropped to stay within budget."""
+		self._evict_listeners[kind] = listener
+
+	def set_budget(self, max_bytes: int) -> None:
+		with self._lock:
+			self.max_bytes = max_bytes
+			evicted = self._evict_locked()
+		self._notify(evicted)
+
+	def stats(self) -> CacheStats:
+		with self._lock:
+			return CacheStats(self.hits, self.misses, self.evictions, len(self._entries), self._size, self.max_bytes)
+
+	def _store(self, key: tuple, sources: tuple, value, size: int | None = None) -> None:
+		if size is None:
+			size = estimate_size(value)
+		with self._lock:
+			previous = self._entries.pop(key, None)
+			if previous is not None:
+				self._size -= previous[2]
+			self._entries[key] = (sources, value, size)
+			self._size += size
+			evicted = self._evict_locked()
+		self._notify(evicted)
+
+	def _evict_locked(self) -> list[tuple[tuple, object]]:
+		evicted = []
+		# The newest entry always stays, so one oversized artefact is still served from memory.
+		while self._size > self.max_bytes and len(self._entries) > 1:
+			key, (_, value, size) = self._entries.popitem(last=False)
+			self._size -= size
+			self.evictions += 1
+			evicted.append((key, value))
+		return evicted
+
+	def _notify(self, evicted: list[tuple[tuple, object]]) -> None:
+		for key, value in evicted:
+			listener = self._evict_listeners.get(key[0])
+			if listener is not None:
+				listener(key[1], value)
+
+class HighlightCache:
+	"""Per-file token spans and derived data, keyed by content hash.
+
+	Entries live in the shared ArtifactCache; the ones it evicts (and everything left
+	at exit) are spilled to JSON files in the cache directory, so reopening an
+	unchanged file needs no lexing.
+	"""
+
+	VERSION = 2
+	KIND = "highlight"
+
+	def __init__(self, cache_dir: Path, memory: ArtifactCache, max_disk_entries: int = 300) -> None:
+		self.cache_dir = cache_dir
+		self.memory = memory
+		self.max_disk_entries = max_disk_entries
+		self._unsaved: set[str] = set()
+		self._lock = threading.Lock()
+		memory.on_evict(self.KIND, self._on_evicted)
+
+	@staticmethod
+	def content_hash(content: str) -> str:
+		return hashlib.sha1(content.encode("utf-8", errors="surrogatepass")).hexdigest()
+
+	@staticmethod
+	def build_line_offsets(content: str) -> list[int]:
+		offsets = [0]
+		position = content.find("\n")
+		while position != -1:
+			offsets.append(position + 1)
+			position = content.find("\n", position + 1)
+		return offsets
+
+	def get(self, key: str) -> dict | None:
+		entry = self.memory.get(self.KIND, key)
+		if entry is not None:
+			return entry
+
+		entry = self._load_from_disk(key)
+		if entry is not None:
+			self.memory.put(self.KIND, key, entry)
+		return entry
+
+	def put(self, key: str, entry: dict) -> None:
+		with self._lock:
+			existing = self.memory.peek(self.KIND, key)
+			if existing is not None:
+				existing.update(entry)
+				entry = existing
+			self._unsaved.add(key)
+		self.memory.put(self.KIND, key, entry)
+
+	def flush(self) -> None:
+		with self._lock:
+			keys = list(self._unsaved)
+			self._unsaved.clear()
+		entries = ((key, self.memory.peek(self.KIND, key)) for key in keys)
+		self._spill([(key, entry) for key, entry in entries if entry is not None])
+
+	def _on_evicted(self, key: str, entry: dict) -> None:
+		with self._lock:
+			if key not in self._unsaved:
+				return
+			self._unsaved.discard(key)
+		self._spill([(key, entry)])
+
+	def _entry_path(self, key: str) -> Path:
+		return self.cache_dir / f"{key}.json"
+
+	def _load_from_disk(self, key: str) -> dict | None:
+		entry_path = self._entry_path(key)
+		if not entry_path.exists():
+			return None
+		try:
+			data = json.loads(entry_path.read_text(encoding="utf-8"))
+		except (OSError, ValueError):
+			return None
+		if not isinstance(data, dict) or data.get("version") != self.VERSION:
+			return None
+
+		entry = dict(data.get("entry", {}))
+		if "line_spans" in entry:
+			tags = data.get("tags", [])
+			entry["line_spans"] = [[(start, end, tags[tag_idx]) for start, end, tag_idx in spans]
+								   for spans in entry["line_spans"]]
+		return entry
+
+	def _spill(self, entries: list[tuple[str, dict]]) -> None:
+		if not entries:
+			return
+		try:
+			self.cache_dir.mkdir(parents=True, exist_ok=True)
+		except OSError as e:
+			print(f"Failed to create cache directory: {e}")
+			return
+
+		for key, entry in entries:
+			serializable = dict(entry)
+			tags: list[str] = []
+			if "line_spans" in serializable:
+				tag_ids: dict[str, int] = {}
+				serializable["line_spans"] = [[(start, end, tag_ids.setdefault(tag, len(tag_ids))) for start, end, tag in spans]
+											  for spans in serializable["line_spans"]]
+				tags = list(tag_ids)
+			try:
+				atomic_write_text(self._entry_path(key),
+								  json.dumps({"version": self.VERSION, "tags": tags, "entry": serializable}, separators=(",", ":")))
+			except (OSError, TypeError, ValueError) as e:
+				print(f"Failed to write cache entry {key}: {e}")
+		self._prune_disk()
+
+	def _prune_disk(self) -> None:
+		try:
+			cached_files = sorted(self.cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime)
+		except OSError:
+			return
+		for stale in cached_files[:max(0, len(cached_files) - self.max_disk_entries)]:
+			try:
+				stale.unlink()
+			except OSError:
+				pass
+
+class JsonFileStore:
+	"""Coalesces writes of an in-memory JSON document to its file.
+
+	mark_dirty() only arms a flush FLUSH_DELAY_MS later on the Tk loop, so a burst of
+	changes (a held Ctrl+Scroll, reordering many inputs) costs one write. The flush
+	serialises the data on the main thread and hands the atomic write to the executor;
+	versioning keeps a late, older snapshot from overwriting a newer one. The target path
+	is captured with each snapshot, so retargeting the store never redirects a queued write.
+	"""
+
+	FLUSH_DELAY_MS = 750
+
+	def __init__(self, root: tk.Tk, path: Path, executor: ThreadPoolExecutor, snapshot) -> None:
+		self.root = root
+		self.path = path
+		self.executor = executor
+		self.snapshot = snapshot    # callable returning the JSON-serialisable data
+		self.dirty = False
+		self._job = None
+		self._version = 0
+		self._written_versions: dict[Path, int] = {}
+		self._write_lock = threading.Lock()
+
+	def mark_dirty(self) -> None:
+		self.dirty = True
+		if self._job is None:
+			self._job = self.root.after(self.FLUSH_DELAY_MS, self._flush_in_background)
+
+	def _serialise(self) -> tuple[Path, str, int]:
+		self.dirty = False
+		self._version += 1
+		return self.path, json.dumps(self.snapshot(), indent=2), self._version
+
+	def _flush_in_background(self) -> None:
+		self._job = None
+		if self.dirty:
+			self.executor.submit(self._write, *self._serialise())
+
+	def _write(self, path: Path, text: str, version: int) -> None:
+		with self._write_lock:
+			if version <= self._written_versions.get(path, 0):
+				return
+			try:
+				atomic_write_text(path, text)
+			except OSError as e:
+				print(f"Failed to save {path.name}: {e}")
+				return
+			self._written_versions[path] = version
+
+	def flush(self) -> None:
+		"""Write any pending changes now, on the calling thread."""
+		if self._job is not None:
+			self.root.after_cancel(self._job)
+			self._job = None
+		if self.dirty:
+			self._write(*self._serialise())
+
+	def retarget(self, path: Path) -> None:
+		"""Write pending changes to the current file, then save to path from now on."""
+		self.flush()
+		self.path = path
+
+class TestSuite(NamedTuple):
+	"""One assignment's test material, laid out like the top-level files of the app."""
+	name: str
+	root: Path
+
+	@property
+	def inputs_path(self) -> Path:
+		return self.root / "predefined_inputs.json"
+
+	@property
+	def data_dir(self) -> Path:
+		return self.root / "data"
+
+	@property
+	def feedback_template_path(self) -> Path:
+		return self.root / "feedback_template.txt"
+
+class SuiteLibrary:
+	"""Named test suites: the top-level files are the default suite, every folder in suites/ another.
+
+	A suite's inputs and feedback template are read the first time it is opened and kept,
+	so switching back and forth between assignments does not go to disk again. The cached
+	inputs list is the one the app edits, so it never goes stale.
+	"""
+
+	def __init__(self, base_dir: Path, suites_dir: Path) -> None:
+		self.base_dir = base_dir
+		self.suites_dir = suites_dir
+		self._inputs: dict[str, list[str]] = {}
+		self._templates: dict[str, str] = {}
+
+	def names(self) -> list[str]:
+		try:
+			folders = sorted((path.name for path in self.suites_dir.iterdir() if path.is_dir()), key=str.lower)
+		except OSError:
+			folders = []
+		return [DEFAULT_SUITE_NAME] + [name for name in folders if name != DEFAULT_SUITE_NAME]
+
+	def get(self, name: str) -> TestSuite:
+		if name == DEFAULT_SUITE_NAME:
+			return TestSuite(name, self.base_dir)
+		return TestSuite(name, self.suites_dir / name)
+
+	def load_inputs(self, suite: TestSuite) -> list[str]:
+		"""The suite's predefined inputs; raises json.JSONDecodeError if the file is corrupted."""
+		if suite.name not in self._inputs:
+			items: list[str] = []
+			if suite.inputs_path.exists():
+				data = json.loads(suite.inputs_path.read_text(encoding="utf-8"))
+				if isinstance(data, list):
+					items = [str(item) for item in data]
+			self._inputs[suite.name] = items
+		return self._inputs[suite.name]
+
+	def set_inputs(self, suite: TestSuite, items: list[str]) -> None:
+		self._inputs[suite.name] = items
+
+	def feedback_template(self, suite: TestSuite) -> str:
+		if suite.name not in self._templates:
+			template_path = suite.feedback_template_path
+			if template_path.exists():
+				try:
+					self._templates[suite.name] = template_path.read_text(encoding="utf-8")
+				except Exception as e:
+					print(f"Failed to load feedback template: {e}")
+					return ""
+			else:
+				self._templates[suite.name] = ""
+				try:
+					template_path.write_text("", encoding="utf-8")
+				except Exception as e:
+					print(f"Failed to create default feedback template: {e}")
+		return self._templates[suite.name]
+
+	def save_feedback_template(self, suite: TestSuite, content: str) -> None:
+		suite.feedback_template_path.write_text(content, encoding="utf-8")
+		self._templates[suite.name] = content
+
+	def create(self, name: str, copy_from: TestSuite) -> TestSuite:
+		"""New suite folder seeded with a copy of another suite's inputs, data files and template."""
+		name = name.strip()
+		if not name or name in (".", "..") or any(char in name for char in '\\/:*?"<>|'):
+			raise ValueError(f"\"{name}\" is not a valid suite name.")
+		if name in self.names():
+			raise ValueError(f"A suite named \"{name}\" already exists.")
+		suite = self.get(name)
+		suite.data_dir.mkdir(parents=True)
+		if copy_from.data_dir.exists():
+			for data_file in copy_from.data_dir.glob("*.txt"):
+				shutil.copy(data_file, suite.data_dir / data_file.name)
+		for source, dest in ((copy_from.inputs_path, suite.inputs_path),
+							 (copy_from.feedback_template_path, suite.feedback_template_path)):
+			if source.exists():
+				shutil.copy(source, dest)
+		return suite
+
+class PresetListModel:
+	"""The predefined inputs list and its Listbox, kept in step one row at a time.
+
+	Inserts, deletes, edits and moves touch only the affected Listbox rows. Tk keeps item
+	colours on row indices rather than on the items, so every change restyles the rows
+	whose index it shifted, and the positions of "# Checklist" rows are kept sorted with
+	bisect so finding the checklist above any row is a binary search. Every change marks
+	the backing JsonFileStore dirty instead of writing the file.
+	"""
+
+	def __init__(self, listbox: tk.Listbox, store: JsonFileStore) -> None:
+		self.listbox = listbox
+		self.store = store
+		self.items: list[str] = []
+		self.checklist_rows: list[int] = []
+
+	@staticmethod
+	def is_checklist(item: str) -> bool:
+		return item.strip().startswith("# Checklist")
+
+	def reload(self, items: list[str]) -> None:
+		"""Show a whole new list (initial load, import); the list object is shared, not copied."""
+		self.items = items
+		self.listbox.delete(0, tk.END)
+		if items:
+			self.listbox.insert(tk.END, *items)
+		for index, item in enumerate(items):
+			if item.strip().startswith("#"):
+				self._style_row(index)
+		self.checklist_rows = [index for index, item in enumerate(items) if self.is_checklist(item)]
+
+	def _style_row(self, index: int) -> None:
+		item = self.items[index].strip()
+		if item.startswith("# Checklist "):
+			self.listbox.itemconfig(index, fg="green", selectbackground="lightblue")
+		elif item.startswith("#"):
+			self.listbox.itemconfig(index, fg="blue", selectbackground="lightblue")
+		else:
+			self.listbox.itemconfig(index, fg="", selectbackground="")
+
+	def _restyle_rows(self, start: int, stop: int) -> None:
+		for index in range(start, min(stop, len(self.items))):
+			self._style_row(index)
+
+	def _shift_checklist_rows(self, start: int, offset: int) -> None:
+		position = bisect_left(self.checklist_rows, start)
+		for i in range(position, len(self.checklist_rows)):
+			self.checklist_rows[i] += offset
+
+	def _insert_row(self, index: int, value: str) -> None:
+		self.items.insert(index, value)
+		self.listbox.insert(index, value)
+		self._shift_checklist_rows(index, 1)
+		if self.is_checklist(value):
+			insort(self.checklist_rows, index)
+
+	def _delete_row(self, index: int) -> str:
+		value = self.items.pop(index)
+		self.listbox.delete(index)
+		position = bisect_left(self.checklist_rows, index)
+		if position < len(self.checklist_rows) and self.checklist_rows[position] == index:
+			del self.checklist_rows[position]
+		self._shift_checklist_rows(index, -1)
+		return value
+
+	def insert(self, index: int, value: str) -> None:
+		self._insert_row(index, value)
+		self._restyle_rows(index, len(self.items))
+		self.store.mark_dirty()
+
+	def delete(self, index: int) -> str:
+		value = self._delete_row(index)
+		self._restyle_rows(index, len(self.items))
+		self.store.mark_dirty()
+		return value
+
+	def set(self, index: int, value: str) -> None:
+		if self.items[index] == value:
+			return
+		self._insert_row(index, value)
+		self._delete_row(index + 1)
+		self._restyle_rows(index, index + 1)
+		self.store.mark_dirty()
+
+	def move(self, index: int, new_index: int) -> None:
+		self._insert_row(new_index, self._delete_row(index))
+		self._restyle_rows(min(index, new_index), max(index, new_index) + 1)
+		self.store.mark_dirty()
+
+	def checklist_for(self, index: int) -> str:
+		position = bisect_right(self.checklist_rows, index) - 1
+		if position < 0:
+			return "No checklist found"
+		return self.items[self.checklist_rows[position]].strip()
+
+@lru_cache(maxsize=64)
+def compile_search_pattern(term: str, whole_word: bool = False, use_regex: bool = False) -> re.Pattern:
+	expression = term if use_regex else re.escape(term)
+	if whole_word:
+		expression = rf"(?<!\w)(?:{expression})(?!\w)"
+	return re.compile(expression, re.IGNORECASE)
+
+class SourceSearchIndex:
+	"""Case-insensitive search over an in-memory source string.
+
+	Hits are found with compiled regexes and mapped to Text indices through a line
+	offset table; repeating the last query returns its hits without searching again.
+	"""
+
+	def __init__(self, content: str, line_offsets: list[int] | None = None) -> None:
+		self.content = content
+		self.line_offsets = line_offsets or HighlightCache.build_line_offsets(content)
+		self._last_query: tuple[str, bool, bool] | None = None
+		self._last_hits: list[tuple[int, int]] = []
+
+	def find(self, term: str, whole_word: bool = False, use_regex: bool = False) -> list[tuple[int, int]]:
+		"""Return (start, end) offsets of every match; raises re.error for an invalid regex."""
+		if not term:
+			self._last_query = None
+			self._last_hits = []
+			return []
+
+		query = (term, whole_word, use_regex)
+		if query == self._last_query:
+			return self._last_hits
+
+		pattern = compile_search_pattern(term, whole_word, use_regex)
+		# Always rescan: a longer term can match inside text that a shorter term's hit covered.
+		hits = [match.span() for match in pattern.finditer(self.content) if match.end() > match.start()]
+
+		self._last_query = query
+		self._last_hits = hits
+		return hits
+
+	def to_index(self, offset: int) -> str:
+		line_idx = bisect_right(self.line_offsets, offset) - 1
+		return f"{line_idx + 1}.{offset - self.line_offsets[line_idx]}"
+
+class ResourceReport:
+	"""Result of pairing every open() call in a submission with its close or context manager."""
+
+	def __init__(self) -> None:
+		self.managed_lines: list[int] = []    # with open(...) as f
+		self.closed_lines: list[int] = []     # f = open(...) closed on every path
+		self.escaped_lines: list[int] = []    # handle returned or handed to a closing helper
+		self.partial_lines: list[int] = []    # closed on some paths only
+		self.unclosed_lines: list[int] = []   # never closed
+		self.close_lines: list[int] = []
+		self.parse_error: str | None = None
+
+	@property
+	def open_lines(self) -> list[int]:
+		return sorted(self.managed_lines + self.closed_lines + self.escaped_lines
+					  + self.partial_lines + self.unclosed_lines)
+
+	@property
+	def open_count(self) -> int:
+		return len(self.open_lines)
+
+	@property
+	def handled_count(self) -> int:
+		return len(self.managed_lines) + len(self.closed_lines) + len(self.escaped_lines)
+
+	@property
+	def is_balanced(self) -> bool:
+		return self.parse_error is None and not self.partial_lines and not self.unclosed_lines
+
+	def summary(self) -> str:
+		if self.parse_error:
+			return f"open(): {self.open_count} | close(): {len(self.close_lines)} (not parsed)"
+		text = f"open(): {self.open_count} | closed: {self.handled_count}"
+		if self.managed_lines:
+			text += f" ({len(self.managed_lines)} with)"
+		if self.partial_lines:
+			text += f" | partly: {len(self.partial_lines)}"
+		return text
+
+	def to_dict(self) -> dict:
+		return {key: value for key, value in self.__dict__.items()}
+
+	@classmethod
+	def from_dict(cls, data: dict) -> "ResourceReport":
+		report = cls()
+		for key in report.__dict__:
+			if key in data:
+				setattr(report, key, data[key])
+		return report
+
+class _ResourceFlowAnalyzer:
+	"""Walks one module and classifies each open() call by how its handle is released.
+
+	A handle bound to a name is followed through the rest of its scope: each path either
+	closes it, returns it, leaves the scope with it still open, or falls off the end.
+	break and continue carry the handle out of (or round) the innermost loop, and calling a
+	function of the module that closes the handle it captures or is passed counts as closing it.
+	"""
+
+	NON_FILE_OPENERS = {"os", "webbrowser"}
+	LOOP_JUMPS = {"break", "continue"}
+
+	def __init__(self, tree: ast.Module) -> None:
+		self.tree = tree
+		self.report = ResourceReport()
+		self._parents: dict[ast.AST, ast.AST] = {}
+		self._functions: dict[str, list[ast.AST]] = {}
+		for node in ast.walk(tree):
+			for child in ast.iter_child_nodes(node):
+				self._parents[child] = node
+			if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+				self._functions.setdefault(node.name, []).append(node)
+
+	def run(self) -> ResourceReport:
+		for node in ast.walk(self.tree):
+			if isinstance(node, ast.Call):
+				if self._is_close_call(node):
+					self.report.close_lines.append(node.lineno)
+				elif self._is_open_call(node):
+					self._classify(node)
+		for lines in self.report.__dict__.values():
+			if isinstance(lines, list):
+				lines.sort()
+		return self.report
+
+	def _is_open_call(self, node: ast.Call) -> bool:
+		func = node.func
+		if isinstance(func, ast.Name):
+			return func.id == "open"
+		if isinstance(func, ast.Attribute) and func.attr == "open":
+			return not (isinstance(func.value, ast.Name) and func.value.id in self.NON_FILE_OPENERS)
+		return False
+
+	@staticmethod
+	def _is_close_call(node: ast.Call) -> bool:
+		return isinstance(node.func, ast.Attribute) and node.func.attr == "close" and not node.args
+
+	def _classify(self, call: ast.Call) -> None:
+		parent = self._parents.get(call)
+		line = call.lineno
+
+		if isinstance(parent, ast.withitem) and parent.context_expr is call:
+			self.report.managed_lines.append(line)
+			return
+		if isinstance(parent, ast.Return):
+			self.report.escaped_lines.append(line)
+			return
+		if isinstance(parent, (ast.Assign, ast.AnnAssign)) and parent.value is call:
+			targets = parent.targets if isinstance(parent, ast.Assign) else [parent.target]
+			if len(targets) == 1 and isinstance(targets[0], ast.Name):
+				self._classify_bound_handle(parent, targets[0].id, line)
+				return
+			if len(targets) == 1 and self._target_closed_anywhere(targets[0]):
+				self.report.closed_lines.append(line)
+				return
+		self.report.unclosed_lines.append(line)
+
+	def _target_closed_anywhere(self, target: ast.AST) -> bool:
+		target_dump = ast.dump(target, annotate_fields=False).replace("Store()", "Load()")
+		for node in ast.walk(self.tree):
+			if isinstance(node, ast.Call) and self._is_close_call(node):
+				if ast.dump(node.func.value, annotate_fields=False) == target_dump:
+					return True
+		return False
+
+	def _classify_bound_handle(self, statement: ast.stmt, name: str, line: int) -> None:
+		outcomes: set[str] = set()
+		pending = True
+		jumps: set[str] = set()   # break/continue still looking for their loop
+		node = statement
+		while pending or jumps:
+			parent = self._parents.get(node)
+			if parent is None:
+				break
+			block = self._containing_block(parent, node)
+			if block is not None:
+				if pending:
+					position = block.index(node)
+					block_outcomes = self._scan(block[position + 1:], name)
+					pending = "open" in block_outcomes
+					jumps |= block_outcomes & self.LOOP_JUMPS
+					outcomes |= block_outcomes - {"open"} - self.LOOP_JUMPS
+				if isinstance(parent, ast.Try) and block is not parent.finalbody and parent.finalbody:
+					if self._scan(parent.finalbody, name) == {"closed"}:
+						outcomes.add("closed")
+						pending = False
+						jumps = set()
+				if jumps and isinstance(parent, (ast.For, ast.AsyncFor, ast.While)) and block is parent.body:
+					# Leaving the loop, or going round it again, with the handle still open.
+					jumps = set()
+					pending = True
+			if isinstance(parent, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Module, ast.Lambda)):
+				break
+			node = parent
+		if pending or jumps:
+			outcomes.add("leaked")
+
+		if outcomes <= {"closed", "escaped"} and outcomes:
+			if "closed" in outcomes:
+				self.report.closed_lines.append(line)
+			else:
+				self.report.escaped_lines.append(line)
+		elif "closed" in outcomes or "escaped" in outcomes:
+			self.report.partial_lines.append(line)
+		else:
+			self.report.unclosed_lines.append(line)
+
+	@staticmethod
+	def _containing_block(parent: ast.AST, node: ast.AST) -> list | None:
+		for field in ("body", "orelse", "finalbody"):
+			block = getattr(parent, field, None)
+			if isinstance(block, list) and node in block:
+				return block
+		return None
+
+	def _scan(self, statements: list, name: str) -> set[str]:
+		"""Outcomes of running statements with the handle open: closed, escaped, leaked,
+		break, continue or open (falls through)."""
+		outcomes: set[str] = set()
+		for statement in statements:
+			result = self._statement_outcomes(statement, name)
+			outcomes |= result - {"open"}
+			if "open" not in result:
+				return outcomes
+		outcomes.add("open")
+		return outcomes
+
+	def _statement_outcomes(self, statement: ast.stmt, name: str) -> set[str]:
+		if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+			return {"open"}
+		if isinstance(statement, ast.Return):
+			if statement.value is not None and self._mentions(statement.value, name):
+				return {"escaped"}
+			return {"leaked"}
+		if isinstance(statement, ast.Raise):
+			return {"leaked"}
+		if isinstance(statement, ast.Break):
+			return {"break"}
+		if isinstance(statement, ast.Continue):
+			return {"continue"}
+		if isinstance(statement, ast.If):
+			return self._scan(statement.body, name) | self._scan(statement.orelse, name)
+		if isinstance(statement, (ast.For, ast.AsyncFor, ast.While)):
+			body = self._scan(statement.body, name)
+			outcomes = (body - self.LOOP_JUMPS - {"open"}) | self._scan(statement.orelse, name)
+			if "break" in body:
+				outcomes.add("open")   # break skips the else block
+			return outcomes
+		if isinstance(statement, (ast.With, ast.AsyncWith)):
+			return self._scan(statement.body, name)
+		if isinstance(statement, ast.Try) or type(statement).__name__ == "TryStar":
+			if statement.finalbody and self._scan(statement.finalbody, name) == {"closed"}:
+				return {"closed"}
+			outcomes = self._scan(statement.body + statement.orelse, name)
+			for handler in statement.handlers:
+				outcomes |= self._scan(handler.body, name)
+			if "open" in outcomes and statement.finalbody:
+				outcomes = (outcomes - {"open"}) | self._scan(statement.finalbody, name)
+			return outcomes
+		if type(statement).__name__ == "Match":
+			outcomes = {"open"}
+			for case in statement.cases:
+				outcomes |= self._scan(case.body, name)
+			return outcomes
+
+		for node in ast.walk(statement):
+			if isinstance(node, ast.Call):
+				if self._is_close_call(node) and isinstance(node.func.value, ast.Name) and node.func.value.id == name:
+					return {"closed"}
+				callee = node.func.attr if isinstance(node.func, ast.Attribute) else getattr(node.func, "id", "")
+				if "close" in callee.lower() and any(self._mentions(arg, name) for arg in node.args):
+					return {"escaped"}
+				helper_outcome = self._helper_outcome(node, callee, name)
+				if helper_outcome is not None:
+					return {helper_outcome}
+		if isinstance(statement, (ast.Assign, ast.AnnAssign)):
+			targets = statement.targets if isinstance(statement, ast.Assign) else [statement.target]
+			if any(isinstance(target, ast.Name) and target.id == name for target in targets):
+				return {"leaked"}
+		return {"open"}
+
+	def _helper_outcome(self, call: ast.Call, callee: str, name: str) -> str | None:
+		"""escaped if call hands the handle to a module function that closes it, closed if it
+		calls one that closes the handle it captures from the enclosing scope."""
+		for function in self._functions.get(callee, ()):
+			arguments = function.args
+			params = [arg.arg for arg in arguments.posonlyargs + arguments.args]
+			if isinstance(call.func, ast.Attribute) and params[:1] in (["self"], ["cls"]):
+				params = params[1:]
+			passed = [param for param, arg in zip(params, call.args) if isinstance(arg, ast.Name) and arg.id == name]
+			passed += [kw.arg for kw in call.keywords
+					   if kw.arg and isinstance(kw.value, ast.Name) and kw.value.id == name]
+			if any(self._closes(function, param) for param in passed):
+				return "escaped"
+			local_names = {arg.arg for arg in arguments.posonlyargs + arguments.args + arguments.kwonlyargs}
+			if name not in local_names and self._closes(function, name):
+				return "closed"
+		return None
+
+	def _closes(self, function: ast.AST, name: str) -> bool:
+		return any(isinstance(node, ast.Call) and self._is_close_call(node)
+				   and isinstance(node.func.value, ast.Name) and node.func.value.id == name
+				   for node in ast.walk(function))
+
+	@staticmethod
+	def _mentions(node: ast.AST, name: str) -> bool:
+		return any(isinstance(child, ast.Name) and child.id == name for child in ast.walk(node))
+
+def analyze_resource_handling(source: str) -> ResourceReport:
+	"""Pair every open() call in source with its close() or context manager."""
+	try:
+		tree = ast.parse(source)
+	except (SyntaxError, ValueError) as e:
+		report = ResourceReport()
+		report.parse_error = str(e)
+		for line_num, line in enumerate(source.split("\n"), start=1):
+			stripped = line.split("#", 1)[0]
+			if re.search(r"(?<![\w.])open\(", stripped):
+				report.unclosed_lines.append(line_num)
+			if ".close(" in stripped:
+				report.close_lines.append(line_num)
+		return report
+	return _ResourceFlowAnalyzer(tree).run()
+
+def _patience_anchors(a: list, b: list, a_lo: int, a_hi: int, b_lo: int, b_hi: int) -> list[tuple[int, int]]:
+	"""Longest increasing run of lines that occur exactly once in both ranges."""
+	a_counts: dict = {}
+	for i in range(a_lo, a_hi):
+		line = a[i]
+		a_counts[line] = (a_counts[line][0] + 1, i) if line in a_counts else (1, i)
+	b_counts: dict = {}
+	for j in range(b_lo, b_hi):
+		line = b[j]
+		b_counts[line] = (b_counts[line][0] + 1, j) if line in b_counts else (1, j)
+
+	pairs = []
+	for line, (count, i) in a_counts.items():
+		if count == 1:
+			match = b_counts.get(line)
+			if match is not None and match[0] == 1:
+				pairs.append((i, match[1]))
+	return _increasing_pairs(pairs)
+
+def _increasing_pairs(pairs: list[tuple[int, int]]) -> list[tuple[int, int]]:
+	"""Longest chain of (i, j) pairs increasing in both i and j."""
+	if not pairs:
+		return []
+	pairs.sort(key=lambda pair: (pair[0], -pair[1]))   # one pair per i survives the strict j order
+
+	tails: list[int] = []
+	tail_pairs: list[int] = []
+	previous = [-1] * len(pairs)
+	for pair_idx, (_, j) in enumerate(pairs):
+		position = bisect_left(tails, j)
+		if position > 0:
+			previous[pair_idx] = tail_pairs[position - 1]
+		if position == len(tails):
+			tails.append(j)
+			tail_pairs.append(pair_idx)
+		else:
+			tails[position] = j
+			tail_pairs[position] = pair_idx
+
+	anchors = []
+	pair_idx = tail_pairs[-1]
+	while pair_idx != -1:
+		anchors.append(pairs[pair_idx])
+		pair_idx = previous[pair_idx]
+	anchors.reverse()
+	return anchors
+
+HISTOGRAM_MAX_PAIRS = 65_536
+
+def _histogram_anchors(a: list, b: list, a_lo: int, a_hi: int, b_lo: int, b_hi: int) -> list[tuple[int, int]]:
+	"""Every occurrence of the rarest line shared by both ranges that can be matched in order.
+
+	The histogram of the range is built once and the range is split at all of these
+	anchors together, so repetitive input is cut into many small regions per pass
+	rather than one anchor at a time.
+	"""
+	a_positions: dict = {}
+	for i in range(a_lo, a_hi):
+		a_positions.setdefault(a[i], []).append(i)
+	b_positions: dict = {}
+	for j in range(b_lo, b_hi):
+		if b[j] in a_positions:
+			b_positions.setdefault(b[j], []).append(j)
+	if not b_positions:
+		return []
+
+	rarest = min(b_positions, key=lambda line: len(a_positions[line]) + len(b_positions[line]))
+	a_hits, b_hits = a_positions[rarest], b_positions[rarest]
+	# Pair occurrences whose neighbouring lines agree too, so a repeated line is matched
+	# where the surrounding text lines up rather than wherever the chain happens to be longest.
+	b_by_context: dict = {}
+	for j in b_hits:
+		b_by_context.setdefault((b[j - 1] if j > b_lo else None, b[j + 1] if j + 1 < b_hi else None), []).append(j)
+	a_contexts = [(i, (a[i - 1] if i > a_lo else None, a[i + 1] if i + 1 < a_hi else None)) for i in a_hits]
+	if sum(len(b_by_context.get(context, ())) for _, context in a_contexts) <= HISTOGRAM_MAX_PAIRS:
+		pairs = [(i, j) for i, context in a_contexts for j in b_by_context.get(context, ())]
+		if pairs:
+			return _increasing_pairs(pairs)
+	# Too many pairings to chain them all: pair each occurrence only with those of similar
+	# rank on the other side, keeping the candidates under HISTOGRAM_MAX_PAIRS.
+	window = max(1, HISTOGRAM_MAX_PAIRS // len(a_hits) // 2)
+	scale = len(b_hits) / len(a_hits)
+	pairs = []
+	for rank, i in enumerate(a_hits):
+		centre = int(rank * scale)
+		pairs.extend((i, j) for j in b_hits[max(0, centre - window):centre + window + 1])
+	return _increasing_pairs(pairs)
+
+def patience_diff_opcodes(a: list, b: list) -> list[tuple[str, int, int, int, int]]:
+	"""Line diff of a and b in difflib's get_opcodes() format, using patience anchors.
+
+	Regions without unique anchor lines are split at every matchable occurrence of their
+	rarest shared line (histogram style); only small leftovers go through SequenceMatcher,
+	so large files never diff quadratically.
+	"""
+	matches: list[tuple[int, int, int]] = []
+	stack = [(0, len(a), 0, len(b))]
+	while stack:
+		a_lo, a_hi, b_lo, b_hi = stack.pop()
+		while a_lo < a_hi and b_lo < b_hi and a[a_lo] == b[b_lo]:
+			matches.append((a_lo, b_lo, 1))
+			a_lo += 1
+			b_lo += 1
+		while a_lo < a_hi and b_lo < b_hi and a[a_hi - 1] == b[b_hi - 1]:
+			a_hi -= 1
+			b_hi -= 1
+			matches.append((a_hi, b_hi, 1))
+		if a_lo >= a_hi or b_lo >= b_hi:
+			continue
+
+		anchors = _patience_anchors(a, b, a_lo, a_hi, b_lo, b_hi)
+		if not anchors and (a_hi - a_lo) * (b_hi - b_lo) <= 40_000:
+			matcher = difflib.SequenceMatcher(None, a[a_lo:a_hi], b[b_lo:b_hi], autojunk=False)
+			for i, j, size in matcher.get_matching_blocks():
+				for offset in range(size):
+					matches.append((a_lo + i + offset, b_lo + j + offset, 1))
+			continue
+		if not anchors:
+			anchors = _histogram_anchors(a, b, a_lo, a_hi, b_lo, b_hi)
+		if anchors:
+			previous_i, previous_j = a_lo, b_lo
+			for i, j in anchors:
+				stack.append((previous_i, i, previous_j, j))
+				matches.append((i, j, 1))
+				previous_i, previous_j = i + 1, j + 1
+			stack.append((previous_i, a_hi, previous_j, b_hi))
+
+	matches.sort()
+	opcodes = []
+	i = j = 0
+	for match_i, match_j, _ in matches + [(len(a), len(b), 0)]:
+		if i < match_i and j < match_j:
+			opcodes.append(("replace", i, match_i, j, match_j))
+		elif i < match_i:
+			opcodes.append(("delete", i, match_i, j, j))
+		elif j < match_j:
+			opcodes.append(("insert", i, i, j, match_j))
+		if match_i < len(a) or match_j < len(b):
+			if opcodes and opcodes[-1][0] == "equal" and opcodes[-1][2] == match_i and opcodes[-1][4] == match_j:
+				tag, i1, _, j1, _ = opcodes[-1]
+				opcodes[-1] = ("equal", i1, match_i + 1, j1, match_j + 1)
+			else:
+				opcodes.append(("equal", match_i, match_i + 1, match_j, match_j + 1))
+		i, j = match_i + 1, match_j + 1
+	return opcodes
+
+EVENT_PROCESS_OUTPUT = "process_output"
+EVENT_PROCESS_EXIT = "process_exit"
+EVENT_FILE_CHANGED = "file_changed"
+EVENT_TASK_PROGRESS = "task_progress"
+EVENT_TASK_DONE = "task_done"
+
+class UIEvent(NamedTuple):
+	kind: str
+	payload: object = None
+	callback: object = None
+
+class UIDispatcher:
+	"""The one place where background threads hand work to the Tk main loop.
+
+	Workers call post() from any thread; the main loop drains the queue in bounded
+	batches each frame and passes every event to its callback or to the handlers
+	subscribed to its kind. Runs of coalescing events (such as process output) are
+	merged into one handler call.
+	"""
+
+	FRAME_MS = 16
+	BATCH_LIMIT = 500
+	TIME_BUDGET = 0.012
+
+	def __init__(self, root: tk.Tk) -> None:
+		self.root = root
+		self._queue: queue.SimpleQueue[UIEvent] = queue.SimpleQueue()
+		self._handlers: dict[str, list] = {}
+		self._coalescing: set[str] = set()
+		self._job = None
+
+	def subscribe(self, kind: str, handler, coalesce: bool = False) -> None:
+		self._handlers.setdefault(kind, []).append(handler)
+		if coalesce:
+			self._coalescing.add(kind)
+
+	def unsubscribe(self, kind: str, handler) -> None:
+		handlers = self._handlers.get(kind, [])
+		if handler in handlers:
+			handlers.remove(handler)
+
+	def post(self, kind: str, payload=None, callback=None) -> None:
+		"""Queue an event; safe to call from any thread."""
+		self._queue.put(UIEvent(kind, payload, callback))
+
+	def watch_future(self, future, callback) -> None:
+		"""Run callback(future) on the main loop once the future has finished."""
+		future.add_done_callback(lambda done: self.post(EVENT_TASK_DONE, done, callback))
+
+	def start(self) -> None:
+		if self._job is None:
+			self._job = self.root.after(self.FRAME_MS, self._drain)
+
+	def stop(self) -> None:
+		if self._job is not None:
+			self.root.after_cancel(self._job)
+			self._job = None
+
+	def _drain(self) -> None:
+		self._job = None
+		deadline = time.monotonic() + self.TIME_BUDGET
+		processed = 0
+		pending: UIEvent | None = None
+		while processed < self.BATCH_LIMIT and time.monotonic() < deadline:
+			try:
+				event = self._queue.get_nowait()
+			except queue.Empty:
+				break
+			processed += 1
+			if (pending is not None and event.kind == pending.kind and event.kind in self._coalescing
+					and event.callback is None and pending.callback is None):
+				pending = UIEvent(pending.kind, pending.payload + event.payload)
+				continue
+			if pending is not None:
+				self._dispatch(pending)
+			pending = event
+		if pending is not None:
+			self._dispatch(pending)
+
+		backlog = not self._queue.empty()
+		self._job = self.root.after(1 if backlog else self.FRAME_MS, self._drain)
+
+	def _dispatch(self, event: UIEvent) -> None:
+		targets = [event.callback] if event.callback is not None else list(self._handlers.get(event.kind, []))
+		for handler in targets:
+			try:
+				handler(event.payload)
+			except Exception as e:
+				print(f"Error handling {event.kind} event: {e}")
+
+class FileChange(NamedTuple):
+	change: str    # "created", "modified", "deleted" or "moved"
+	path: Path
+
+class FileWatcherService:
+	"""One long-lived watcher on the current submission folder and any pinned folders.
+
+	Uses watchdog's native observer (inotify on Linux) when watchdog is installed and
+	otherwise a single polling thread that backs off from MIN_POLL_INTERVAL to
+	MAX_POLL_INTERVAL while nothing changes. Changes are posted to the dispatcher as
+	EVENT_FILE_CHANGED events carrying a FileChange, so every panel subscribes there
+	instead of running its own observer or poll loop. A window showing one folder's files
+	pins that folder, so it keeps getting events after watch() moves to another submission.
+	"""
+
+	MIN_POLL_INTERVAL = 0.5
+	MAX_POLL_INTERVAL = 5.0
+	WATCHED_EVENTS = ("created", "modified", "deleted", "moved")
+
+	def __init__(self, dispatcher: UIDispatcher) -> None:
+		self.dispatcher = dispatcher
+		self.directory: Path | None = None
+		self._pinned: dict[Path, int] = {}         # folder -> number of windows pinning it
+		self._watched: frozenset[Path] = frozenset()   # replaced, never mutated, so the poll thread can read it
+		self._observer = None
+		self._watches: dict[Path, object] = {}
+		self._poll_thread: threading.Thread | None = None
+		self._wake = threading.Event()
+		self._stopped = False
+
+	def watch(self, directory: Path | None) -> None:
+		"""Switch the watched folder; None stops watching without stopping the service."""
+		if directory == self.directory or self._stopped:
+			return
+		self.directory = directory
+		self._update_watches()
+
+	def pin(self, directory: Path) -> None:
+		"""Keep watching directory, whatever watch() switches to, until a matching unpin()."""
+		self._pinned[directory] = self._pinned.get(directory, 0) + 1
+		self._update_watches()
+
+	def unpin(self, directory: Path) -> None:
+		count = self._pinned.pop(directory, 0) - 1
+		if count > 0:
+			self._pinned[directory] = count
+		self._update_watches()
+
+	def _update_watches(self) -> None:
+		if self._stopped:
+			return
+		watched = frozenset(directory for directory in (self.directory, *self._pinned) if directory is not None)
+		if watched == self._watched and (Observer is None or self._observer is not None):
+			return
+		self._watched = watched
+		
+		if Observer is None:
+			if self._poll_thread is None:
+				self._poll_thread = threading.Thread(target=self._poll_loop, name="file-watcher", daemon=True)
+				self._poll_thread.start()
+			self._wake.set()
+			return
+		
+		if self._observer is None:
+			self._observer = Observer()
+			self._observer.daemon = True
+			self._observer.start()
+		for directory in self._watches.keys() - watched:
+			self._observer.unschedule(self._watches.pop(directory))
+		for directory in watched - self._watches.keys():
+			if directory.is_dir():
+				try:
+					self._watches[directory] = self._observer.schedule(self, str(directory), recursive=False)
+				except OSError as e:
+					print(f"Failed to watch {directory}: {e}")
+
+	def stop(self) -> None:
+		self._stopped = True
+		self._wake.set()
+		if self._observer is not None:
+			self._observer.stop()
+			self._observer.join(timeout=1)
+
+	# Called on the observer thread (watchdog only needs a dispatch() method).
+	def dispatch(self, event) -> None:
+		if event.is_directory or event.event_type not in self.WATCHED_EVENTS:
+			return
+		self.dispatcher.post(EVENT_FILE_CHANGED, FileChange(event.event_type, Path(os.fsdecode(event.src_path))))
+		if event.event_type == "moved":
+			self.dispatcher.post(EVENT_FILE_CHANGED, FileChange("created", Path(os.fsdecode(event.dest_path))))
+
+	@staticmethod
+	def _scan(directory: Path | None) -> dict[str, tuple[int, int]]:
+		if directory is None:
+			return {}
+		snapshot = {}
+		try:
+			with os.scandir(directory) as entries:
+				for entry in entries:
+					if entry.is_file():
+						stat = entry.stat()
+						snapshot[entry.name] = (stat.st_mtime_ns, stat.st_size)
+		except OSError:
+			pass
+		return snapshot
+
+	def _poll_loop(self) -> None:
+		snapshots: dict[Path, dict[str, tuple[int, int]]] = {}
+		interval = self.MIN_POLL_INTERVAL
+		while not self._stopped:
+			watched = self._watched
+			if watched != snapshots.keys():
+				snapshots = {directory: snapshots.get(directory) or self._scan(directory) for directory in watched}
+				interval = self.MIN_POLL_INTERVAL
+			else:
+				changes = []
+				for directory, snapshot in snapshots.items():
+					current = self._scan(directory)
+					changes.extend(FileChange("deleted", directory / name) for name in snapshot.keys() - current.keys())
+					for name, signature in current.items():
+						if name not in snapshot:
+							changes.append(FileChange("created", directory / name))
+						elif snapshot[name] != signature:
+							changes.append(FileChange("modified", directory / name))
+					snapshots[directory] = current
+				for change in changes:
+					self.dispatcher.post(EVENT_FILE_CHANGED, change)
+				interval = self.MIN_POLL_INTERVAL if changes else min(interval * 1.5, self.MAX_POLL_INTERVAL)
+			self._wake.wait(interval)
+			self._wake.clear()
+
+DATA_FILE_KEYS = {
+	"students.txt": (0,),      # student ID
+	"courses.txt": (0,),       # course code
+	"passed.txt": (0, 1),      # course code + student ID
+}
+
+DIFF_STATUS_TAGS = {"added": "extra_line", "modified": "modified_line"}
+
+class RecordDiff:
+	"""Added, removed and changed records between a base data file and its current copy."""
+
+	def __init__(self, line_count: int = 0) -> None:
+		self.line_status: list[str | None] = [None] * line_count
+		self.changed_fields: dict[int, list[int]] = {}
+		self.removed: list[tuple[int, str]] = []     # (base line number, content)
+		self.modified: list[tuple[int, str]] = []    # (current line number, original content)
+
+	@property
+	def added_count(self) -> int:
+		return self.line_status.count("added")
+
+	@property
+	def modified_count(self) -> int:
+		return self.line_status.count("modified")
+
+	def status_tags(self) -> list[str | None]:
+		return [DIFF_STATUS_TAGS.get(status) for status in self.line_status]
+
+def detect_delimiter(lines: list[str]) -> str:
+	first_line = lines[0] if lines else ""
+	return ',' if ',' in first_line else '\t'
+
+def diff_data_records(file_name: str, base_lines: list[str] | None, lines: list[str]) -> RecordDiff:
+	"""Diff a data file against its base copy by record key rather than by position.
+
+	Rows are matched on their primary key (student ID, course code, or course + student
+	for passed.txt), so reordering a file shows no changes and an edited row is reported
+	as modified with the changed field indices. Files without a known key fall back to
+	the patience line diff.
+	"""
+	result = RecordDiff(len(lines))
+	if base_lines is None:
+		return result
+
+	key_columns = DATA_FILE_KEYS.get(file_name)
+	if key_columns is None:
+		for tag, i1, i2, j1, j2 in patience_diff_opcodes([line.strip() for line in base_lines],
+														 [line.strip() for line in lines]):
+			if tag == "replace":
+				for offset, j in enumerate(range(j1, j2)):
+					result.line_status[j] = "modified"
+					if i1 + offset < i2:
+						result.modified.append((j + 1, base_lines[i1 + offset]))
+				result.removed.extend((i + 1, base_lines[i]) for i in range(i1 + j2 - j1, i2))
+			elif tag == "insert":
+				for j in range(j1, j2):
+					result.line_status[j] = "added"
+			elif tag == "delete":
+				result.removed.extend((i + 1, base_lines[i]) for i in range(i1, i2))
+		return result
+
+	delimiter = detect_delimiter(base_lines or lines)
+
+	def split_fields(line: str) -> list[str]:
+		return [field.strip() for field in line.strip().split(delimiter)]
+
+	def record_key(fields: list[str]) -> tuple:
+		return tuple(fields[column] if column < len(fields) else None for column in key_columns)
+
+	base_index: dict[tuple, deque] = {}
+	for base_idx, base_line in enumerate(base_lines):
+		fields = split_fields(base_line)
+		base_index.setdefault(record_key(fields), deque()).append((base_idx, fields))
+
+	# Rows sharing a key (retakes in passed.txt) pair up with an identical row first, so
+	# reordering them is not a change; the rest are matched first in, first out.
+	unmatched = []
+	for line_idx, line in enumerate(lines):
+		fields = split_fields(line)
+		candidates = base_index.get(record_key(fields))
+		if not candidates:
+			result.line_status[line_idx] = "added"
+			continue
+		exact = next((position for position, (_, base_fields) in enumerate(candidates) if base_fields == fields), None)
+		if exact is not None:
+			del candidates[exact]
+		else:
+			unmatched.append((line_idx, fields, candidates))
+
+	for line_idx, fields, candidates in unmatched:
+		if not candidates:
+			result.line_status[line_idx] = "added"
+			continue
+		base_idx, base_fields = candidates.popleft()
+		result.line_status[line_idx] = "modified"
+		result.modified.append((line_idx + 1, base_lines[base_idx]))
+		result.changed_fields[line_idx] = [
+			column for column in range(max(len(fields), len(base_fields)))
+			if column >= len(fields) or column >= len(base_fields) or fields[column] != base_fields[column]
+		]
+
+	result.removed = sorted((base_idx + 1, base_lines[base_idx])
+							for candidates in base_index.values() for base_idx, _ in candidates)
+	return result
+
+class DataIssue(NamedTuple):
+	line: int                 # 0-based row index
+	columns: tuple[int, ...]  # empty when the whole row is at fault
+	message: str
+	checklist: int | None
+
+class FieldRule(NamedTuple):
+	column: int
+	label: str
+	pattern: str
+	checklist: int | None
+	check: object = None      # optional callable(value) -> (message, checklist) or None
+
+def _check_starting_year(value: str):
+	if not 2000 <= int(value) <= date.today().year:
+		return (f"starting year {value} out of range", 8)
+	return None
+
+def _check_date_passed(value: str):
+	try:
+		passed = date.fromisoformat(value)
+	except ValueError:
+		return (f"invalid date '{value}'", 18)
+	if passed > date.today():
+		return (f"date {value} is in the future", 19)
+	return None
+
+NAME_PATTERN = r"[A-Z][A-Za-z]*"
+COURSE_CODE_PATTERN = r"[A-Z]\d{4}"
+STUDENT_ID_PATTERN = r"\d{5}"
+
+# Field rules follow the checklist in predefined_inputs.json; the numbers are the checklist items.
+DATA_FILE_SCHEMAS = {
+	"students.txt": {
+		"columns": (7, 7),
+		"fields": (
+			FieldRule(0, "student ID", STUDENT_ID_PATTERN, 7),
+			FieldRule(1, "last name", NAME_PATTERN, 5),
+			FieldRule(2, "first name", NAME_PATTERN, 5),
+			FieldRule(3, "middle name", f"(?:{NAME_PATTERN})?", 5),
+			FieldRule(4, "email", r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", 6),
+			FieldRule(5, "starting year", r"\d{4}", 8, _check_starting_year),
+			FieldRule(6, "major", r"[A-Z]{2}", 9),
+		),
+		"unique": ((0,), "student ID", 7),
+	},
+	"courses.txt": {
+		"columns": (4, None),
+		"fields": (
+			FieldRule(0, "course code", COURSE_CODE_PATTERN, None),
+			FieldRule(1, "course name", r"\S.*", None),
+			FieldRule(2, "credits", r"\d+", None),
+			FieldRule(3, "teacher", r"\S.*", None),
+		),
+		"unique": ((0,), "course code", None),
+	},
+	"passed.txt": {
+		"columns": (4, 4),
+		"fields": (
+			FieldRule(0, "course code", COURSE_CODE_PATTERN, 13),
+			FieldRule(1, "student ID", STUDENT_ID_PATTERN, 13),
+			FieldRule(2, "date", r"\d{4}-\d{2}-\d{2}", 18, _check_date_passed),
+			FieldRule(3, "grade", r"[1-5]", 17),
+		),
+		"unique": ((0, 1), "course and student", 15),
+		"references": {0: "courses.txt", 1: "students.txt"},
+	},
+}
+
+VALIDATED_CHECKLISTS = (5, 6, 7, 8, 9, 10, 13, 15, 17, 18, 19)
+
+class DataFileValidator:
+	"""Compiled form of one DATA_FILE_SCHEMAS entry.
+
+	Field patterns are compiled once and per-row results are cached by row text, so
+	revalidating a file after a live edit only re-checks the rows that changed. The
+	uniqueness and cross-file reference checks use hash indexes built in one pass.
+	"""
+
+	ROW_CACHE_LIMIT = 200_000
+
+	def __init__(self, file_name: str, schema: dict) -> None:
+		self.file_name = file_name
+		self.min_columns, self.max_columns = schema["columns"]
+		self.fields = [(rule, re.compile(rule.pattern).fullmatch) for rule in schema["fields"]]
+		self.unique = schema.get("unique")
+		self.references = schema.get("references", {})
+		self.labels = {rule.column: rule.label for rule in schema["fields"]}
+		self._row_cache: dict[tuple[str, str], tuple] = {}
+
+	def _check_row(self, line: str, delimiter: str) -> tuple:
+		cache_key = (delimiter, line)
+		cached = self._row_cache.get(cache_key)
+		if cached is not None:
+			return cached
+		
+		issues = []
+		if not line.strip():
+			issues.append(((), "empty line", 10))
+		else:
+			fields = line.split(delimiter)
+			if len(fields) < self.min_columns or (self.max_columns and len(fields) > self.max_columns):
+				expected = self.min_columns if self.min_columns == self.max_columns else f"at least {self.min_columns}"
+				issues.append(((), f"expected {expected} fields, found {len(fields)}", 10))
+			for rule, matches in self.fields:
+				if rule.column >= len(fields):
+					continue
+				value = fields[rule.column]
+				if not matches(value):
+					issues.append(((rule.column,), f"invalid {rule.label} '{value}'", rule.checklist))
+				elif rule.check:
+					problem = rule.check(value)
+					if problem:
+						issues.append(((rule.column,), *problem))
+		
+		result = tuple(issues)
+		if len(self._row_cache) >= self.ROW_CACHE_LIMIT:
+			self._row_cache.clear()
+		self._row_cache[cache_key] = result
+		return result
+
+	def validate(self, lines: list[str], delimiter: str | None = None,
+				 reference_keys: dict[str, set[str]] | None = None) -> list[DataIssue]:
+		delimiter = delimiter or detect_delimiter(lines)
+		issues: list[DataIssue] = []
+		seen: dict[tuple, int] = {}
+		for line_idx, line in enumerate(lines):
+			for columns, message, checklist in self._check_row(line, delimiter):
+				issues.append(DataIssue(line_idx, columns, message, checklist))
+			if not line.strip():
+				continue
+			fields = line.split(delimiter)
+			
+			if self.unique:
+				key_columns, label, checklist = self.unique
+				key = tuple(fields[column].strip() if column < len(fields) else "" for column in key_columns)
+				first_idx = seen.setdefault(key, line_idx)
+				if first_idx != line_idx:
+					issues.append(DataIssue(line_idx, key_columns,
+											f"duplicate {label} {'/'.join(key)} (first on line {first_idx + 1})", checklist))
+			
+			if reference_keys:
+				for column, referenced_file in self.references.items():
+					known = reference_keys.get(referenced_file)
+					if known is not None and column < len(fields) and fields[column].strip() not in known:
+						issues.append(DataIssue(line_idx, (column,),
+												f"{self.labels.get(column, 'value')} {fields[column]} not in {referenced_file}", 13))
+		return issues
+
+@lru_cache(maxsize=None)
+def get_data_validator(file_name: str) -> DataFileValidator | None:
+	schema = DATA_FILE_SCHEMAS.get(file_name)
+	return DataFileValidator(file_name, schema) if schema else None
+
+def data_file_keys(lines: list[str]) -> set[str]:
+	delimiter = detect_delimiter(lines)
+	return {line.split(delimiter, 1)[0].strip() for line in lines if line.strip()}
+
+def validate_submission_data(folder: Path) -> dict[str, list[DataIssue]]:
+	"""Validate every schema-covered data file in a submission folder (missing files are skipped)."""
+	lines_by_file = {}
+	for file_name in DATA_FILE_SCHEMAS:
+		try:
+			lines_by_file[file_name] = (folder / file_name).read_text(encoding="utf-8").strip().split('\n')
+		except (OSError, UnicodeDecodeError):
+			continue
+	reference_keys = {file_name: data_file_keys(lines) for file_name, lines in lines_by_file.items()}
+	return {file_name: get_data_validator(file_name).validate(lines, reference_keys=reference_keys)
+			for file_name, lines in lines_by_file.items()}
+
+class FuzzField(NamedTuple):
+	label: str
+	grammar: str        # key of FUZZ_CLASSES
+	valid: str          # value the program accepts; fills the other prompts and the control run
+	column: int         # column the value ends up in, in the scenario's data file
+	checklist: int
+
+class FuzzScenario(NamedTuple):
+	menu_option: str
+	data_file: str
+	fields: tuple[FuzzField, ...]   # in prompt order
+	exit_input: str = "0"
+
+class FuzzCase(NamedTuple):
+	scenario: FuzzScenario
+	field: FuzzField
+	input_class: str    # FUZZ_CONTROL_CLASS for the run with only valid inputs
+	value: str
+
+	def inputs(self) -> list[str]:
+		values = [self.value if field is self.field else field.valid for field in self.scenario.fields]
+		return [self.scenario.menu_option, *values, self.scenario.exit_input]
+
+class FuzzOutcome(NamedTuple):
+	case: FuzzCase
+	result: str         # "accepted", "rejected", "crashed" or "timeout"
+
+FUZZ_CONTROL_CLASS = "control"
+
+FUZZ_RULES = {
+	"<upper>": tuple("ABCDEFGHIJKLMNOPQRSTUVWXYZ"),
+	"<lower>": tuple("abcdefghijklmnopqrstuvwxyz"),
+	"<digit>": tuple("0123456789"),
+	"<nonzero>": tuple("123456789"),
+	"<symbol>": tuple("!@#$%&*_-.'/+?"),
+	"<lowers>": ("<lower>", "<lower><lowers>", "<lower><lower><lowers>"),
+	"<word>": ("<upper><lowers>",),
+	"<year>": ("201<digit>", "202<nonzero>"),
+	"<month>": ("0<nonzero>", "10", "11", "12"),
+	"<day>": ("0<nonzero>", "1<digit>", "2<nonzero>"),
+}
+
+# Classes of invalid input per kind of prompt; "<valid>" expands to the field's valid value.
+FUZZ_CLASSES = {
+	"name": {
+		"contains a digit": ("<word><digit><lowers>", "<upper><digit><lowers>", "<word><digit>"),
+		"contains a symbol": ("<word><symbol>", "<word><symbol><lowers>", "<symbol><word>"),
+		"lowercase first letter": ("<lower><lowers>",),
+		"contains a space": ("<word> <word>", "<word> <lower>"),
+		"digits only": ("<digit><digit><digit>",),
+		"empty": ("",),
+	},
+	"middle_name": {
+		"contains a digit": ("<word><digit><lowers>", "<upper><digit><lowers>"),
+		"contains a symbol": ("<word><symbol>", "<word><symbol><lowers>"),
+		"lowercase first letter": ("<lower><lowers>",),
+	},
+	"major": {
+		"lowercase": ("<lower><lower>", "<upper><lower>", "<lower><upper>"),
+		"contains a digit": ("<upper><digit>", "<digit><upper><upper>", "<upper><upper><digit>"),
+		"contains a symbol": ("<upper><upper><symbol>", "<symbol><upper><upper>"),
+		"wrong length": ("<upper>", "<upper><upper><upper>", "<word> <word>"),
+		"code with description": ("<valid>: <word> <word>",),
+		"unknown code": ("XY", "QZ", "ZZ", "XQ"),
+		"empty": ("",),
+	},
+	"course_code": {
+		"unknown code": ("X<digit><digit><digit><digit>", "Z<digit><digit><digit><digit>"),
+		"lowercase letter": ("<lower><digit><digit><digit><digit>",),
+		"wrong length": ("<upper><digit><digit><digit>", "<upper><digit><digit><digit><digit><digit>"),
+		"letters only": ("<upper><upper><upper><upper><upper>",),
+		"empty": ("",),
+	},
+	"student_id": {
+		"too short": ("<digit><digit><digit><digit>",),
+		"too long": ("<nonzero><digit><digit><digit><digit><digit>",),
+		"leading zero": ("0<valid>",),
+		"negative": ("-<valid>",),
+		"letters": ("<lower><lower><lower><lower><lower>", "<valid><lower>"),
+		"unknown ID": ("9999<digit>", "0000<digit>"),
+		"empty": ("",),
+	},
+	"grade": {
+		"out of range": ("0", "6", "<nonzero><digit>", "-<nonzero>"),
+		"leading zero": ("0<valid>",),
+		"decimal": ("<valid>.5", "<valid>.0"),
+		"letters": ("<lower>", "<upper>"),
+		"empty": ("",),
+	},
+	"date": {
+		"day first": ("<day>-<month>-<year>",),
+		"month first": ("<month>-<day>-<year>",),
+		"other separator": ("<year>.<month>.<day>", "<year>/<month>/<day>", "<year><month><day>"),
+		"impossible day": ("<year>-<month>-32", "<year>-02-30", "<year>-04-31", "<year>-<month>-00"),
+		"impossible month": ("<year>-13-<day>", "<year>-00-<day>"),
+		"future date": ("2099-<month>-<day>",),
+		"empty": ("",),
+	},
+}
+
+def fuzz_scenarios() -> tuple[FuzzScenario, ...]:
+	"""Menu paths of the project that write a data file, with one known-good value per prompt."""
+	return (
+		FuzzScenario("1", "students.txt", (
+			FuzzField("first name", "name", "Tom", 2, 5),
+			FuzzField("last name", "name", "Holland", 1, 5),
+			FuzzField("middle name", "middle_name", "Eric", 3, 5),
+			FuzzField("major", "major", "ME", 6, 9),
+		)),
+		FuzzScenario("4", "passed.txt", (
+			FuzzField("course code", "course_code", "A0120", 0, 13),
+			FuzzField("student ID", "student_id", "95378", 1, 13),
+			FuzzField("grade", "grade", "3", 3, 17),
+			FuzzField("date", "date", date.today().isoformat(), 2, 18),
+		)),
+	)
+
+FUZZ_SYMBOL_PATTERN = re.compile(r"<[a-z_]+>")
+
+def expand_fuzz_grammar(template: str, rng: random.Random, valid: str, depth: int = 0) -> str:
+	"""Expand every <symbol> in template; past depth 8 the first (shortest) alternative is taken."""
+	def expand(match: re.Match) -> str:
+		symbol = match.group(0)
+		if symbol == "<valid>":
+			return valid
+		alternatives = FUZZ_RULES[symbol]
+		choice = alternatives[0] if depth >= 8 else rng.choice(alternatives)
+		return expand_fuzz_grammar(choice, rng, valid, depth + 1)
+	return FUZZ_SYMBOL_PATTERN.sub(expand, template)
+
+def generate_fuzz_cases(scenarios: tuple[FuzzScenario, ...], cases_per_class: int = 20, seed: int = 0) -> list[FuzzCase]:
+	"""One control case per field plus up to cases_per_class distinct values per input class."""
+	rng = random.Random(seed)
+	cases = []
+	for scenario in scenarios:
+		for field in scenario.fields:
+			cases.append(FuzzCase(scenario, field, FUZZ_CONTROL_CLASS, field.valid))
+			for input_class, templates in FUZZ_CLASSES[field.grammar].items():
+				values: dict[str, None] = {}
+				for _ in range(cases_per_class * 4):
+					if len(values) >= cases_per_class:
+						break
+					value = expand_fuzz_grammar(rng.choice(templates), rng, field.valid)
+					if value != field.valid:
+						values[value] = None
+				cases.extend(FuzzCase(scenario, field, input_class, value) for value in values)
+	return cases
+
+def run_fuzz_case(case: FuzzCase, script_path: Path, data_dir: Path, python_executable: str, timeout: float = 10.0) -> FuzzOutcome:
+	"""Run the submission once in a throwaway copy of its folder and see where the value ended up.
+
+	The value counts as accepted when a row that is not in the stored data file has it in
+	the field's column, and as crashed when the program died on something other than
+	running out of input.
+	"""
+	with tempfile.TemporaryDirectory(prefix="fuzz-") as workspace:
+		workspace_path = Path(workspace)
+		for source in script_path.parent.glob("*.py"):
+			shutil.copy(source, workspace_path / source.name)
+		for data_file in data_dir.glob("*.txt"):
+			shutil.copy(data_file, workspace_path / data_file.name)
+		
+		env = os.environ.copy()
+		env['PYTHONUNBUFFERED'] = '1'
+		env['PYTHONIOENCODING'] = 'utf-8'
+		try:
+			completed = subprocess.run(
+				[python_executable, '-u', script_path.name],
+				cwd=workspace, input="\n".join(case.inputs()) + "\n", capture_output=True,
+				text=True, encoding='utf-8', errors='replace', timeout=timeout, env=env,
+				creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0)
+		except subprocess.TimeoutExpired:
+			completed = None
+		
+		try:
+			base_lines = set((data_dir / case.scenario.data_file).read_text(encoding="utf-8").splitlines())
+		except OSError:
+			base_lines = set()
+		try:
+			lines = (workspace_path / case.scenario.data_file).read_text(encoding="utf-8", errors="replace").splitlines()
+		except OSError:
+			lines = []
+	
+	new_rows = [line for line in lines if line.strip() and line not in base_lines]
+	delimiter = detect_delimiter(new_rows) if new_rows else ","
+	for line in new_rows:
+		fields = line.split(delimiter)
+		if case.field.column < len(fields) and fields[case.field.column].strip() == case.value.strip():
+			return FuzzOutcome(case, "accepted")
+	if completed is None:
+		return FuzzOutcome(case, "timeout")
+	output = completed.stdout + completed.stderr
+	if completed.returncode != 0 and "Traceback" in output and "EOFError" not in output:
+		return FuzzOutcome(case, "crashed")
+	return FuzzOutcome(case, "rejected")
+
+def format_fuzz_report(outcomes: list[FuzzOutcome]) -> str:
+	"""Per field: which invalid input classes got into the data file, with examples."""
+	grouped: dict[tuple[str, str], dict[str, list[FuzzOutcome]]] = {}
+	for outcome in outcomes:
+		key = (outcome.case.scenario.data_file, outcome.case.field.label)
+		grouped.setdefault(key, {}).setdefault(outcome.case.input_class, []).append(outcome)
+	
+	lines = []
+	holes = 0
+	for (data_file, label), by_class in grouped.items():
+		field = next(iter(by_class.values()))[0].case.field
+		lines.append(f"{label} ({data_file}, Checklist {field.checklist})")
+		control = by_class.pop(FUZZ_CONTROL_CLASS, [])
+		if not any(outcome.result == "accepted" for outcome in control):
+			lines.append(f"  ! control value {field.valid!r} was not saved either; results below are unreliable")
+		for input_class, class_outcomes in by_class.items():
+			counts = Counter(outcome.result for outcome in class_outcomes)
+			accepted = [outcome.case.value for outcome in class_outcomes if outcome.result == "accepted"]
+			crashed = [outcome.case.value for outcome in class_outcomes if outcome.result == "crashed"]
+			if accepted or crashed:
+				holes += 1
+			mark = "✗" if accepted or crashed else "✓"
+			summary = ", ".join(f"{count} {result}" for result, count in sorted(counts.items()))
+			lines.append(f"  {mark} {input_class:<24} {summary}")
+			if accepted:
+				lines.append(f"      accepted: {', '.join(repr(value) for value in accepted[:5])}")
+			if crashed:
+				lines.append(f"      crashed:  {', '.join(repr(value) for value in crashed[:5])}")
+		lines.append("")
+	lines.insert(0, f"{len(outcomes)} runs, {holes} input class(es) accepted or crashing\n")
+	return "\n".join(lines)
+
+SUBMISSION_FOLDER_PATTERN = re.compile(r"(\d+)\s*-\s*(.+)")
+
+def find_submission_folders(course_dir: Path) -> list[Path]:
+	"""The "N - Name" folders created by Extract Submissions, in submission order."""
+	folders = []
+	try:
+		for item in course_dir.iterdir():
+			match = SUBMISSION_FOLDER_PATTERN.match(item.name)
+			if match and item.is_dir():
+				folders.append((int(match.group(1)), item))
+	except OSError:
+		return []
+	return [folder for _, folder in sorted(folders)]
+
+FEEDBACK_SEPARATOR_PATTERN = re.compile(r"^={5,}[ \t]*$", re.MULTILINE)
+FEEDBACK_FIELD_PATTERN = re.compile(r"^[ \t]*(Points|Grade)[ \t]*:[ \t]*(.*?)[ \t]*$", re.IGNORECASE | re.MULTILINE)
+GRADEBOOK_COLUMNS = ("number", "student", "folder", "points", "grade", "feedback_saved", "feedback_modified", "comments")
+
+class FeedbackSummary(NamedTuple):
+	points: float | None
+	grade: str | None
+	comments: str
+
+def _feedback_fields(lines: list[str]) -> tuple[dict[str, str], set[int]]:
+	"""Points/Grade values in lines and the indices of the lines they were read from.
+
+	Fields may share a line ("Points: 85 | Grade: 4", as Copy Points & Grade writes them),
+	and a label left empty takes the first non-empty line after it, which is where a value
+	typed under the template's "Points:" / "Grade:" ends up.
+	"""
+	fields: dict[str, str] = {}
+	used: set[int] = set()
+	pending: list[str] = []
+	for index, line in enumerate(lines):
+		labels = [match for match in map(FEEDBACK_FIELD_PATTERN.match, line.split("|")) if match]
+		if labels:
+			used.add(index)
+			pending = []
+			for match in labels:
+				if match.group(2):
+					fields[match.group(1).lower()] = match.group(2)
+				else:
+					pending.append(match.group(1).lower())
+		elif pending and line.strip():
+			used.add(index)
+			for name in pending:
+				fields[name] = line.strip()
+			pending = []
+	return fields, used
+
+def parse_feedback(content: str) -> FeedbackSummary:
+	"""Split a FEEDBACK.txt written from feedback_template.txt into comments, Points and Grade."""
+	separator = FEEDBACK_SEPARATOR_PATTERN.search(content)
+	if separator:
+		comments = content[:separator.start()]
+		fields, _ = _feedback_fields(content[separator.end():].split("\n"))
+	else:
+		lines = content.split("\n")
+		fields, used = _feedback_fields(lines)
+		comments = "\n".join(line for index, line in enumerate(lines) if index not in used)
+	points_match = re.match(r"[-+]?\d+(?:[.,]\d+)?", fields.get("points", ""))
+	points = float(points_match.group(0).replace(",", ".")) if points_match else None
+	return FeedbackSummary(points, fields.get("grade") or None, comments.strip())
+
+def _gradebook_entry(folder: Path, cached: dict | None) -> tuple[dict, bool]:
+	"""Index entry ({"signature", "row"}) for one submission folder and whether FEEDBACK.txt was re-read."""
+	match = SUBMISSION_FOLDER_PATTERN.match(folder.name)
+	feedback_file = folder / "FEEDBACK.txt"
+	try:
+		stat = feedback_file.stat()
+		signature = [stat.st_mtime_ns, stat.st_size]
+	except OSError:
+		stat, signature = None, None
+	if cached is not None and cached.get("signature") == signature:
+		return cached, False
+	
+	row = {"number": int(match.group(1)), "student": match.group(2).strip(), "folder": folder.name,
+		   "points": None, "grade": None, "feedback_saved": stat is not None, "feedback_modified": None, "comments": ""}
+	if stat is not None:
+		try:
+			summary = parse_feedback(feedback_file.read_text(encoding="utf-8", errors="replace"))
+			row.update(points=summary.points, grade=summary.grade, comments=summary.comments,
+					   feedback_modified=time.strftime("%Y-%m-%d %H:%M", time.localtime(stat.st_mtime)))
+		except OSError as e:
+			print(f"Failed to read {feedback_file}: {e}")
+	return {"signature": signature, "row": row}, True
+
+def collect_gradebook(course_dir: Path, index_path: Path, max_workers: int = 8) -> tuple[list[dict], int]:
+	"""Gradebook rows for every submission folder in course_dir, read in parallel.
+
+	index_path is a sidecar JSON file mapping folder names to the FEEDBACK.txt
+	(mtime, size) signature and parsed row from the previous export, so re-exporting
+	only re-reads feedback that changed. Returns the rows and the number re-read.
+	"""
+	try:
+		index = json.loads(index_path.read_text(encoding="utf-8"))
+	except (OSError, ValueError):
+		index = {}
+	
+	folders = find_submission_folders(course_dir)
+	with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="gradebook") as pool:
+		results = list(pool.map(lambda folder: _gradebook_entry(folder, index.get(folder.name)), folders))
+	
+	if any(reread for _, reread in results) or len(index) != len(results):
+		try:
+			index_path.parent.mkdir(parents=True, exist_ok=True)
+			atomic_write_text(index_path, json.dumps({folder.name: entry for folder, (entry, _) in zip(folders, results)}))
+		except OSError as e:
+			print(f"Failed to save gradebook index: {e}")
+	return [entry["row"] for entry, _ in results], sum(1 for _, reread in results if reread)
+
+def write_gradebook(rows: list[dict], output_path: Path) -> None:
+	"""Write the gradebook as SQLite for a .db/.sqlite path, otherwise as CSV."""
+	if output_path.suffix.lower() in (".db", ".sqlite", ".sqlite3"):
+		with sqlite3.connect(output_path) as connection:
+			connection.execute(
+				"CREATE TABLE IF NOT EXISTS gradebook (number INTEGER, student TEXT, folder TEXT PRIMARY KEY, "
+				"points REAL, grade TEXT, feedback_saved INTEGER, feedback_modified TEXT, comments TEXT)")
+			connection.execute("DELETE FROM gradebook")
+			connection.executemany(
+				f"INSERT INTO gradebook ({', '.join(GRADEBOOK_COLUMNS)}) VALUES ({', '.join('?' * len(GRADEBOOK_COLUMNS))})",
+				[tuple(row[column] for column in GRADEBOOK_COLUMNS) for row in rows])
+		connection.close()
+		return
+	
+	csv_file = io.StringIO()
+	writer = csv.writer(csv_file)
+	writer.writerow(["Number", "Student", "Folder", "Points", "Grade", "Feedback Saved", "Feedback Modified", "Comments"])
+	for row in rows:
+		points = row["points"]
+		writer.writerow([row["number"], row["student"], row["folder"],
+						 "" if points is None else f"{points:g}", row["grade"] or "",
+						 "yes" if row["feedback_saved"] else "no", row["feedback_modified"] or "", row["comments"]])
+	atomic_write_text(output_path, csv_file.getvalue(), encoding="utf-8-sig")
+
+class GradingState(NamedTuple):
+	points: float
+	grade: str | None
+	history: list[tuple[int, str]]   # (adjustment, checklist label), oldest first
+	updated_at: str
+	suite: str | None = None
+
+class RunSummary(NamedTuple):
+	exit_code: int | None
+	stopped: bool
+	run_at: str
+	stopped_runs: int
+	suite: str | None = None
+
+	@property
+	def status(self) -> str:
+		if self.stopped:
+			return "stopped"
+		return "ok" if self.exit_code == 0 else f"exit {self.exit_code}"
+
+class GradingStateStore:
+	"""SQLite record of points, grade and adjustment history per submission folder.
+
+	Every change is committed immediately, so switching between students or restarting
+	the app restores exactly where grading left off. Points and runs also record the test
+	suite that was active.
+	"""
+
+	SCHEMA = """
+		CREATE TABLE IF NOT EXISTS submissions (
+			folder TEXT PRIMARY KEY,
+			points REAL NOT NULL,
+			grade TEXT,
+			suite TEXT,
+			created_at TEXT NOT NULL,
+			updated_at TEXT NOT NULL
+		);
+		CREATE TABLE IF NOT EXISTS adjustments (
+			id INTEGER PRIMARY KEY AUTOINCREMENT,
+			folder TEXT NOT NULL,
+			adjustment REAL NOT NULL,
+			checklist TEXT,
+			points_after REAL NOT NULL,
+			created_at TEXT NOT NULL
+		);
+		CREATE TABLE IF NOT EXISTS runs (
+			id INTEGER PRIMARY KEY AUTOINCREMENT,
+			folder TEXT NOT NULL,
+			file TEXT,
+			exit_code INTEGER,
+			stopped INTEGER NOT NULL DEFAULT 0,
+			duration REAL,
+			suite TEXT,
+			created_at TEXT NOT NULL
+		);
+		CREATE INDEX IF NOT EXISTS adjustments_by_folder ON adjustments (folder, id);
+		CREATE INDEX IF NOT EXISTS submissions_by_update ON submissions (updated_at);
+		CREATE INDEX IF NOT EXISTS runs_by_folder ON runs (folder, id);
+	"""
+
+	def __init__(self, db_path: Path) -> None:
+		self.connection = sqlite3.connect(db_path, check_same_thread=False)
+		self.connection.execute("PRAGMA journal_mode=WAL")
+		self.connection.execute("PRAGMA synchronous=NORMAL")
+		self.connection.executescript(self.SCHEMA)
+		for table in ("submissions", "runs"):
+			columns = {row[1] for row in self.connection.execute(f"PRAGMA table_info({table})")}
+			if "suite" not in columns:
+				self.connection.execute(f"ALTER TABLE {table} ADD COLUMN suite TEXT")
+		self._lock = threading.Lock()
+
+	@staticmethod
+	def folder_key(folder: Path) -> str:
+		return str(folder.resolve())
+
+	@staticmethod
+	def _now() -> str:
+		return time.strftime("%Y-%m-%d %H:%M:%S")
+
+	def load(self, folder: Path) -> GradingState | None:
+		key = self.folder_key(folder)
+		with self._lock:
+			row = self.connection.execute(
+				"SELECT points, grade, updated_at, suite FROM submissions WHERE folder = ?", (key,)).fetchone()
+			if row is None:
+				return None
+			history = self.connection.execute(
+				"SELECT adjustment, checklist FROM adjustments WHERE folder = ? ORDER BY id", (key,)).fetchall()
+		return GradingState(row[0], row[1], [(int(adjustment), checklist) for adjustment, checklist in history], row[2], row[3])
+
+	def load_all(self) -> dict[str, GradingState]:
+		"""Points and grade of every stored folder (history left empty), keyed by resolved path."""
+		with self._lock:
+			rows = self.connection.execute("SELECT folder, points, grade, updated_at, suite FROM submissions").fetchall()
+		return {folder: GradingState(points, grade, [], updated_at, suite) for folder, points, grade, updated_at, suite in rows}
+
+	def save_points(self, folder: Path, points: float, grade: str | None,
+					adjustment: int | None = None, checklist: str | None = None, suite: str | None = None) -> None:
+		key = self.folder_key(folder)
+		now = self._now()
+		with self._lock, self.connection:
+			self.connection.execute(
+				"INSERT INTO submissions (folder, points, grade, suite, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?) "
+				"ON CONFLICT(folder) DO UPDATE SET points = excluded.points, grade = excluded.grade, "
+				"suite = COALESCE(excluded.suite, submissions.suite), updated_at = excluded.updated_at",
+				(key, points, grade, suite, now, now))
+			if adjustment is not None:
+				self.connection.execute(
+					"INSERT INTO adjustments (folder, adjustment, checklist, points_after, created_at) VALUES (?, ?, ?, ?, ?)",
+					(key, adjustment, checklist, points, now))
+
+	def record_run(self, folder: Path, file_name: str, exit_code: int | None, stopped: bool, duration: float,
+				   suite: str | None = None) -> None:
+		with self._lock, self.connection:
+			self.connection.execute(
+				"INSERT INTO runs (folder, file, exit_code, stopped, duration, suite, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+				(self.folder_key(folder), file_name, exit_code, int(stopped), duration, suite, self._now()))
+
+	def run_summaries(self) -> dict[str, RunSummary]:
+		"""Last run and number of stopped (hung) runs per folder, keyed by resolved path."""
+		with self._lock:
+			rows = self.connection.execute(
+				"SELECT runs.folder, runs.exit_code, runs.stopped, runs.created_at, totals.stopped_runs, runs.suite "
+				"FROM runs JOIN (SELECT folder, MAX(id) AS last_id, SUM(stopped) AS stopped_runs FROM runs GROUP BY folder) AS totals "
+				"ON runs.id = totals.last_id").fetchall()
+		return {folder: RunSummary(exit_code, bool(stopped), created_at, stopped_runs, suite)
+				for folder, exit_code, stopped, created_at, stopped_runs, suite in rows}
+
+	def reset(self, folder: Path, points: float, grade: str | None, suite: str | None = None) -> None:
+		with self._lock, self.connection:
+			self.connection.execute("DELETE FROM adjustments WHERE folder = ?", (self.folder_key(folder),))
+		self.save_points(folder, points, grade, suite=suite)
+
+	def close(self) -> None:
+		with self._lock:
+			self.connection.close()
+
+def code_fingerprint(source: str, window: int = 6) -> set[int]:
+	"""Hashes of every run of window tokens, with names and literals normalised away.
+
+	Renaming variables or changing strings leaves the fingerprint unchanged, so two
+	submissions sharing most of their fingerprints are structurally near-identical.
+	"""
+	tokens = []
+	try:
+		for token in tokenize.generate_tokens(io.StringIO(source).readline):
+			if token.type == tokenize.NAME:
+				tokens.append(token.string if keyword.iskeyword(token.string) else "N")
+			elif token.type in (tokenize.NUMBER, tokenize.STRING):
+				tokens.append("L")
+			elif token.type == tokenize.OP:
+				tokens.append(token.string)
+	except (tokenize.TokenError, SyntaxError):
+		pass
+	return {hash(tuple(tokens[i:i + window])) for i in range(len(tokens) - window + 1)}
+
+def find_similar_submissions(fingerprints: dict[str, set[int]], threshold: float = 0.8,
+							 max_sharing: int = 10) -> dict[str, list[tuple[str, float]]]:
+	"""Pairs of submissions whose fingerprints mostly overlap, via an inverted index.
+
+	Windows shared by more than max_sharing submissions (template or course-provided
+	code) are ignored; similarity is the share of the smaller fingerprint found in the
+	other one, so a copied solution with extra code added is still flagged.
+	"""
+	postings: dict[int, list[str]] = {}
+	for name, shingles in fingerprints.items():
+		for shingle in shingles:
+			postings.setdefault(shingle, []).append(name)
+	
+	shared = Counter()
+	for names in postings.values():
+		if 1 < len(names) <= max_sharing:
+			shared.update(combinations(names, 2))
+	
+	similar: dict[str, list[tuple[str, float]]] = {}
+	for (first, second), count in shared.items():
+		score = count / max(1, min(len(fingerprints[first]), len(fingerprints[second])))
+		if score >= threshold:
+			similar.setdefault(first, []).append((second, score))
+			similar.setdefault(second, []).append((first, score))
+	for matches in similar.values():
+		matches.sort(key=lambda match: -match[1])
+	return similar
+
+def scan_submission(folder: Path) -> tuple[dict, set[int]]:
+	"""Feedback status and code fingerprint of one submission folder (runs on a worker thread)."""
+	info = {"feedback_saved": False, "feedback_points": None, "feedback_grade": None}
+	feedback_file = folder / "FEEDBACK.txt"
+	try:
+		summary = parse_feedback(feedback_file.read_text(encoding="utf-8", errors="replace"))
+		info.update(feedback_saved=True, feedback_points=summary.points, feedback_grade=summary.grade)
+	except OSError:
+		pass
+	
+	fingerprint: set[int] = set()
+	try:
+		for script in sorted(folder.glob("*.py")):
+			fingerprint |= code_fingerprint(script.read_text(encoding="utf-8", errors="replace"))
+	except OSError:
+		pass
+	return info, fingerprint
+
+def file_signature(path: Path) -> tuple[int, int] | None:
+	try:
+		stat = path.stat()
+	except OSError:
+		return None
+	return stat.st_mtime_ns, stat.st_size
+
+def decode_data_lines(data: bytes) -> list[str]:
+	return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n").strip().split('\n')
+
+def load_data_diff(artifacts: ArtifactCache, file_path: Path, base_file_path: Path,
+				   revalidate: bool = False) -> tuple[list[str], RecordDiff]:
+	"""Lines of a data file and its diff against the stored template, cached until either file changes."""
+	def build(raw):
+		lines = decode_data_lines(raw[0])
+		try:
+			base_lines = decode_data_lines(raw[1]) if raw[1] is not None else None
+		except UnicodeDecodeError:
+			base_lines = None
+		return lines, diff_data_records(file_path.name, base_lines, lines)
+	return artifacts.load("data_diff", (file_path, base_file_path), build, revalidate)
+
+TEXT_BOMS = (
+	(codecs.BOM_UTF32_LE, "utf-32"),   # before UTF-16 LE, whose BOM is its prefix
+	(codecs.BOM_UTF32_BE, "utf-32"),
+	(codecs.BOM_UTF8, "utf-8-sig"),
+	(codecs.BOM_UTF16_LE, "utf-16"),
+	(codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+def decode_text(data: bytes) -> tuple[str, str]:
+	"""Decode a text file of unknown encoding, returning (text, encoding).
+
+	A BOM decides the encoding outright; otherwise the bytes are decoded as UTF-8, which
+	validates them in the same pass, and only text that is not UTF-8 falls back to
+	cp1252 (latin-1 for the few bytes cp1252 leaves undefined).
+	"""
+	for bom, encoding in TEXT_BOMS:
+		if data.startswith(bom):
+			text = data.decode(encoding, errors="replace")
+			break
+	else:
+		for encoding in ("utf-8", "cp1252", "latin-1"):
+			try:
+				text = data.decode(encoding)
+				break
+			except UnicodeDecodeError:
+				continue
+	return text.replace("\r\n", "\n").replace("\r", "\n"), encoding
+
+def load_text_file(artifacts: ArtifactCache, path: Path) -> tuple[str, str]:
+	return artifacts.load("decoded_text", (path,), lambda raw: decode_text(raw[0]))
+
+class SubmissionSnapshot(NamedTuple):
+	"""The file list of a submission folder read ahead of time."""
+	folder: Path
+	python_files: list[str]
+
+def prefetch_submission(folder: Path, data_dir: Path, artifacts: ArtifactCache, highlight_cache: HighlightCache) -> SubmissionSnapshot:
+	"""Read a submission folder and warm everything its viewers need (runs on a worker thread).
+
+	Sources, FEEDBACK.txt, ai.txt and the data files are read into the artefact cache, the
+	sources are lexed and analysed into the highlight cache, and the data files are diffed
+	against the stored templates.
+	"""
+	def read(load, *args):
+		try:
+			return load(*args)
+		except (OSError, UnicodeDecodeError):
+			return None
+	
+	try:
+		python_files = sorted(path.name for path in folder.glob("*.py"))
+	except OSError:
+		python_files = []
+	read(artifacts.text, folder / "FEEDBACK.txt")
+	read(load_text_file, artifacts, folder / "ai.txt")
+	
+	for name in python_files:
+		code = read(artifacts.text, folder / name)
+		if code is None:
+			continue
+		content_key = HighlightCache.content_hash(code)
+		cached = highlight_cache.get(content_key) or {}
+		entry = {}
+		if "line_offsets" not in cached:
+			entry["line_offsets"] = HighlightCache.build_line_offsets(code)
+		if "line_spans" not in cached:
+			entry["line_spans"] = LazySyntaxHighlighter.lex(code)
+		if "resources" not in cached:
+			entry["resources"] = analyze_resource_handling(code).to_dict()
+		if entry:
+			highlight_cache.put(content_key, entry)
+	
+	for base_file in sorted(data_dir.glob("*.txt")):
+		read(load_data_diff, artifacts, folder / base_file.name, base_file)
+	return SubmissionSnapshot(folder, python_files)
+
+def tag_changed_fields(text_widget: tk.Text, lines: list[str], changed_fields: dict[int, list[int]], delimiter: str,
+					   tag_name: str = "changed_field") -> None:
+	"""Tag the given columns of each row; an empty column list tags the whole row."""
+	text_widget.tag_remove(tag_name, "1.0", tk.END)
+	indices = []
+	for line_idx, columns_changed in changed_fields.items():
+		if line_idx >= len(lines):
+			continue
+		if not columns_changed:
+			indices.extend((f"{line_idx + 1}.0", f"{line_idx + 1}.end"))
+			continue
+		position = 0
+		for column, value in enumerate(lines[line_idx].split(delimiter)):
+			if column in columns_changed and value:
+				indices.extend((f"{line_idx + 1}.{position}", f"{line_idx + 1}.{position + len(value)}"))
+			position += len(value) + len(delimiter)
+	if indices:
+		text_widget.tag_add(tag_name, *indices)
+
+def patch_csv_text(text_widget: tk.Text, old_lines: list[str], new_lines: list[str],
+				   old_status: list, new_status: list, delimiter: str, color_count: int) -> None:
+	"""Turn a data-file Text widget showing old_lines into one showing new_lines.
+
+	Only the rows between the common prefix and suffix are deleted and re-inserted (in
+	a single insert call), and only rows whose change status differs are retagged, so a
+	file growing by one row costs one row of work.
+	"""
+	limit = min(len(old_lines), len(new_lines))
+	prefix = 0
+	while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+		prefix += 1
+	suffix = 0
+	while suffix < limit - prefix and old_lines[-1 - suffix] == new_lines[-1 - suffix]:
+		suffix += 1
+	old_end = len(old_lines) - suffix
+	new_end = len(new_lines) - suffix
+
+	if old_end > prefix:
+		text_widget.delete(f"{prefix + 1}.0", f"{old_end + 1}.0")
+	if new_end > prefix:
+		chunks = []
+		for line in new_lines[prefix:new_end]:
+			columns = line.split(delimiter)
+			for col_idx, column in enumerate(columns):
+				chunks.extend((column, f"col{col_idx % color_count}"))
+				if col_idx < len(columns) - 1:
+					chunks.extend((delimiter, ""))
+			chunks.extend(("\n", ""))
+		text_widget.insert(f"{prefix + 1}.0", *chunks)
+
+	current_status = list(old_status[:prefix]) + [None] * (new_end - prefix) + list(old_status[old_end:])
+	additions: dict[str, list[str]] = {}
+	for line_idx, status in enumerate(new_status):
+		if current_status[line_idx] == status:
+			continue
+		line_num = line_idx + 1
+		if current_status[line_idx]:
+			text_widget.tag_remove(current_status[line_idx], f"{line_num}.0", f"{line_num}.end")
+		if status:
+			additions.setdefault(status, []).extend((f"{line_num}.0", f"{line_num}.end"))
+	for tag_name, indices in additions.items():
+		text_widget.tag_add(tag_name, *indices)
+
+class FontRegistry:
+	"""Named fonts shared by every window, grouped by the zoom setting that scales them.
+
+	Widgets are given a registry font instead of a (family, size) tuple, so zooming a
+	group is one size change per font and Tk re-renders every widget that uses it.
+	"""
+
+	def __init__(self, root: tk.Misc, zoom: dict[str, float]) -> None:
+		self.root = root
+		self.zoom = dict(zoom)
+		self._fonts: dict[tuple, tkfont.Font] = {}
+		self._base_sizes: list[tuple[str, int, tkfont.Font]] = []
+
+	def get(self, group: str, family: str, size: int, weight: str = "normal", slant: str = "roman") -> tkfont.Font:
+		key = (group, family, size, weight, slant)
+		font = self._fonts.get(key)
+		if font is None:
+			if family in tkfont.names(self.root):   # e.g. TkDefaultFont: use the family it maps to
+				family = tkfont.nametofont(family).actual("family")
+			font = tkfont.Font(self.root, family=family, size=self._scaled(group, size), weight=weight, slant=slant)
+			self._fonts[key] = font
+			self._base_sizes.append((group, size, font))
+		return font
+
+	def standard(self, group: str, name: str, size: int) -> None:
+		"""Put one of Tk's named fonts (TkDefaultFont, TkTextFont...) under a group's zoom."""
+		font = tkfont.nametofont(name)
+		font.configure(size=self._scaled(group, size))
+		self._base_sizes.append((group, size, font))
+
+	def set_zoom(self, group: str, zoom: float) -> None:
+		self.zoom[group] = zoom
+		for font_group, size, font in self._base_sizes:
+			if font_group == group:
+				font.configure(size=self._scaled(group, size))
+
+	def _scaled(self, group: str, size: int) -> int:
+		return max(1, int(size * self.zoom.get(group, 1.0)))
+
+class PagedTextView:
+	"""Read-only text view that inserts a long document a page at a time as it is scrolled.
+
+	Only the first page goes into the Text widget up front; whenever the view gets near
+	the end of what is loaded, the next PAGE_CHARS characters are appended, so a
+	multi-megabyte chat log opens as fast as a short note. Ctrl+End loads the rest.
+	"""
+
+	PAGE_CHARS = 64 * 1024
+	LOAD_AHEAD = 0.8   # fraction of the loaded text scrolled past before the next page is appended
+
+	def __init__(self, parent: tk.Widget, font: tkfont.Font, wrap: str = "word") -> None:
+		self.content = ""
+		self.loaded = 0
+		self.on_page = None
+		self._load_scheduled = False
+		
+		self.frame = ttk.Frame(parent)
+		self.scrollbar = ttk.Scrollbar(self.frame, orient="vertical")
+		self.text = tk.Text(self.frame, wrap=wrap, font=font, yscrollcommand=self._on_yscroll)
+		self.scrollbar.config(command=self.text.yview)
+		self.scrollbar.pack(side="right", fill="y")
+		self.text.pack(side="left", fill="both", expand=True)
+		self.text.bind("<Control-End>", self._on_control_end)
+		self.text.config(state="disabled")
+
+	@property
+	def fully_loaded(self) -> bool:
+		return self.loaded >= len(self.content)
+
+	def set_content(self, content: str) -> None:
+		self.content = content
+		self.loaded = 0
+		self.text.config(state="normal")
+		self.text.delete("1.0", tk.END)
+		self.text.config(state="disabled")
+		self.load_page()
+
+	def load_page(self, chars: int = PAGE_CHARS) -> None:
+		self._load_scheduled = False
+		if self.fully_loaded or not self.text.winfo_exists():
+			return
+		end = min(len(self.content), self.loaded + chars)
+		if end < len(self.content):
+			# Finish the current line unless it runs on for another whole page.
+			newline = self.content.find("\n", end, end + self.PAGE_CHARS)
+			if newline != -1:
+				end = newline + 1
+		self.text.config(state="normal")
+		self.text.insert("end-1c", self.content[self.loaded:end])
+		self.text.config(state="disabled")
+		self.loaded = end
+		if self.on_page:
+			self.on_page(self)
+
+	def _on_yscroll(self, first: str, last: str) -> None:
+		self.scrollbar.set(first, last)
+		if float(last) >= self.LOAD_AHEAD and not self.fully_loaded and not self._load_scheduled:
+			self._load_scheduled = True
+			self.text.after_idle(self.load_page)
+
+	def _on_control_end(self, event=None) -> str:
+		self.load_page(len(self.content))
+		self.text.see(tk.END)
+		return "break"
+
+class VirtualTableView:
+	"""Fixed-height view over a data file's rows that only renders the visible window.
+
+	The rows, their diff status and changed fields live in plain lists (the model); the
+	Text widget only ever holds MAX_VISIBLE_ROWS rows, so a 100k-row file costs as much
+	to display and scroll as a 40-row one. Moving the window or reloading the model
+	reuses patch_csv_text, so only rows that actually changed are re-inserted.
+	"""
+
+	MAX_VISIBLE_ROWS = 40
+
+	def __init__(self, parent: tk.Widget, colors: list[str], font: tkfont.Font) -> None:
+		self.colors = colors
+		self.lines: list[str] = []
+		self.line_status: list[str | None] = []
+		self.changed_fields: dict[int, list[int]] = {}
+		self.invalid_fields: dict[int, list[int]] = {}
+		self.delimiter: str | None = None
+		self.top = 0
+		self.current_row: int | None = None
+		self._rendered_lines: list[str] = []
+		self._rendered_status: list[str | None] = []
+		self._rendered_delimiter: str | None = None
+		
+		self.frame = ttk.Frame(parent)
+		self.text = tk.Text(self.frame, wrap="none",
+							font=font,
+							bg="white",
+							borderwidth=2,
+							relief="solid",
+							padx=10,
+							pady=10,
+							height=1)
+		self.scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=self._on_scrollbar)
+		self.text.pack(side="left", fill="both", expand=True)
+		
+		self.text.tag_config("extra_line", background="#FFFF99")  
+		self.text.tag_config("modified_line", background="#FFD4A3")  
+		self.text.tag_config("current_extra_line", background="#FFA500")  
+		self.text.tag_config("changed_field", underline=True, background="#FFB870")
+		self.text.tag_config("invalid_field", foreground="#FFFFFF", background="#D9534F")
+		for i, color in enumerate(self.colors):
+			self.text.tag_config(f"col{i}", foreground=color)
+		
+		self.text.bind("<MouseWheel>", self._on_mousewheel)
+		self.text.config(state="disabled")
+
+	@property
+	def visible_rows(self) -> int:
+		return max(1, min(len(self.lines), self.MAX_VISIBLE_ROWS))
+
+	def set_data(self, lines: list[str], line_status: list[str | None],
+				 changed_fields: dict[int, list[int]], delimiter: str) -> None:
+		self.lines = lines
+		self.line_status = line_status
+		self.changed_fields = changed_fields
+		self.delimiter = delimiter
+		if self.current_row is not None and self.current_row >= len(lines):
+			self.current_row = None
+		
+		if int(self.text.cget("height")) != self.visible_rows:
+			self.text.config(height=self.visible_rows)
+		if len(lines) > self.MAX_VISIBLE_ROWS:
+			if not self.scrollbar.winfo_manager():
+				self.scrollbar.pack(side="right", fill="y")
+		elif self.scrollbar.winfo_manager():
+			self.scrollbar.pack_forget()
+		self.set_top(self.top)
+
+	def set_issues(self, issues: list[DataIssue]) -> None:
+		invalid_fields: dict[int, list[int]] = {}
+		whole_rows = {issue.line for issue in issues if not issue.columns}
+		for issue in issues:
+			columns = invalid_fields.setdefault(issue.line, [])
+			if issue.line not in whole_rows:
+				columns.extend(issue.columns)
+		self.invalid_fields = invalid_fields
+		self.set_top(self.top)
+
+	def set_top(self, top: int) -> None:
+		self.top = max(0, min(top, len(self.lines) - self.visible_rows))
+		self._render()
+
+	def set_current_row(self, row: int | None) -> None:
+		"""Mark row (0-based, or None to clear) as the navigation target, scrolling it into view."""
+		self.current_row = row
+		if row is not None and not self.top <= row < self.top + self.visible_rows:
+			self.top = row - self.visible_rows // 3
+		self.set_top(self.top)
+
+	def row_index(self, row: int) -> str:
+		"""Text index of a model row within the rendered window."""
+		return f"{row - self.top + 1}.0"
+
+	def _render(self) -> None:
+		end = self.top + self.visible_rows
+		window_lines = self.lines[self.top:end]
+		window_status = self.line_status[self.top:end]
+		
+		self.text.config(state="normal")
+		if self.delimiter != self._rendered_delimiter:
+			self.text.delete("1.0", tk.END)
+			self._rendered_lines, self._rendered_status = [], []
+		if self.delimiter is not None:
+			patch_csv_text(self.text, self._rendered_lines, window_lines, self._rendered_status,
+						   window_status, self.delimiter, len(self.colors))
+			tag_changed_fields(self.text, window_lines,
+							   {row - self.top: fields for row, fields in self.changed_fields.items() if self.top <= row < end},
+							   self.delimiter)
+			tag_changed_fields(self.text, window_lines,
+							   {row - self.top: fields for row, fields in self.invalid_fields.items() if self.top <= row < end},
+							   self.delimiter, "invalid_field")
+		self.text.tag_remove("current_extra_line", "1.0", tk.END)
+		if self.current_row is not None and self.top <= self.current_row < end:
+			line_num = self.current_row - self.top + 1
+			self.text.tag_add("current_extra_line", f"{line_num}.0", f"{line_num}.end+1c")
+			self.text.tag_raise("current_extra_line")
+		self.text.config(state="disabled")
+		
+		self._rendered_lines = window_lines
+		self._rendered_status = window_status
+		self._rendered_delimiter = self.delimiter
+		if self.lines:
+			self.scrollbar.set(self.top / len(self.lines), end / len(self.lines))
+
+	def _on_scrollbar(self, action: str, *args) -> None:
+		if action == "moveto":
+			self.set_top(round(float(args[0]) * len(self.lines)))
+		elif action == "scroll":
+			step = int(args[0]) * (self.visible_rows if args[1] == "pages" else 1)
+			self.set_top(self.top + step)
+
+	def _on_mousewheel(self, event: tk.Event):
+		if len(self.lines) <= self.MAX_VISIBLE_ROWS or event.state & 0x0001:
+			return None  # let the viewer scroll between files
+		self.set_top(self.top - 3 * int(event.delta / 120))
+		return "break"
+
 class PythonTesterApp:
 	def __init__(self, root: tk.Tk) -> None:
 		self.root = root
@@ -138,7 +2838,13 @@ class PythonTesterApp:
 				print(f"Failed to load copy icon: {e}")
 
 		self.process: subprocess.Popen | None = None
-		self.output_queue: queue.Queue[str] = queue.Queue()
+		self.process_run: tuple[Path, str, float] | None = None
+		self.dispatcher = UIDispatcher(self.root)
+		self.dispatcher.subscribe(EVENT_PROCESS_OUTPUT, self._append_output, coalesce=True)
+		self.dispatcher.subscribe(EVENT_PROCESS_EXIT, self._handle_process_exit)
+		self.dispatcher.subscribe(EVENT_FILE_CHANGED, self._on_watched_file_changed)
+		self.file_watcher = FileWatcherService(self.dispatcher)
+		self.file_list_refresh_job = None
 		self.output_thread: threading.Thread | None = None
 
 		self.file_var = tk.StringVar()
@@ -146,28 +2852,54 @@ class PythonTesterApp:
 		self.zoom_level = 1.0
 		self.submissions_dir: Path | None = None
 		self.current_points = 100
-		self.last_file_for_points = None
+		self.grading_folder: Path | None = None
+		self.grading_load_folder: Path | None = None   # folder whose grading state is being read
 		self.feedback_text: ScrolledText | None = None  
 		self._resize_scheduled = False
 		self.feedback_collapsed = True
 		self.code_viewer_zoom = 1.5  # Default zoom for code viewer
 		self.files_viewer_zoom = 1.4  # Default zoom for data files viewer
+		self.last_compare_file: str | None = None
 		self.points_history: list[tuple[int, str]] = []  
 		self.last_accessed_preset_index: int = -1
 		self.last_sent_preset_index: int = -1  
 		self.feedback_status_label = None
-		self.feedback_auto_check_job = None
+		self.feedback_save_job = None
+		self.feedback_dirty = False
+		self.feedback_disk_conflict = False
 		self.last_saved_feedback_content = ""
+		self.feedback_on_disk = False
+		self.feedback_loading = False
+		self.feedback_load_id = 0
+		self.artifacts = ArtifactCache()
+		self.highlight_cache = HighlightCache(CACHE_DIR, self.artifacts)
+		self.analysis_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="analysis")
+		self.fuzz_futures: list = []
+		self.background_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="background")
+		self.submission_folders: list[Path] = []
+		self.prefetched: dict[Path, SubmissionSnapshot] = {}
+		self.submission_snapshot: SubmissionSnapshot | None = None
+		self.io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="io")
+		self.config_store = JsonFileStore(self.root, CONFIG_PATH, self.io_executor, self._config_snapshot)
+		self.grading_state = GradingStateStore(GRADING_DB_PATH)
+		self.suite_library = SuiteLibrary(BASE_DIR, SUITES_DIR)
+		self.suite = self.suite_library.get(DEFAULT_SUITE_NAME)
 
 		self._load_config()
+		self.fonts = FontRegistry(self.root, {"main": self.zoom_level, "code": self.code_viewer_zoom, "files": self.files_viewer_zoom})
+		for name in ("TkDefaultFont", "TkTextFont", "TkMenuFont"):
+			self.fonts.standard("main", name, 9)
+		ttk.Style().configure(".", font="TkDefaultFont")
+		self.suite_var = tk.StringVar(value=self.suite.name)
+		self.predefined_inputs_store = JsonFileStore(self.root, self.suite.inputs_path, self.io_executor, lambda: self.predefined_inputs)
 		self._create_menu()
 		self._build_layout()
 		self._load_predefined_inputs()
 		self._refresh_file_list()
+		self._prefetch_neighbours()
 		self._update_button_states()  
-		self._poll_output_queue()
+		self.dispatcher.start()
 		self._setup_zoom_bindings()
-		self._apply_zoom()  
 		self._update_points_display() 
 		self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
@@ -199,7 +2931,14 @@ class PythonTesterApp:
 		self.file_menu = tk.Menu(self.menubar, tearoff=0)
 		self.menubar.add_cascade(label="File", menu=self.file_menu)
 		self.file_menu.add_command(label="Extract Submissions", command=self._extract_submissions)
+		self.file_menu.add_command(label="Compare With...", command=self._compare_submission)
+		self.file_menu.add_command(label="Open Text File...", command=self._browse_text_file)
+		self.file_menu.add_command(label="Validate All Submissions", command=self._validate_all_submissions)
+		self.file_menu.add_command(label="Fuzz Input Validation", command=self._fuzz_input_validation)
+		self.file_menu.add_command(label="Export Gradebook...", command=self._export_gradebook)
 		self.file_menu.add_separator()
+		self.suite_menu = tk.Menu(self.file_menu, tearoff=0, postcommand=self._populate_suite_menu)
+		self.file_menu.add_cascade(label="Test Suite", menu=self.suite_menu)
 		self.file_menu.add_command(label="Import Predefined Inputs", command=self._import_predefined_inputs)
 		self.file_menu.add_command(label="Export Predefined Inputs", command=self._export_predefined_inputs)
 		self.file_menu.add_separator()
@@ -212,6 +2951,9 @@ class PythonTesterApp:
 		self.view_menu.add_command(label="Zoom In", command=self._zoom_in, accelerator="Ctrl++")
 		self.view_menu.add_command(label="Zoom Out", command=self._zoom_out, accelerator="Ctrl+-")
 		self.view_menu.add_command(label="Reset Zoom", command=self._reset_zoom, accelerator="Ctrl+0")
+		self.view_menu.add_separator()
+		self.view_menu.add_command(label="Course Dashboard", command=self._open_dashboard)
+		self.view_menu.add_command(label="Cache Statistics", command=self._show_cache_statistics)
 
 	def _build_layout(self) -> None:
 		self.root.columnconfigure(0, weight=3)
@@ -232,7 +2974,7 @@ class PythonTesterApp:
 		header_row.columnconfigure(0, weight=1)
 
 		# horizontal line
-		ttk.Separator(header_row, orient="horizontal").grid(row=1, column=0, columnspan=3, sticky="ew", pady=(4, 8))
+		ttk.Separator(header_row, orient="horizontal").grid(row=1, column=0, columnspan=4, sticky="ew", pady=(4, 8))
 		
 		# ttk.Label(header_row, text="Submission File").grid(row=0, column=0, sticky="w")
 		
@@ -245,6 +2987,15 @@ class PythonTesterApp:
 		browse_button.grid(row=0, column=1, sticky="w", padx=(6, 0))
 		# open_dir_button = ttk.Button(header_row, text="📁", command=self._open_current_directory, width=3)
 		# open_dir_button.grid(row=0, column=2, sticky="w", padx=(6, 0))
+		
+		previous_button = ttk.Button(header_row, text="◀", width=3, command=lambda: self._go_to_submission(-1))
+		previous_button.grid(row=0, column=2, sticky="w", padx=(6, 0))
+		ToolTip(previous_button, "Previous submission (Alt+Left)")
+		next_button = ttk.Button(header_row, text="▶", width=3, command=lambda: self._go_to_submission(1))
+		next_button.grid(row=0, column=3, sticky="w", padx=(3, 0))
+		ToolTip(next_button, "Next submission (Alt+Right)")
+		self.root.bind("<Alt-Left>", lambda e: self._go_to_submission(-1))
+		self.root.bind("<Alt-Right>", lambda e: self._go_to_submission(1))
 
 		file_row = ttk.Frame(main_frame)
 		file_row.grid(row=1, column=0, sticky="ew", pady=(0, 8))
@@ -297,7 +3048,7 @@ class PythonTesterApp:
 		terminal_frame.rowconfigure(0, weight=1)
 		terminal_frame.columnconfigure(0, weight=1)
 
-		self.output_text = ScrolledText(terminal_frame, wrap="word", height=20, state="disabled")
+		self.output_text = ScrolledText(terminal_frame, wrap="word", height=20, state="disabled", font=self.fonts.get("main", "Consolas", 10))
 		self.output_text.grid(row=0, column=0, sticky="nsew", padx=6, pady=6)
 
 		input_row = ttk.Frame(main_frame)
@@ -327,7 +3078,7 @@ class PythonTesterApp:
 		points_grade_frame.grid(row=0, column=1, sticky="ew")
 		points_grade_frame.columnconfigure(2, weight=1)  
 		
-		self.points_display = ttk.Label(points_grade_frame, text="100", font=("TkDefaultFont", 8, "bold"), foreground="green")
+		self.points_display = ttk.Label(points_grade_frame, text="100", font=self.fonts.get("main", "TkDefaultFont", 10, "bold"), foreground="green")
 		self.points_display.grid(row=0, column=0, sticky="w")
 		
 		if self.copy_icon:
@@ -343,7 +3094,7 @@ class PythonTesterApp:
 		
 		ttk.Label(grade_container, text="Grade: ").grid(row=0, column=0, sticky="e")
 		
-		self.grade_display = ttk.Label(grade_container, text="5", font=("TkDefaultFont", 8, "bold"), foreground="green")
+		self.grade_display = ttk.Label(grade_container, text="5", font=self.fonts.get("main", "TkDefaultFont", 10, "bold"), foreground="green")
 		self.grade_display.grid(row=0, column=1, sticky="e")
 		
 		if self.copy_icon:
@@ -389,7 +3140,8 @@ class PythonTesterApp:
 		reset_button = ttk.Button(adjust_row, text="Reset", command=self._reset_points, width=8)
 		reset_button.grid(row=0, column=4, sticky="e")
 
-		sidebar = ttk.LabelFrame(self.root, text="Preset Inputs", padding=12)
+		sidebar = ttk.LabelFrame(self.root, text=self._preset_inputs_title(), padding=12)
+		self.preset_sidebar = sidebar
 		sidebar.grid(row=1, column=1, sticky="nsew", padx=(0, 12), pady=(6, 6))
 		sidebar.columnconfigure(0, weight=1)
 		sidebar.rowconfigure(1, weight=1)
@@ -412,7 +3164,8 @@ class PythonTesterApp:
 		listbox_frame.columnconfigure(0, weight=1)
 		listbox_frame.rowconfigure(0, weight=1)
 
-		self.predefined_listbox = tk.Listbox(listbox_frame, height=15)
+		self.predefined_listbox = tk.Listbox(listbox_frame, height=15, font="TkDefaultFont")
+		self.preset_model = PresetListModel(self.predefined_listbox, self.predefined_inputs_store)
 		self.predefined_listbox.grid(row=0, column=0, sticky="nsew")
 		
 		listbox_scrollbar = ttk.Scrollbar(listbox_frame, orient="vertical", command=self.predefined_listbox.yview)
@@ -457,7 +3210,7 @@ class PythonTesterApp:
 		self.feedback_collapse_button = ttk.Button(feedback_header, text="▶ Show", width=12, command=self._toggle_feedback_collapse)
 		self.feedback_collapse_button.grid(row=0, column=0, sticky="w")
 		
-		self.feedback_status_label = tk.Label(feedback_header, text="", fg="gray", font=("TkDefaultFont", 8))
+		self.feedback_status_label = tk.Label(feedback_header, text="", fg="gray", font="TkDefaultFont")
 		self.feedback_status_label.grid(row=0, column=1, sticky="w", padx=(10, 0))
 		
 		self.feedback_content_frame = ttk.Frame(feedback_frame)
@@ -465,7 +3218,7 @@ class PythonTesterApp:
 		self.feedback_content_frame.grid_remove()  
 		self.feedback_content_frame.columnconfigure(0, weight=1)
 		
-		self.feedback_text = ScrolledText(self.feedback_content_frame, wrap="word", height=8, width=30)
+		self.feedback_text = ScrolledText(self.feedback_content_frame, wrap="word", height=8, width=30, font="TkDefaultFont")
 		self.feedback_text.grid(row=0, column=0, sticky="ew", pady=(0, 6))
 		
 		feedback_buttons_frame = ttk.Frame(self.feedback_content_frame)
@@ -495,31 +3248,45 @@ class PythonTesterApp:
 		self._load_feedback_template()
 
 	def _refresh_file_list(self) -> None:
-		if self.submissions_dir is None:
-			self.file_combo["values"] = []
-			if self.file_var.get():
-				self.file_var.set("")
-			self._update_directory_label()
+		folder = self.submissions_dir
+		if folder is None:
+			self._show_file_list([])
 			return
 		
-		if not self.submissions_dir.exists():
-			messagebox.showwarning("Directory Missing", 
-				f"The directory {self.submissions_dir} no longer exists.\nPlease browse for a new directory.")
-			self.submissions_dir = None
-			self._save_config()
-			self.file_combo["values"] = []
-			if self.file_var.get():
-				self.file_var.set("")
-			self._update_directory_label()
+		# The prefetched list only stands in for the first refresh after switching folders;
+		# later refreshes (⟳, dropdown, missing file) read the folder again.
+		snapshot = self.submission_snapshot
+		self.submission_snapshot = None
+		if snapshot is not None and snapshot.folder == folder:
+			self._show_file_list(list(snapshot.python_files))
 			return
-
-		try:
-			python_files = sorted(self.submissions_dir.glob("*.py"))
-			file_names = [file.name for file in python_files]
-		except OSError as err:
-			messagebox.showerror("Directory Error", f"Could not read directory: {err}")
-			file_names = []
-
+		
+		def list_files():
+			if not folder.is_dir():
+				return None
+			return [file.name for file in sorted(folder.glob("*.py"))]
+		
+		def on_listed(future):
+			if self.submissions_dir != folder:
+				return
+			try:
+				file_names = future.result()
+			except OSError as err:
+				messagebox.showerror("Directory Error", f"Could not read directory: {err}")
+				file_names = []
+			if file_names is None:
+				messagebox.showwarning("Directory Missing", 
+					f"The directory {folder} no longer exists.\nPlease browse for a new directory.")
+				self.submissions_dir = None
+				self._save_config()
+				file_names = []
+			self._show_file_list(file_names)
+		
+		self.dispatcher.watch_future(self.io_executor.submit(list_files), on_listed)
+	
+	def _show_file_list(self, file_names: list[str]) -> None:
+		self.file_watcher.watch(self.submissions_dir)
+		self._load_grading_state()
 		self.file_combo["values"] = file_names
 
 		if file_names:
@@ -532,6 +3299,35 @@ class PythonTesterApp:
 		
 		self._update_directory_label()
 	
+	def _update_file_combo_values(self) -> None:
+		self.file_list_refresh_job = None
+		folder = self.submissions_dir
+		if folder is None:
+			return
+		
+		def on_listed(future):
+			try:
+				file_names = future.result()
+			except OSError:
+				return
+			if self.submissions_dir != folder:
+				return
+			self.file_combo["values"] = file_names
+			if self.file_var.get() not in file_names:
+				self.file_var.set(file_names[0] if file_names else "")
+		
+		self.dispatcher.watch_future(self.io_executor.submit(lambda: sorted(file.name for file in folder.glob("*.py"))), on_listed)
+	
+	def _on_watched_file_changed(self, change: FileChange) -> None:
+		if self.submissions_dir is None or change.path.parent != self.submissions_dir:
+			return
+		if change.path.suffix == ".py" and change.change != "modified":
+			if self.file_list_refresh_job:
+				self.root.after_cancel(self.file_list_refresh_job)
+			self.file_list_refresh_job = self.root.after(200, self._update_file_combo_values)
+		elif change.path.name == "FEEDBACK.txt":
+			self._on_feedback_file_changed(change.path)
+	
 	def _update_directory_label(self) -> None:
 		if self.submissions_dir is None:
 			self.directory_label.config(text="Directory: None", foreground="gray")
@@ -591,14 +3387,90 @@ class PythonTesterApp:
 		if selected_file:
 			file_path = Path(selected_file)
 			if file_path.exists() and file_path.suffix == ".py":
-				self.submissions_dir = file_path.parent
-				self.last_opened_file = file_path.name
-				self._save_config()
-				self._refresh_file_list()
-				self._load_feedback_from_directory()
+				self._switch_submission_folder(file_path.parent, file_path.name)
 			else:
 				messagebox.showerror("File Error", "Please select a valid Python file.")
 
+	def _switch_submission_folder(self, folder: Path, file_name: str | None = None) -> None:
+		self._flush_feedback_autosave()
+		self.submission_snapshot = self.prefetched.pop(folder, None)
+		self.submissions_dir = folder
+		if file_name is not None:
+			self.last_opened_file = file_name
+		self._save_config()
+		self._refresh_file_list()
+		self._load_feedback_from_directory()
+		self._prefetch_neighbours()
+	
+	def _go_to_submission(self, offset: int) -> None:
+		if self.submissions_dir is None:
+			messagebox.showwarning("No Directory", "Please browse and select a Python file first.")
+			return
+		folder = self.submissions_dir
+		if folder in self.submission_folders:
+			self._step_submission(self.submission_folders, folder, offset)
+			return
+		
+		# The prefetched list is stale (or not read yet); list the course folder on the I/O worker.
+		def on_listed(future):
+			try:
+				folders = future.result()
+			except OSError as e:
+				messagebox.showerror("Directory Error", f"Could not read directory: {e}")
+				return
+			if self.submissions_dir != folder:
+				return
+			self.submission_folders = folders
+			if folder not in folders:
+				messagebox.showinfo("No Submissions", "The current directory is not one of the \"N - Name\" submission folders.")
+				return
+			self._step_submission(folders, folder, offset)
+		
+		self.dispatcher.watch_future(self.io_executor.submit(find_submission_folders, folder.parent), on_listed)
+	
+	def _step_submission(self, folders: list[Path], folder: Path, offset: int) -> None:
+		index = folders.index(folder) + offset
+		if 0 <= index < len(folders):
+			self._switch_submission_folder(folders[index])
+		else:
+			self.root.bell()
+	
+	def _prefetch_neighbours(self) -> None:
+		"""Read the submissions before and after the current one in the background."""
+		folder = self.submissions_dir
+		if folder is None:
+			return
+		data_dir = self.suite.data_dir
+		
+		def prefetch():
+			folders = find_submission_folders(folder.parent)
+			if folder not in folders:
+				return folders, {}
+			index = folders.index(folder)
+			neighbours = [folders[i] for i in (index + 1, index - 1) if 0 <= i < len(folders)]
+			return folders, {neighbour: prefetch_submission(neighbour, data_dir, self.artifacts, self.highlight_cache) for neighbour in neighbours}
+		
+		def on_prefetched(future):
+			try:
+				folders, snapshots = future.result()
+			except Exception as e:
+				print(f"Failed to prefetch submissions: {e}")
+				return
+			if self.submissions_dir == folder:
+				self.submission_folders = folders
+				self.prefetched = snapshots
+		
+		self.prefetched = {}
+		self.dispatcher.watch_future(self.background_executor.submit(prefetch), on_prefetched)
+	
+	def _show_cache_statistics(self) -> None:
+		stats = self.artifacts.stats()
+		messagebox.showinfo("Cache Statistics",
+			f"Hit rate: {stats.hit_rate:.0%} ({stats.hits} hits, {stats.misses} misses)\n"
+			f"Entries: {stats.entries} ({stats.evictions} evicted)\n"
+			f"Memory: {stats.size / (1024 * 1024):.1f} MB of {stats.max_size / (1024 * 1024):.0f} MB\n\n"
+			f"The budget is the \"artifact_cache_mb\" setting in config.json.")
+	
 	def _open_current_directory(self) -> None:
 		if self.submissions_dir is None or not self.submissions_dir.exists():
 			messagebox.showwarning("No Directory", "No directory is currently selected.\nPlease browse to a directory first.")
@@ -628,27 +3500,35 @@ class PythonTesterApp:
 			messagebox.showwarning("No File Selected", "Please choose a submission file to run.")
 			return
 
-		if self.last_file_for_points != selected_file:
-			self.current_points = 100
-			self.last_file_for_points = selected_file
-			self._update_points_display()
-
 		self.last_opened_file = selected_file
 		self._save_config()
 
-		script_path = self.submissions_dir / selected_file
-		if not script_path.exists():
-			messagebox.showerror("File Missing", 
-				f"Could not find {selected_file} in the current directory.\nDirectory may have changed. Please refresh or browse again.")
-			self._refresh_file_list()
-			return
+		folder = self.submissions_dir
+		script_path = folder / selected_file
 
-		try:
-			python_executable = get_python_executable()
-		except FileNotFoundError as err:
-			messagebox.showerror("Python Not Found", str(err))
-			return
+		def locate():
+			# Both the existence check and the PATH lookup touch the disk, so they run on the I/O worker.
+			return get_python_executable() if script_path.exists() else None
+
+		def on_located(future):
+			try:
+				python_executable = future.result()
+			except FileNotFoundError as err:
+				messagebox.showerror("Python Not Found", str(err))
+				return
+			if python_executable is None:
+				messagebox.showerror("File Missing", 
+					f"Could not find {selected_file} in the current directory.\nDirectory may have changed. Please refresh or browse again.")
+				self._refresh_file_list()
+				return
+			if self.process and self.process.poll() is None:
+				return
+			self._start_process(folder, selected_file, python_executable)
 
+		self.dispatcher.watch_future(self.io_executor.submit(locate), on_located)
+
+	def _start_process(self, folder: Path, selected_file: str, python_executable: str) -> None:
+		script_path = folder / selected_file
 		try:
 			creation_flags = 0
 			if sys.platform == 'win32':
@@ -675,6 +3555,7 @@ class PythonTesterApp:
 			messagebox.showerror("Execution Error", f"Failed to start process: {err}")
 			return
 
+		self.process_run = (folder, selected_file, time.monotonic())
 		self._clear_terminal()
 		self._append_output(f"Running {selected_file}...\n")
 
@@ -686,6 +3567,7 @@ class PythonTesterApp:
 
 	def _stop_process(self) -> None:
 		if self.process and self.process.poll() is None:
+			self._record_run(None, stopped=True)
 			self.process.terminate()
 			try:
 				self.process.wait(timeout=2)
@@ -695,35 +3577,35 @@ class PythonTesterApp:
 		self._on_process_end()
 
 	def _read_process_output(self) -> None:
-		assert self.process is not None and self.process.stdout is not None
+		process = self.process
+		assert process is not None and process.stdout is not None
 		
-		buffer = ""
 		while True:
-			char = self.process.stdout.read(1)
+			try:
+				char = process.stdout.read(1)
+			except (OSError, ValueError):
+				break
 			if not char:
 				break
-			
-			buffer += char
-			
-			if char:
-				self.output_queue.put(char)
+			self.dispatcher.post(EVENT_PROCESS_OUTPUT, char)
 				
-		return_code = self.process.wait()
-		self.output_queue.put(f"\nProcess exited with code {return_code}.\n")
-		self.output_queue.put(None)  
-
-	def _poll_output_queue(self) -> None:
-		try:
-			while True:
-				item = self.output_queue.get_nowait()
-				if item is None:
-					self._on_process_end()
-					break
-				self._append_output(item)
-		except queue.Empty:
-			pass
+		return_code = process.wait()
+		self.dispatcher.post(EVENT_PROCESS_OUTPUT, f"\nProcess exited with code {return_code}.\n")
+		self.dispatcher.post(EVENT_PROCESS_EXIT, process)
+	
+	def _handle_process_exit(self, process: subprocess.Popen) -> None:
+		if process is self.process:
+			self._record_run(process.returncode, stopped=False)
+			self._on_process_end()
+	
+	def _record_run(self, exit_code: int | None, stopped: bool) -> None:
+		if self.process_run is None:
+			return
+		folder, file_name, started = self.process_run
+		self.process_run = None
 
-		self.root.after(100, self._poll_output_queue)
+		self._write_grading_state(self.grading_state.record_run, folder, file_name, exit_code, stopped,
+								  time.monotonic() - started, self.suite.name)
 
 	def _append_output(self, text: str) -> None:
 		self.output_text.configure(state="normal")
@@ -783,11 +3665,7 @@ class PythonTesterApp:
 		
 		listbox_width = self.predefined_listbox.winfo_width() - 10
 		
-		base_font_size = 9
-		zoomed_font_size = int(base_font_size * self.zoom_level)
-		entry_font = ("TkDefaultFont", zoomed_font_size)
-		
-		self.edit_entry = tk.Entry(self.predefined_listbox, font=entry_font)
+		self.edit_entry = tk.Entry(self.predefined_listbox, font="TkDefaultFont")
 		self.edit_entry.insert(0, current_value)
 		self.edit_entry.select_range(0, tk.END)
 		self.edit_entry.place(x=0, y=y, width=listbox_width, height=height)
@@ -803,9 +3681,7 @@ class PythonTesterApp:
 		
 		new_value = self.edit_entry.get()
 		
-		self.predefined_inputs[self.edit_index] = new_value
-		self._save_predefined_inputs()
-		self._reload_predefined_listbox()
+		self.preset_model.set(self.edit_index, new_value)
 		
 		self.predefined_listbox.selection_set(self.edit_index)
 		self.predefined_listbox.see(self.edit_index)
@@ -832,9 +3708,7 @@ class PythonTesterApp:
 	
 	def _check_predefined_empty(self) -> None:
 		if len(self.predefined_inputs) == 0:
-			self.predefined_inputs.append("")
-			self._save_predefined_inputs()
-			self._reload_predefined_listbox()
+			self.preset_model.insert(0, "")
 			self.predefined_listbox.selection_set(0)
 	
 	def _show_hotkeys_dialog(self) -> None:
@@ -848,7 +3722,7 @@ class PythonTesterApp:
 		main_frame.pack(fill="both", expand=True)
 		
 		title_label = ttk.Label(main_frame, text="Preset Inputs - Keyboard Shortcuts", 
-								font=("TkDefaultFont", int(12 * self.zoom_level), "bold"))
+								font=self.fonts.get("main", "TkDefaultFont", 12, "bold"))
 		title_label.pack(pady=(0, 20))
 		
 		canvas = tk.Canvas(main_frame, highlightthickness=0)
@@ -876,11 +3750,11 @@ class PythonTesterApp:
 		]
 		
 		key_header = ttk.Label(scrollable_frame, text="Key Binding", 
-							   font=("TkDefaultFont", int(10 * self.zoom_level), "bold"))
+							   font=self.fonts.get("main", "TkDefaultFont", 10, "bold"))
 		key_header.grid(row=0, column=0, sticky="w", padx=(0, 20), pady=(0, 5))
 		
 		desc_header = ttk.Label(scrollable_frame, text="Action", 
-							    font=("TkDefaultFont", int(10 * self.zoom_level), "bold"))
+							    font=self.fonts.get("main", "TkDefaultFont", 10, "bold"))
 		desc_header.grid(row=0, column=1, sticky="w", pady=(0, 5))
 		
 		separator1 = ttk.Separator(scrollable_frame, orient="horizontal")
@@ -890,11 +3764,11 @@ class PythonTesterApp:
 			row_num = idx + 2
 			
 			key_label = ttk.Label(scrollable_frame, text=key, 
-								 font=("TkDefaultFont", int(9 * self.zoom_level), "bold"))
+								 font=self.fonts.get("main", "TkDefaultFont", 9, "bold"))
 			key_label.grid(row=row_num, column=0, sticky="w", padx=(0, 20), pady=5)
 			
 			desc_label = ttk.Label(scrollable_frame, text=description, 
-								  font=("TkDefaultFont", int(9 * self.zoom_level)))
+								  font="TkDefaultFont")
 			desc_label.grid(row=row_num, column=1, sticky="w", pady=5)
 		
 		canvas.pack(side="left", fill="both", expand=True)
@@ -931,12 +3805,7 @@ class PythonTesterApp:
 		if not self.predefined_inputs or index_to_use < 0:
 			return "No checklist found"
 		
-		for i in range(index_to_use, -1, -1):
-			item = self.predefined_inputs[i].strip()
-			if item.startswith("# Checklist"):
-				return item
-		
-		return "No checklist found"
+		return self.preset_model.checklist_for(min(index_to_use, len(self.predefined_inputs) - 1))
 
 	def _remove_selected_predefined(self) -> None:
 		selection = self.predefined_listbox.curselection()
@@ -944,9 +3813,7 @@ class PythonTesterApp:
 			return
 
 		index = selection[0]
-		del self.predefined_inputs[index]
-		self._save_predefined_inputs()
-		self._reload_predefined_listbox()
+		self.preset_model.delete(index)
 		
 		if len(self.predefined_inputs) > 0:
 			if index < len(self.predefined_inputs):
@@ -965,11 +3832,7 @@ class PythonTesterApp:
 		if index == 0:
 			return  # Already at the top
 
-		self.predefined_inputs[index], self.predefined_inputs[index - 1] = \
-			self.predefined_inputs[index - 1], self.predefined_inputs[index]
-		
-		self._save_predefined_inputs()
-		self._reload_predefined_listbox()
+		self.preset_model.move(index, index - 1)
 		
 		self.predefined_listbox.selection_set(index - 1)
 		self.predefined_listbox.see(index - 1)
@@ -983,11 +3846,7 @@ class PythonTesterApp:
 		if index >= len(self.predefined_inputs) - 1:
 			return  # Already at the bottom
 
-		self.predefined_inputs[index], self.predefined_inputs[index + 1] = \
-			self.predefined_inputs[index + 1], self.predefined_inputs[index]
-		
-		self._save_predefined_inputs()
-		self._reload_predefined_listbox()
+		self.preset_model.move(index, index + 1)
 		
 		self.predefined_listbox.selection_set(index + 1)
 		self.predefined_listbox.see(index + 1)
@@ -1007,18 +3866,14 @@ class PythonTesterApp:
 		
 		if not selection:
 			if len(self.predefined_inputs) == 0:
-				self.predefined_inputs.append("")
-				self._save_predefined_inputs()
-				self._reload_predefined_listbox()
+				self.preset_model.insert(0, "")
 				self.predefined_listbox.selection_set(0)
 				self.predefined_listbox.see(0)
 				self._edit_selected_predefined()
 			return
 		
 		index = selection[0]
-		self.predefined_inputs.insert(index + 1, "")
-		self._save_predefined_inputs()
-		self._reload_predefined_listbox()
+		self.preset_model.insert(index + 1, "")
 		
 		self.predefined_listbox.selection_clear(0, tk.END)
 		self.predefined_listbox.selection_set(index + 1)
@@ -1031,42 +3886,80 @@ class PythonTesterApp:
 			adjustment_str = self.points_adjust_var.get().strip()
 			adjustment = int(float(adjustment_str))  
 			
-			self.current_points += adjustment
-			self.current_points = max(0, min(100, self.current_points))
-			
-			self._update_points_display()
-			self._save_config()
+			self._record_points_adjustment(adjustment)
 		except ValueError:
 			messagebox.showerror("Invalid Input", "Please enter a valid number (e.g., -4, +5, or 3)")
 	
 	def _decrease_points(self) -> None:
 		try:
 			adjustment = int(self.points_adjust_var.get().strip())
-			self.current_points -= adjustment
-			self.current_points = max(0, min(100, self.current_points))
-			
-			checklist = self._find_associated_checklist()
-			self.points_history.append((-adjustment, checklist))
-			
-			self._update_points_display()
-			self._save_config()
+			self._record_points_adjustment(-adjustment)
 		except ValueError:
 			messagebox.showerror("Invalid Input", "Please enter a valid number between 1 and 100")
 	
 	def _increase_points(self) -> None:
 		try:
 			adjustment = int(self.points_adjust_var.get().strip())
-			self.current_points += adjustment
-			self.current_points = max(0, min(100, self.current_points))
-			
-			checklist = self._find_associated_checklist()
-			self.points_history.append((adjustment, checklist))
-			
-			self._update_points_display()
-			self._save_config()
+			self._record_points_adjustment(adjustment)
 		except ValueError:
 			messagebox.showerror("Invalid Input", "Please enter a valid number between 1 and 100")
 	
+	def _record_points_adjustment(self, adjustment: int) -> None:
+		self.current_points = max(0, min(100, self.current_points + adjustment))
+		checklist = self._find_associated_checklist()
+		self.points_history.append((adjustment, checklist))
+		self._update_points_display()
+		if self.grading_folder is not None:
+			self._write_grading_state(self.grading_state.save_points, self.grading_folder, self.current_points,
+									  self._calculate_grade(self.current_points), adjustment, checklist, self.suite.name)
+	
+	def _write_grading_state(self, write, *args) -> None:
+		"""Run a GradingStateStore write on the I/O worker, which keeps writes in click order."""
+		def on_written(future):
+			try:
+				future.result()
+			except sqlite3.Error as e:
+				print(f"Failed to save grading state: {e}")
+		
+		self.dispatcher.watch_future(self.io_executor.submit(write, *args), on_written)
+	
+	def _load_grading_state(self) -> None:
+		"""Restore points and history for the current submission folder."""
+		folder = self.submissions_dir
+		if folder == self.grading_folder or (folder is not None and folder == self.grading_load_folder):
+			return
+		first_load = self.grading_folder is None and self.grading_load_folder is None
+		# Adjustments are not saved until this folder's own state has been read.
+		self.grading_folder = None
+		self.grading_load_folder = folder
+		if folder is None:
+			return
+		
+		def on_loaded(future):
+			if self.grading_load_folder != folder:
+				return
+			self.grading_load_folder = None
+			try:
+				state = future.result()
+			except sqlite3.Error as e:
+				print(f"Failed to load grading state: {e}")
+				return
+			self.grading_folder = folder
+			if state is not None:
+				self.current_points = state.points
+				self.points_history = list(state.history)
+			else:
+				# Carry over points tracked in config.json by older versions for the folder open at startup.
+				if not first_load:
+					self.current_points = 100
+				self.points_history = []
+				self._write_grading_state(self.grading_state.save_points, folder, self.current_points,
+										  self._calculate_grade(self.current_points), None, None, self.suite.name)
+			if hasattr(self, "points_display"):
+				self._update_points_display()
+		
+		self.dispatcher.watch_future(self.io_executor.submit(self.grading_state.load, folder), on_loaded)
+	
 	def _show_points_history(self) -> None:
 		if not self.points_history:
 			messagebox.showinfo("Points History", "No point adjustments have been made yet.")
@@ -1087,10 +3980,7 @@ class PythonTesterApp:
 		text_frame = ttk.Frame(history_window)
 		text_frame.pack(fill="both", expand=True, padx=padx_val, pady=pady_val)
 		
-		base_font_size = 10
-		zoomed_font_size = int(base_font_size * self.zoom_level)
-		
-		history_text = ScrolledText(text_frame, wrap="word", font=("Consolas", zoomed_font_size))
+		history_text = ScrolledText(text_frame, wrap="word", font=self.fonts.get("main", "Consolas", 10))
 		history_text.pack(fill="both", expand=True)
 		
 		for i, (adjustment, checklist) in enumerate(self.points_history, 1):
@@ -1107,7 +3997,9 @@ class PythonTesterApp:
 		self.points_adjust_var.set("4")
 		self.points_history.clear()  
 		self._update_points_display()
-		self._save_config()
+		if self.grading_folder is not None:
+			self._write_grading_state(self.grading_state.reset, self.grading_folder, self.current_points,
+									  self._calculate_grade(self.current_points), self.suite.name)
 
 	def _update_points_display(self) -> None:
 		grade = self._calculate_grade(self.current_points)
@@ -1150,99 +4042,137 @@ class PythonTesterApp:
 		if not self.feedback_text:
 			return
 		
-		default_template = ""
-		
-		if FEEDBACK_TEMPLATE_PATH.exists():
-			try:
-				template_content = FEEDBACK_TEMPLATE_PATH.read_text(encoding="utf-8")
-			except Exception as e:
-				template_content = default_template
-				print(f"Failed to load feedback template: {e}")
-		else:
-			template_content = default_template
-			try:
-				FEEDBACK_TEMPLATE_PATH.write_text(template_content, encoding="utf-8")
-			except Exception as e:
-				print(f"Failed to create default feedback template: {e}")
+		template_content = self.suite_library.feedback_template(self.suite)
 		
 		self.feedback_text.delete("1.0", tk.END)
 		self.feedback_text.insert("1.0", template_content)
+		self.feedback_text.edit_modified(False)
 		return template_content
 	
 	def _save_feedback(self, show_message: bool = True) -> None:
-		if not self.feedback_text:
+		if not self.feedback_text or self.feedback_loading:
 			return
 		
-		if self.submissions_dir is None or not self.submissions_dir.exists():
+		if self.submissions_dir is None:
 			if show_message:
 				messagebox.showwarning("No Directory", "Please select a directory first.")
 			return
 		
 		feedback_file = self.submissions_dir / "FEEDBACK.txt"
 		feedback_content = self.feedback_text.get("1.0", "end-1c")
-		
-		try:
-			feedback_file.write_text(feedback_content, encoding="utf-8")
-			self.last_saved_feedback_content = feedback_content
-			self._update_feedback_status("Auto-saved", "gray")
+		previous_content = self.last_saved_feedback_content
+		load_id = self.feedback_load_id
+		# Assume the write succeeds so edits made while it runs are compared against
+		# what is being saved; a failure below puts the editor back to "not saved".
+		self.last_saved_feedback_content = feedback_content
+		self.feedback_dirty = False
+		self.feedback_disk_conflict = False
+		
+		def on_saved(future):
+			current = load_id == self.feedback_load_id
+			try:
+				future.result()
+			except Exception as e:
+				if current and self.last_saved_feedback_content == feedback_content:
+					self.last_saved_feedback_content = previous_content
+					self.feedback_dirty = True
+					self._update_feedback_status("Save failed", "red")
+				if show_message:
+					messagebox.showerror("Save Error", f"Failed to save feedback: {e}")
+				return
+			if current:
+				self.feedback_on_disk = True
+				if not self.feedback_dirty and not self.feedback_disk_conflict:
+					self._update_feedback_status("Auto-saved", "gray")
 			if show_message:
 				messagebox.showinfo("Feedback Saved", f"Feedback saved to:\n{feedback_file}")
-		except Exception as e:
-			if show_message:
-				messagebox.showerror("Save Error", f"Failed to save feedback: {e}")
+		
+		self.dispatcher.watch_future(self.io_executor.submit(atomic_write_text, feedback_file, feedback_content), on_saved)
 	
 	def _load_feedback_from_directory(self) -> None:
 		if not self.feedback_text:
 			return
 		
-		if self.submissions_dir is None or not self.submissions_dir.exists():
-			self._load_feedback_template()
-			self._stop_feedback_auto_check()
+		self._cancel_feedback_autosave()
+		self.feedback_dirty = False
+		self.feedback_disk_conflict = False
+		self.feedback_load_id += 1
+		load_id = self.feedback_load_id
+		self.feedback_text.config(state="normal")
+		
+		if self.submissions_dir is None:
+			self.feedback_loading = False
+			self.feedback_on_disk = False
+			self.last_saved_feedback_content = self._load_feedback_template()
+			self._update_feedback_status("", "gray")
 			return
 		
 		feedback_file = self.submissions_dir / "FEEDBACK.txt"
+		suite = self.suite
 		
-		if feedback_file.exists():
+		def read_feedback():
 			try:
-				feedback_content = feedback_file.read_text(encoding="utf-8")
-				self.feedback_text.delete("1.0", tk.END)
-				self.feedback_text.insert("1.0", feedback_content)
-				self.last_saved_feedback_content = feedback_content
-				self._update_feedback_status("Auto-saved", "gray")
-				self._start_feedback_auto_check()
+				return self.artifacts.text(feedback_file), True
+			except FileNotFoundError:
+				return self.suite_library.feedback_template(suite), False
+		
+		def on_feedback_read(future):
+			if load_id != self.feedback_load_id:
+				return
+			self.feedback_loading = False
+			self.feedback_text.config(state="normal")
+			try:
+				feedback_content, on_disk = future.result()
 			except Exception as e:
 				print(f"Failed to load feedback from directory: {e}")
+				self.feedback_on_disk = True
 				self._load_feedback_template()
 				self.last_saved_feedback_content = ""
-				self._start_feedback_auto_check()
-		else:
-			content = self._load_feedback_template()
-			self.last_saved_feedback_content = content
-			self._update_feedback_status("", "gray")
-			self._start_feedback_auto_check()
+				self._update_feedback_status("", "gray")
+				return
+			self.feedback_on_disk = on_disk
+			self.feedback_text.delete("1.0", tk.END)
+			self.feedback_text.insert("1.0", feedback_content)
+			self.feedback_text.edit_modified(False)
+			self.last_saved_feedback_content = feedback_content
+			self._update_feedback_status("Auto-saved" if on_disk else "", "gray")
+		
+		self.feedback_loading = True
+		self.feedback_text.delete("1.0", tk.END)
+		self.feedback_text.edit_modified(False)
+		self.feedback_text.config(state="disabled")
+		self._update_feedback_status("Loading...", "gray")
+		self.dispatcher.watch_future(self.io_executor.submit(read_feedback), on_feedback_read)
 	
 	def _reset_feedback(self) -> None:
+		if self.feedback_loading:
+			return
 		self._load_feedback_template()
+		self._cancel_feedback_autosave()
 		self._save_feedback(show_message=False)
-		if self.submissions_dir and (self.submissions_dir / "FEEDBACK.txt").exists():
-			self._start_feedback_auto_check()
 	
 	def _refresh_feedback(self) -> None:
-		if not self.feedback_text:
+		if not self.feedback_text or self.feedback_loading:
 			return
 		
-		if self.submissions_dir is None or not self.submissions_dir.exists():
+		if self.submissions_dir is None:
 			messagebox.showwarning("No Directory", "Please select a directory first.")
 			return
 		
 		feedback_file = self.submissions_dir / "FEEDBACK.txt"
+		load_id = self.feedback_load_id
 		
-		if not feedback_file.exists():
-			messagebox.showinfo("No File", "No FEEDBACK.txt file found in the directory.")
-			return
-		
-		try:
-			file_content = feedback_file.read_text(encoding="utf-8")
+		def on_file_read(future):
+			if load_id != self.feedback_load_id:
+				return
+			try:
+				file_content = future.result()
+			except FileNotFoundError:
+				messagebox.showinfo("No File", "No FEEDBACK.txt file found in the directory.")
+				return
+			except Exception as e:
+				messagebox.showerror("Load Error", f"Failed to load feedback: {e}")
+				return
 			current_content = self.feedback_text.get("1.0", "end-1c")
 			
 			if file_content != current_content:
@@ -1251,71 +4181,111 @@ class PythonTesterApp:
 					"The content in the textbox differs from the file.\nDo you want to load from file? (Current changes will be lost)"
 				)
 				if response:
+					self._cancel_feedback_autosave()
+					self.last_saved_feedback_content = file_content
+					self.feedback_dirty = False
+					self.feedback_disk_conflict = False
+					self.feedback_on_disk = True
 					self.feedback_text.delete("1.0", tk.END)
 					self.feedback_text.insert("1.0", file_content)
-					self.last_saved_feedback_content = file_content
+					self.feedback_text.edit_modified(False)
 					self._update_feedback_status("Auto-saved", "gray")
 			else:
 				messagebox.showinfo("No Changes", "The content matches the file. No refresh needed.")
-		except Exception as e:
-			messagebox.showerror("Load Error", f"Failed to load feedback: {e}")
+		
+		self.dispatcher.watch_future(self.io_executor.submit(feedback_file.read_text, encoding="utf-8"), on_file_read)
+	
+	def _on_feedback_file_changed(self, feedback_file: Path) -> None:
+		if not self.feedback_text or self.feedback_loading:
+			return
+		load_id = self.feedback_load_id
+		
+		def on_file_read(future):
+			if load_id != self.feedback_load_id or self.feedback_loading:
+				return
+			try:
+				file_content = future.result()
+			except FileNotFoundError:
+				self.feedback_on_disk = False
+				self._update_feedback_status("", "gray")
+				return
+			except (OSError, UnicodeDecodeError):
+				return
+			self.feedback_on_disk = True
+			self._apply_feedback_file_change(file_content)
+		
+		self.dispatcher.watch_future(self.io_executor.submit(feedback_file.read_text, encoding="utf-8"), on_file_read)
+	
+	def _apply_feedback_file_change(self, file_content: str) -> None:
+		if file_content == self.last_saved_feedback_content:
+			return
+		
+		if not self.feedback_dirty:
+			scroll_position = self.feedback_text.yview()[0]
+			self.last_saved_feedback_content = file_content
+			self.feedback_text.delete("1.0", tk.END)
+			self.feedback_text.insert("1.0", file_content)
+			self.feedback_text.edit_modified(False)
+			self.feedback_text.yview_moveto(scroll_position)
+			self._update_feedback_status("Reloaded from disk", "gray")
+		else:
+			# Keep the local edits but stop autosaving over the external change until the
+			# user either saves explicitly or refreshes from the file.
+			self.feedback_disk_conflict = True
+			self._cancel_feedback_autosave()
+			self._update_feedback_status("Changed on disk - Save or Refresh", "red")
 	
 	def _on_feedback_modified(self, event=None) -> None:
-		if not self.feedback_text:
+		if not self.feedback_text or not self.feedback_text.edit_modified():
 			return
+		self.feedback_text.edit_modified(False)
 		
-		if self.feedback_text.edit_modified():
-			current_content = self.feedback_text.get("1.0", "end-1c")
-			if current_content != self.last_saved_feedback_content:
-				if self.submissions_dir and (self.submissions_dir / "FEEDBACK.txt").exists():
+		if self.submissions_dir is None:
+			return
+		if not self.feedback_dirty:
+			self.feedback_dirty = True
+			if not self.feedback_disk_conflict:
+				if self.feedback_on_disk:
 					self._update_feedback_status("Not saved", "red")
 				else:
-					if self.submissions_dir is not None:
-						self._update_feedback_status("Feedback has not been saved", "red")
-			else:
-				if self.submissions_dir and (self.submissions_dir / "FEEDBACK.txt").exists():
-					self._update_feedback_status("Auto-saved", "gray")
-				else:
-					self._update_feedback_status("", "gray")
-			self.feedback_text.edit_modified(False)
+					self._update_feedback_status("Feedback has not been saved", "red")
+		if self.feedback_disk_conflict:
+			return
+		
+		self._cancel_feedback_autosave()
+		self.feedback_save_job = self.root.after(FEEDBACK_AUTOSAVE_DELAY_MS, self._autosave_feedback)
 	
 	def _update_feedback_status(self, text: str, color: str) -> None:
 		if self.feedback_status_label:
 			self.feedback_status_label.config(text=text, fg=color)
 	
-	def _start_feedback_auto_check(self) -> None:
-		self._stop_feedback_auto_check()
-		self._schedule_feedback_check()
-	
-	def _stop_feedback_auto_check(self) -> None:
-		if self.feedback_auto_check_job:
-			self.root.after_cancel(self.feedback_auto_check_job)
-			self.feedback_auto_check_job = None
-			self._update_feedback_status("", "gray")
+	def _cancel_feedback_autosave(self) -> None:
+		if self.feedback_save_job:
+			self.root.after_cancel(self.feedback_save_job)
+			self.feedback_save_job = None
 	
-	def _schedule_feedback_check(self) -> None:
-		self._check_and_auto_save_feedback()
-		self.feedback_auto_check_job = self.root.after(5000, self._schedule_feedback_check)
+	def _flush_feedback_autosave(self) -> None:
+		"""Save pending feedback edits now (before switching folders or closing)."""
+		if self.feedback_save_job:
+			self._cancel_feedback_autosave()
+			self._autosave_feedback()
 	
-	def _check_and_auto_save_feedback(self) -> None:
-		if not self.feedback_text or self.submissions_dir is None or not self.submissions_dir.exists():
+	def _autosave_feedback(self) -> None:
+		self.feedback_save_job = None
+		if not self.feedback_text or self.feedback_disk_conflict or self.feedback_loading:
+			return
+		if self.submissions_dir is None:
 			return
 		
-		feedback_file = self.submissions_dir / "FEEDBACK.txt"
-		file_exists = feedback_file.exists()
-		
-		try:
-			current_content = self.feedback_text.get("1.0", "end-1c")
-			
-			if current_content != self.last_saved_feedback_content:
-				self._save_feedback(show_message=False)
+		current_content = self.feedback_text.get("1.0", "end-1c")
+		if current_content != self.last_saved_feedback_content:
+			self._save_feedback(show_message=False)
+		else:
+			self.feedback_dirty = False
+			if self.feedback_on_disk:
+				self._update_feedback_status("Auto-saved", "gray")
 			else:
-				if file_exists:
-					self._update_feedback_status("Auto-saved", "gray")
-				else:
-					self._update_feedback_status("", "gray")
-		except Exception as e:
-			print(f"Failed to auto-check feedback: {e}")
+				self._update_feedback_status("", "gray")
 	
 	def _toggle_feedback_collapse(self) -> None:
 		if self.feedback_collapsed:
@@ -1328,19 +4298,15 @@ class PythonTesterApp:
 			self.feedback_collapsed = True
 
 	def _load_predefined_inputs(self) -> None:
-		if PREDEFINED_INPUTS_PATH.exists():
-			try:
-				data = json.loads(PREDEFINED_INPUTS_PATH.read_text(encoding="utf-8"))
-				if isinstance(data, list):
-					self.predefined_inputs = [str(item) for item in data]
-			except json.JSONDecodeError:
-				messagebox.showwarning(
-					"Predefined Inputs",
-					"The predefined inputs file is corrupted. Starting with an empty list.",
-				)
-				self.predefined_inputs = []
-		else:
+		try:
+			self.predefined_inputs = self.suite_library.load_inputs(self.suite)
+		except json.JSONDecodeError:
+			messagebox.showwarning(
+				"Predefined Inputs",
+				"The predefined inputs file is corrupted. Starting with an empty list.",
+			)
 			self.predefined_inputs = []
+			self.suite_library.set_inputs(self.suite, self.predefined_inputs)
 		
 		if len(self.predefined_inputs) == 0:
 			self.predefined_inputs.append("")
@@ -1368,6 +4334,7 @@ class PythonTesterApp:
 				return
 			
 			self.predefined_inputs = [str(item) for item in data]
+			self.suite_library.set_inputs(self.suite, self.predefined_inputs)
 			self._save_predefined_inputs()
 			self._reload_predefined_listbox()
 			messagebox.showinfo("Import Success", f"Imported {len(self.predefined_inputs)} items.")
@@ -1396,6 +4363,57 @@ class PythonTesterApp:
 		except Exception as e:
 			messagebox.showerror("Export Error", f"Failed to export file: {e}")
 	
+	def _preset_inputs_title(self) -> str:
+		if self.suite.name == DEFAULT_SUITE_NAME:
+			return "Preset Inputs"
+		return f"Preset Inputs - {self.suite.name}"
+	
+	def _populate_suite_menu(self) -> None:
+		"""Rebuilt each time the menu opens, so suite folders added on disk show up."""
+		self.suite_menu.delete(0, tk.END)
+		for name in self.suite_library.names():
+			self.suite_menu.add_radiobutton(label=name, value=name, variable=self.suite_var,
+											command=lambda name=name: self._switch_suite(name))
+		self.suite_menu.add_separator()
+		self.suite_menu.add_command(label="New Suite...", command=self._new_suite)
+	
+	def _switch_suite(self, name: str) -> None:
+		"""Make another suite's inputs, data files and feedback template the active ones."""
+		self.suite_var.set(name)
+		if name == self.suite.name:
+			return
+		if self.edit_entry:
+			self._finish_edit()
+		self.suite = self.suite_library.get(name)
+		self.predefined_inputs_store.retarget(self.suite.inputs_path)
+		self._load_predefined_inputs()
+		self.last_accessed_preset_index = -1
+		self.last_sent_preset_index = -1
+		self.preset_sidebar.config(text=self._preset_inputs_title())
+		
+		# A submission without saved feedback shows the template, which now belongs to the new suite.
+		# feedback_on_disk is what the last read found, so this needs no filesystem check here;
+		# a read still in flight started with the old suite's template and is simply restarted.
+		if not self.feedback_dirty and (self.feedback_loading or not self.feedback_on_disk):
+			self._load_feedback_from_directory()
+		self._save_config()
+	
+	def _new_suite(self) -> None:
+		name = simpledialog.askstring("New Test Suite",
+									  f"Name of the new suite (starts as a copy of \"{self.suite.name}\"):", parent=self.root)
+		if not name:
+			return
+		self.predefined_inputs_store.flush()
+		try:
+			suite = self.suite_library.create(name, self.suite)
+		except ValueError as e:
+			messagebox.showerror("New Test Suite", str(e))
+			return
+		except OSError as e:
+			messagebox.showerror("New Test Suite", f"Failed to create suite: {e}")
+			return
+		self._switch_suite(suite.name)
+	
 	def _extract_submissions(self) -> None:
 		extract_window = tk.Toplevel(self.root)
 		extract_window.title("Extract Submissions")
@@ -1507,68 +4525,83 @@ class PythonTesterApp:
 				return
 			
 			progress_var.set(f"Found {len(matched_files)} new submission(s). Extracting...")
-			extract_window.update()
-			
-			success_count = 0
-			error_count = 0
-			error_files = []
-			current_count = max_count
+			extract_button.config(state="disabled")
 			skipped_count = len(zip_files) - len(matched_files)
 			
-			for zip_file, name in matched_files:
-				try:
-					current_count += 1
-					temp_extract_path = dest_path / f"_temp_{name}"
-					
-					with zipfile.ZipFile(zip_file, 'r') as zip_ref:
-						zip_ref.extractall(temp_extract_path)
-					
-					top_dir = temp_extract_path / "top"
-					
-					if top_dir.exists() and top_dir.is_dir():
-						final_dest = dest_path / f"{current_count} - {name}"
+			def report_progress(text):
+				if extract_window.winfo_exists():
+					progress_var.set(text)
+			
+			def extraction_worker():
+				success_count = 0
+				error_count = 0
+				error_files = []
+				current_count = max_count
+				
+				for zip_file, name in matched_files:
+					try:
+						current_count += 1
+						temp_extract_path = dest_path / f"_temp_{name}"
 						
-						if final_dest.exists():
-							shutil.rmtree(final_dest)
+						with zipfile.ZipFile(zip_file, 'r') as zip_ref:
+							zip_ref.extractall(temp_extract_path)
 						
-						shutil.move(str(top_dir), str(final_dest))
-						success_count += 1
-					else:
+						top_dir = temp_extract_path / "top"
+						
+						if top_dir.exists() and top_dir.is_dir():
+							final_dest = dest_path / f"{current_count} - {name}"
+							
+							if final_dest.exists():
+								shutil.rmtree(final_dest)
+							
+							shutil.move(str(top_dir), str(final_dest))
+							success_count += 1
+						else:
+							error_count += 1
+							error_files.append(f"{zip_file.name} (no 'top' directory)")
+							print(f"Warning: 'top' directory not found in {zip_file.name}")
+						
+						if temp_extract_path.exists():
+							shutil.rmtree(temp_extract_path)
+						
+						self.dispatcher.post(EVENT_TASK_PROGRESS,
+											 f"Processing: {success_count + error_count}/{len(matched_files)}",
+											 report_progress)
+						
+					except Exception as e:
 						error_count += 1
-						error_files.append(f"{zip_file.name} (no 'top' directory)")
-						print(f"Warning: 'top' directory not found in {zip_file.name}")
-					
-					if temp_extract_path.exists():
-						shutil.rmtree(temp_extract_path)
-					
-					progress_var.set(f"Processing: {success_count + error_count}/{len(matched_files)}")
-					extract_window.update()
-					
-				except Exception as e:
-					error_count += 1
-					error_files.append(f"{zip_file.name} ({str(e)})")
-					print(f"Error extracting {zip_file.name}: {e}")
-			
-			progress_var.set(f"Complete! Success: {success_count}, Errors: {error_count}, Skipped: {skipped_count}")
+						error_files.append(f"{zip_file.name} ({str(e)})")
+						print(f"Error extracting {zip_file.name}: {e}")
+				
+				self.dispatcher.post(EVENT_TASK_DONE, (success_count, error_count, error_files), finish_extraction)
 			
-			message = f"Successfully extracted: {success_count}\n"
-			if error_count > 0:
-				message += f"\nErrors: {error_count}\n"
-				message += "\nFailed files:\n"
-				for error_file in error_files:
-					message += f"  • {error_file}\n"
-			if skipped_count > 0:
-				message += f"\nSkipped (already exist): {skipped_count}\n"
-			message += f"\nDestination: {dest_dir}"
+			def finish_extraction(result):
+				success_count, error_count, error_files = result
+				if extract_window.winfo_exists():
+					progress_var.set(f"Complete! Success: {success_count}, Errors: {error_count}, Skipped: {skipped_count}")
+					extract_button.config(state="normal")
+				
+				message = f"Successfully extracted: {success_count}\n"
+				if error_count > 0:
+					message += f"\nErrors: {error_count}\n"
+					message += "\nFailed files:\n"
+					for error_file in error_files:
+						message += f"  • {error_file}\n"
+				if skipped_count > 0:
+					message += f"\nSkipped (already exist): {skipped_count}\n"
+				message += f"\nDestination: {dest_dir}"
+				
+				messagebox.showinfo("Extraction Complete", message)
 			
-			messagebox.showinfo("Extraction Complete", message)
+			threading.Thread(target=extraction_worker, daemon=True).start()
 		
-		ttk.Button(button_frame, text="Extract", command=start_extraction, width=15).pack(side="left", padx=5)
+		extract_button = ttk.Button(button_frame, text="Extract", command=start_extraction, width=15)
+		extract_button.pack(side="left", padx=5)
 		ttk.Button(button_frame, text="Cancel", command=extract_window.destroy, width=15).pack(side="left", padx=5)
 
 	def _open_settings(self) -> None:
 		settings_window = tk.Toplevel(self.root)
-		settings_window.title("Settings")
+		settings_window.title(f"Settings - {self.suite.name} suite")
 		settings_window.transient(self.root)
 		settings_window.grab_set()
 		self._center_window_on_parent(settings_window, 600, 500)
@@ -1592,10 +4625,12 @@ class PythonTesterApp:
 		data_listbox.pack(side="left", fill="both", expand=True)
 		scrollbar.config(command=data_listbox.yview)
 		
+		data_dir = self.suite.data_dir
+		
 		def refresh_data_files():
 			data_listbox.delete(0, tk.END)
-			if DATA_DIR.exists():
-				for file in sorted(DATA_DIR.glob("*.txt")):
+			if data_dir.exists():
+				for file in sorted(data_dir.glob("*.txt")):
 					if file.name != "feedback_template.txt":  
 						data_listbox.insert(tk.END, file.name)
 		
@@ -1612,7 +4647,8 @@ class PythonTesterApp:
 			if file_path:
 				try:
 					source = Path(file_path)
-					dest = DATA_DIR / source.name
+					data_dir.mkdir(parents=True, exist_ok=True)
+					dest = data_dir / source.name
 					shutil.copy(source, dest)
 					refresh_data_files()
 				except Exception as e:
@@ -1625,7 +4661,7 @@ class PythonTesterApp:
 				return
 			
 			filename = data_listbox.get(selection[0])
-			file_path = DATA_DIR / filename
+			file_path = data_dir / filename
 			
 			if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete {filename}?"):
 				try:
@@ -1652,21 +4688,14 @@ class PythonTesterApp:
 		template_text = ScrolledText(template_text_frame, wrap="word", height=15, font=("TkDefaultFont", 11))
 		template_text.pack(fill="both", expand=True)
 		
-		default_template = " "
-		if FEEDBACK_TEMPLATE_PATH.exists():
-			try:
-				template_content = FEEDBACK_TEMPLATE_PATH.read_text(encoding="utf-8")
-			except Exception as e:
-				template_content = default_template
-		else:
-			template_content = default_template
+		template_content = self.suite_library.feedback_template(self.suite)
 		
 		template_text.insert("1.0", template_content)
 		
 		def save_template():
 			try:
 				new_template = template_text.get("1.0", "end-1c")
-				FEEDBACK_TEMPLATE_PATH.write_text(new_template, encoding="utf-8")
+				self.suite_library.save_feedback_template(self.suite, new_template)
 				messagebox.showinfo("Success", "Feedback template saved successfully!")
 				if self.feedback_text:
 					self._load_feedback_template()
@@ -1680,40 +4709,56 @@ class PythonTesterApp:
 		close_button.pack(pady=10)
 	
 	def _reset_files(self) -> None:
-		if not DATA_DIR.exists() or not list(DATA_DIR.glob("*.txt")):
-			messagebox.showwarning("No Data Files", "No stored data files found. Please add files in Settings.")
-			return
-		
 		if self.submissions_dir is None:
 			messagebox.showwarning("No Directory", "Please browse and select a directory first.")
 			return
 		
-		if not self.submissions_dir.exists():
-			messagebox.showerror("Error", 
-				f"The directory {self.submissions_dir} no longer exists.\nPlease browse for a new directory.")
-			self.submissions_dir = None
-			self._save_config()
-			return
+		folder = self.submissions_dir
+		data_dir = self.suite.data_dir
 		
-		message = "This will delete matching files in the current directory and copy stored data files. Continue?"
-		if not messagebox.askyesno("Confirm Reset", message):
-			return
+		def check():
+			data_files = sorted(data_dir.glob("*.txt")) if data_dir.is_dir() else []
+			return data_files, folder.is_dir()
 		
-		try:
-			for data_file in DATA_DIR.glob("*.txt"):
-				target_file = self.submissions_dir / data_file.name
+		def reset(data_files):
+			for data_file in data_files:
+				target_file = folder / data_file.name
 				if target_file.exists():
 					target_file.unlink()
+			for data_file in data_files:
+				shutil.copy(data_file, folder / data_file.name)
+			return len(data_files)
+		
+		def on_reset(future):
+			try:
+				copied_count = future.result()
+			except Exception as e:
+				messagebox.showerror("Error", f"Failed to reset files: {e}")
+				return
+			messagebox.showinfo("Success", f"Reset complete. Copied {copied_count} file(s) to:\n{folder}")
+		
+		def on_checked(future):
+			try:
+				data_files, folder_exists = future.result()
+			except OSError as e:
+				messagebox.showerror("Error", f"Failed to reset files: {e}")
+				return
+			if not data_files:
+				messagebox.showwarning("No Data Files", "No stored data files found. Please add files in Settings.")
+				return
+			if not folder_exists:
+				messagebox.showerror("Error", 
+					f"The directory {folder} no longer exists.\nPlease browse for a new directory.")
+				if self.submissions_dir == folder:
+					self.submissions_dir = None
+					self._save_config()
+				return
 			
-			copied_count = 0
-			for data_file in DATA_DIR.glob("*.txt"):
-				dest = self.submissions_dir / data_file.name
-				shutil.copy(data_file, dest)
-				copied_count += 1
-			
-			messagebox.showinfo("Success", f"Reset complete. Copied {copied_count} file(s) to:\n{self.submissions_dir}")
-		except Exception as e:
-			messagebox.showerror("Error", f"Failed to reset files: {e}")
+			message = "This will delete matching files in the current directory and copy stored data files. Continue?"
+			if messagebox.askyesno("Confirm Reset", message):
+				self.dispatcher.watch_future(self.io_executor.submit(reset, data_files), on_reset)
+		
+		self.dispatcher.watch_future(self.io_executor.submit(check), on_checked)
 
 	def _open_code_viewer(self) -> None:
 		if self.submissions_dir is None:
@@ -1726,16 +4771,30 @@ class PythonTesterApp:
 			return
 		
 		script_path = self.submissions_dir / selected_file
-		if not script_path.exists():
-			messagebox.showerror("File Missing", f"Could not find {selected_file}.")
-			return
 		
-		try:
-			code_content = script_path.read_text(encoding="utf-8")
-		except Exception as e:
-			messagebox.showerror("Error", f"Failed to read file: {e}")
-			return
+		def read_code():
+			code_content = self.artifacts.text(script_path)
+			content_key = HighlightCache.content_hash(code_content)
+			cached = self.highlight_cache.get(content_key)
+			if cached is None or "line_offsets" not in cached:
+				cached = {"line_offsets": HighlightCache.build_line_offsets(code_content)}
+				self.highlight_cache.put(content_key, cached)
+			return code_content, content_key, cached
+		
+		def on_code_read(future):
+			try:
+				code_content, content_key, cached = future.result()
+			except FileNotFoundError:
+				messagebox.showerror("File Missing", f"Could not find {selected_file}.")
+				return
+			except Exception as e:
+				messagebox.showerror("Error", f"Failed to read file: {e}")
+				return
+			self._show_code_viewer(selected_file, code_content, content_key, cached)
 		
+		self.dispatcher.watch_future(self.io_executor.submit(read_code), on_code_read)
+	
+	def _show_code_viewer(self, selected_file: str, code_content: str, content_key: str, cached: dict) -> None:
 		viewer = tk.Toplevel(self.root)
 		viewer.title(f"Code Viewer - {selected_file}")
 		
@@ -1750,13 +4809,8 @@ class PythonTesterApp:
 		viewer.geometry(f"{window_width}x{window_height - 80}+{main_x}+{main_y}")
 		viewer.configure(bg="#1E1E1E")
 		
-		viewer.zoom_level = self.code_viewer_zoom
-		
-		open_count = code_content.count('open(')
-		close_count = code_content.count('.close(')
-		is_balanced = open_count == close_count
-		counter_bg = "#2D5016" if is_balanced else "#5A1A1A"  
-		counter_fg = "#90EE90" if is_balanced else "#FF6B6B"  
+		code_font = self.fonts.get("code", "Consolas", 10)
+		search_font = self.fonts.get("code", "Consolas", 9)
 		
 		top_bar = tk.Frame(viewer, bg="#1E1E1E")
 		top_bar.pack(fill="x", padx=5, pady=(5, 0))
@@ -1764,32 +4818,45 @@ class PythonTesterApp:
 		search_frame = tk.Frame(top_bar, bg="#1E1E1E")
 		search_frame.pack(side="left", padx=5)
 		
-		initial_search_font_size = int(9 * viewer.zoom_level)
-		
-		search_label = tk.Label(search_frame, text="Search:", bg="#1E1E1E", fg="#D4D4D4", font=("Consolas", initial_search_font_size))
+		search_label = tk.Label(search_frame, text="Search:", bg="#1E1E1E", fg="#D4D4D4", font=search_font)
 		search_label.pack(side="left", padx=(0, 5))
 		
 		search_entry = tk.Entry(search_frame, bg="#3C3C3C", fg="#D4D4D4", insertbackground="#FFFFFF", 
-								font=("Consolas", initial_search_font_size), width=20, relief="solid", borderwidth=1)
+								font=search_font, width=20, relief="solid", borderwidth=1)
 		search_entry.pack(side="left", padx=(0, 5))
 		
 		search_result_label = tk.Label(search_frame, text="0/0", bg="#1E1E1E", fg="#858585", 
-								   font=("Consolas", initial_search_font_size), width=8)
+								   font=search_font, width=8)
 		search_result_label.pack(side="left", padx=(0, 5))
 		
 		prev_button = tk.Button(search_frame, text="◀", bg="#3C3C3C", fg="#D4D4D4", 
-								font=("Consolas", initial_search_font_size), width=3, relief="solid", borderwidth=1)
+								font=search_font, width=3, relief="solid", borderwidth=1)
 		prev_button.pack(side="left", padx=(0, 2))
 		
 		next_button = tk.Button(search_frame, text="▶", bg="#3C3C3C", fg="#D4D4D4", 
-								font=("Consolas", initial_search_font_size), width=3, relief="solid", borderwidth=1)
+								font=search_font, width=3, relief="solid", borderwidth=1)
 		next_button.pack(side="left")
 		
+		whole_word_var = tk.BooleanVar(value=False)
+		regex_var = tk.BooleanVar(value=False)
+		
+		whole_word_check = tk.Checkbutton(search_frame, text="Word", variable=whole_word_var, bg="#1E1E1E", fg="#D4D4D4",
+										  selectcolor="#3C3C3C", activebackground="#1E1E1E", activeforeground="#FFFFFF",
+										  font=search_font)
+		whole_word_check.pack(side="left", padx=(8, 0))
+		ToolTip(whole_word_check, "Match whole words only")
+		
+		regex_check = tk.Checkbutton(search_frame, text=".*", variable=regex_var, bg="#1E1E1E", fg="#D4D4D4",
+									 selectcolor="#3C3C3C", activebackground="#1E1E1E", activeforeground="#FFFFFF",
+									 font=search_font)
+		regex_check.pack(side="left")
+		ToolTip(regex_check, "Regular expression")
+		
 		counter_label = tk.Label(top_bar, 
-								 text=f"open(): {open_count} | close(): {close_count}",
-								 bg=counter_bg,
-								 fg=counter_fg,
-								 font=("Consolas", int(10 * viewer.zoom_level), "bold"),
+								 text="open(): … | closed: …",
+								 bg="#3C3C3C",
+								 fg="#D4D4D4",
+								 font=self.fonts.get("code", "Consolas", 10, "bold"),
 								 padx=10,
 								 pady=5,
 								 relief="solid",
@@ -1808,11 +4875,9 @@ class PythonTesterApp:
 		h_scrollbar = tk.Scrollbar(frame, orient="horizontal", bg="#252526", troughcolor="#1E1E1E")
 		h_scrollbar.pack(side="bottom", fill="x")
 		
-		initial_font_size = int(10 * viewer.zoom_level)
-		
 		line_numbers = tk.Text(text_frame, wrap="none",
 							   width=5,
-							   font=("Consolas", initial_font_size),
+							   font=code_font,
 							   bg="#1E1E1E",
 							   fg="#858585",  
 							   state="disabled",
@@ -1825,7 +4890,7 @@ class PythonTesterApp:
 		text_widget = tk.Text(text_frame, wrap="none", 
 							  yscrollcommand=v_scrollbar.set,
 							  xscrollcommand=h_scrollbar.set,
-							  font=("Consolas", initial_font_size),
+							  font=code_font,
 							  bg="#1E1E1E",
 							  fg="#D4D4D4",
 							  insertbackground="#FFFFFF",
@@ -1838,6 +4903,8 @@ class PythonTesterApp:
 		def on_text_scroll(*args):
 			line_numbers.yview_moveto(args[0])
 			v_scrollbar.set(*args)
+			if hasattr(viewer, "highlighter"):
+				viewer.highlighter.on_scroll()
 		
 		text_widget.config(yscrollcommand=on_text_scroll)
 		v_scrollbar.config(command=lambda *args: (text_widget.yview(*args), line_numbers.yview(*args)))
@@ -1850,59 +4917,71 @@ class PythonTesterApp:
 		line_numbers.insert("1.0", "\n".join(str(i) for i in range(1, num_lines + 1)))
 		line_numbers.config(state="disabled")
 		
-		self._apply_python_syntax_highlighting(text_widget, code_content)
 		text_widget.config(state="disabled")
 		
+		highlighter = LazySyntaxHighlighter(
+			text_widget, code_content,
+			line_spans=cached.get("line_spans"),
+			on_complete=lambda h: self.highlight_cache.put(content_key, {"line_spans": h.line_spans}),
+			comment_font=self.fonts.get("code", "Consolas", 10, slant="italic"))
+		viewer.highlighter = highlighter
+		viewer.line_offsets = cached["line_offsets"]
+		
 		viewer.search_matches = []
 		viewer.current_match = -1
 		text_widget.tag_config("search_highlight", background="#FFA500", foreground="#000000")
 		text_widget.tag_config("current_search_highlight", background="#FF4500", foreground="#FFFFFF")
 		
+		search_index = SourceSearchIndex(code_content, viewer.line_offsets)
+		viewer.search_job = None
+		
 		def perform_search(event=None):
-			search_term = search_entry.get()
-			
-			text_widget.tag_remove("search_highlight", "1.0", tk.END)
-			text_widget.tag_remove("current_search_highlight", "1.0", tk.END)
-			viewer.search_matches = []
-			viewer.current_match = -1
-			
-			if not search_term:
-				search_result_label.config(text="0/0")
-				return
+			if viewer.search_job is not None:
+				viewer.after_cancel(viewer.search_job)
+				viewer.search_job = None
 			
-			start_pos = "1.0"
-			search_term_lower = search_term.lower()
+			search_term = search_entry.get()
+			try:
+				hits = search_index.find(search_term, whole_word_var.get(), regex_var.get())
+				invalid_pattern = False
+			except re.error:
+				hits = []
+				invalid_pattern = True
 			
-			while True:
-				pos = text_widget.search(search_term_lower, start_pos, stopindex=tk.END, nocase=True)
-				if not pos:
-					break
+			matches = [(search_index.to_index(start), search_index.to_index(end)) for start, end in hits]
+			if matches != viewer.search_matches:
+				text_widget.tag_remove("search_highlight", "1.0", tk.END)
+				text_widget.tag_remove("current_search_highlight", "1.0", tk.END)
+				viewer.search_matches = matches
+				viewer.current_match = -1
 				
-				end_pos = f"{pos}+{len(search_term)}c"
-				viewer.search_matches.append(pos)
-				text_widget.tag_add("search_highlight", pos, end_pos)
-				start_pos = end_pos
+				if matches:
+					text_widget.tag_add("search_highlight", *(index for match in matches for index in match))
+					viewer.current_match = 0
+					highlight_current_match()
 			
-			total_matches = len(viewer.search_matches)
-			if total_matches > 0:
-				viewer.current_match = 0
-				highlight_current_match()
-				search_result_label.config(text=f"1/{total_matches}")
-			else:
-				search_result_label.config(text="0/0")
+			if invalid_pattern:
+				search_result_label.config(text="regex?", fg="#FF6B6B")
+			elif not matches:
+				search_result_label.config(text="0/0", fg="#858585")
+		
+		def schedule_search(event=None):
+			if event is not None and event.keysym in ("Return", "KP_Enter"):
+				return
+			if viewer.search_job is not None:
+				viewer.after_cancel(viewer.search_job)
+			viewer.search_job = viewer.after(150, perform_search)
 		
 		def highlight_current_match():
 			if viewer.current_match >= 0 and viewer.current_match < len(viewer.search_matches):
 				text_widget.tag_remove("current_search_highlight", "1.0", tk.END)
 				
-				pos = viewer.search_matches[viewer.current_match]
-				search_term = search_entry.get()
-				end_pos = f"{pos}+{len(search_term)}c"
+				pos, end_pos = viewer.search_matches[viewer.current_match]
 				text_widget.tag_add("current_search_highlight", pos, end_pos)
 				
 				text_widget.see(pos)
 				
-				search_result_label.config(text=f"{viewer.current_match + 1}/{len(viewer.search_matches)}")
+				search_result_label.config(text=f"{viewer.current_match + 1}/{len(viewer.search_matches)}", fg="#858585")
 		
 		def next_match():
 			if len(viewer.search_matches) > 0:
@@ -1915,147 +4994,731 @@ class PythonTesterApp:
 				highlight_current_match()
 		
 		search_entry.bind("<Return>", perform_search)
-		search_entry.bind("<KeyRelease>", perform_search)
+		search_entry.bind("<KeyRelease>", schedule_search)
+		whole_word_check.config(command=perform_search)
+		regex_check.config(command=perform_search)
 		next_button.config(command=next_match)
 		prev_button.config(command=prev_match)
 		
-		def apply_code_viewer_zoom():
-			base_font_size = 10
-			new_font_size = int(base_font_size * viewer.zoom_level)
-			search_font_size = int(9 * viewer.zoom_level)
-			text_widget.configure(font=("Consolas", new_font_size))
-			line_numbers.configure(font=("Consolas", new_font_size))
-			counter_label.configure(font=("Consolas", new_font_size, "bold"))
-			search_label.configure(font=("Consolas", search_font_size))
-			search_entry.configure(font=("Consolas", search_font_size))
-			search_result_label.configure(font=("Consolas", search_font_size))
-			prev_button.configure(font=("Consolas", search_font_size))
-			next_button.configure(font=("Consolas", search_font_size))
+		self._bind_viewer_zoom(viewer, "code")
+		
+		def on_code_viewer_close():
+			highlighter.cancel()
+			viewer.destroy()
+		
+		viewer.protocol("WM_DELETE_WINDOW", on_code_viewer_close)
+		viewer.update_idletasks()
+		highlighter.start()
+		text_widget.tag_raise("search_highlight")
+		text_widget.tag_raise("current_search_highlight")
+		
+		def show_resource_report(report: ResourceReport):
+			if not viewer.winfo_exists():
+				return
+			counter_label.config(text=report.summary(),
+								 bg="#2D5016" if report.is_balanced else "#5A1A1A",
+								 fg="#90EE90" if report.is_balanced else "#FF6B6B")
+			highlighter.mark_resource_lines(report)
+			text_widget.tag_raise("search_highlight")
+			text_widget.tag_raise("current_search_highlight")
+		
+		self._request_resource_analysis(code_content, content_key, show_resource_report)
+	
+	def _request_resource_analysis(self, code: str, content_key: str, callback) -> None:
+		cached = self.highlight_cache.get(content_key)
+		if cached is not None and "resources" in cached:
+			callback(ResourceReport.from_dict(cached["resources"]))
+			return
+		
+		def on_analysis_done(future):
+			try:
+				report = future.result()
+			except Exception as e:
+				print(f"Resource analysis failed: {e}")
+				return
+			self.highlight_cache.put(content_key, {"resources": report.to_dict()})
+			callback(report)
+		
+		self.dispatcher.watch_future(self.analysis_executor.submit(analyze_resource_handling, code), on_analysis_done)
+	
+	def _compare_submission(self) -> None:
+		if self.submissions_dir is None:
+			messagebox.showwarning("No Directory", "Please browse and select a Python file first.")
+			return
+		
+		selected_file = self.file_var.get()
+		if not selected_file:
+			messagebox.showwarning("No File Selected", "Please select a Python file to compare.")
+			return
+		
+		current_path = self.submissions_dir / selected_file
+		
+		initial_dir = self.submissions_dir.parent
+		if self.last_compare_file:
+			initial_dir = Path(self.last_compare_file).parent
+		
+		other_file = filedialog.askopenfilename(
+			title="Compare With (previous submission or reference solution)",
+			initialdir=str(initial_dir),
+			filetypes=[("Python files", "*.py"), ("All files", "*.*")]
+		)
+		if not other_file:
+			return
+		
+		self.last_compare_file = other_file
+		self._save_config()
+		self._open_diff_viewer(Path(other_file), current_path)
+	
+	def _validate_all_submissions(self) -> None:
+		if self.submissions_dir is None:
+			messagebox.showwarning("No Directory", "Please browse and select a Python file first.")
+			return
+		
+		course_dir = self.submissions_dir.parent
+		
+		def validate_all():
+			return [(folder, validate_submission_data(folder)) for folder in find_submission_folders(course_dir)]
+		
+		def on_validation_done(future):
+			try:
+				results = future.result()
+			except Exception as e:
+				messagebox.showerror("Validation Error", f"Failed to validate submissions:\n{e}")
+				return
+			if not results:
+				messagebox.showinfo("No Submissions", f"No submission folders found in:\n{course_dir}")
+				return
+			self._show_validation_report(course_dir, results)
+		
+		self.dispatcher.watch_future(self.analysis_executor.submit(validate_all), on_validation_done)
+	
+	def _fuzz_input_validation(self) -> None:
+		"""Run the selected file against generated invalid inputs and report which ones it saved."""
+		if self.submissions_dir is None or not self.file_var.get():
+			messagebox.showwarning("No File Selected", "Please choose a submission file to fuzz.")
+			return
+		if any(not future.done() for future in self.fuzz_futures):
+			messagebox.showinfo("Fuzzing Running", "Input fuzzing is already running. Stop it before starting a new one.")
+			return
+		
+		script_path = self.submissions_dir / self.file_var.get()
+		data_dir = self.suite.data_dir
+		
+		def locate():
+			if not data_dir.exists() or not any(data_dir.glob("*.txt")):
+				return None
+			return get_python_executable()
+		
+		def on_located(future):
+			try:
+				python_executable = future.result()
+			except FileNotFoundError as err:
+				messagebox.showerror("Python Not Found", str(err))
+				return
+			if python_executable is None:
+				messagebox.showwarning("No Data Files", "No stored data files found. Please add files in Settings.")
+				return
+			if all(fuzz_future.done() for fuzz_future in self.fuzz_futures):
+				self._start_fuzzing(script_path, data_dir, python_executable)
+		
+		self.dispatcher.watch_future(self.io_executor.submit(locate), on_located)
+	
+	def _start_fuzzing(self, script_path: Path, data_dir: Path, python_executable: str) -> None:
+		# Every case is its own process in its own temporary folder, so they can all run at once.
+		cases = generate_fuzz_cases(fuzz_scenarios())
+		pool = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 2), thread_name_prefix="fuzz")
+		futures = [pool.submit(run_fuzz_case, case, script_path, data_dir, python_executable) for case in cases]
+		pool.shutdown(wait=False)
+		self.fuzz_futures = futures
+		
+		window = tk.Toplevel(self.root)
+		window.title(f"Input Fuzzing - {script_path.parent.name} / {script_path.name}")
+		self._center_window_on_parent(window, int(900 * self.zoom_level), int(650 * self.zoom_level))
+		window.finished = 0
+		
+		top_bar = ttk.Frame(window, padding=(10, 10, 10, 0))
+		top_bar.pack(fill="x")
+		status_var = tk.StringVar(value=f"0/{len(cases)} runs")
+		ttk.Label(top_bar, textvariable=status_var).pack(side="left")
+		stop_button = ttk.Button(top_bar, text="Stop")
+		stop_button.pack(side="right")
+		progress = ttk.Progressbar(top_bar, maximum=len(cases), mode="determinate")
+		progress.pack(side="left", fill="x", expand=True, padx=10)
+		
+		text_widget = ScrolledText(window, wrap="none", font=self.fonts.get("main", "Consolas", 10))
+		text_widget.pack(fill="both", expand=True, padx=10, pady=10)
+		text_widget.tag_config("header", font=self.fonts.get("main", "Consolas", 10, "bold"))
+		text_widget.tag_config("pass", foreground="#228B22")
+		text_widget.tag_config("fail", foreground="#CC0000")
+		text_widget.tag_config("detail", foreground="#555555")
+		text_widget.insert("1.0", f"Running {len(cases)} generated inputs through {script_path.name} "
+								  f"with the {self.suite.name} suite's data files...")
+		text_widget.config(state="disabled")
+		
+		def show_report():
+			stop_button.config(state="disabled")
+			outcomes = [future.result() for future in futures
+						if future.done() and not future.cancelled() and future.exception() is None]
+			chunks = []
+			for line in format_fuzz_report(outcomes).split("\n"):
+				stripped = line.lstrip()
+				if stripped.startswith("✗") or stripped.startswith("!"):
+					tag = "fail"
+				elif stripped.startswith("✓"):
+					tag = "pass"
+				elif line.startswith(" "):
+					tag = "detail"
+				else:
+					tag = "header"
+				chunks.extend((line + "\n", tag))
 			text_widget.config(state="normal")
-			self._apply_python_syntax_highlighting(text_widget, code_content)
+			text_widget.delete("1.0", tk.END)
+			text_widget.insert("1.0", *chunks)
 			text_widget.config(state="disabled")
-			self.code_viewer_zoom = viewer.zoom_level
-			self._save_config()
 		
-		def zoom_in_code_viewer():
-			viewer.zoom_level = min(viewer.zoom_level + 0.1, 3.0)
-			apply_code_viewer_zoom()
+		def on_case_done(future):
+			if not window.winfo_exists():
+				return
+			window.finished += 1
+			progress["value"] = window.finished
+			status_var.set(f"{window.finished}/{len(cases)} runs")
+			if window.finished == len(futures):
+				show_report()
+		
+		def stop():
+			for future in futures:
+				future.cancel()
+		
+		def on_close():
+			stop()
+			window.destroy()
+		
+		stop_button.config(command=stop)
+		window.protocol("WM_DELETE_WINDOW", on_close)
+		for future in futures:
+			self.dispatcher.watch_future(future, on_case_done)
+	
+	def _export_gradebook(self) -> None:
+		if self.submissions_dir is None:
+			messagebox.showwarning("No Directory", "Please browse and select a Python file first.")
+			return
 		
-		def zoom_out_code_viewer():
-			viewer.zoom_level = max(viewer.zoom_level - 0.1, 0.5)
-			apply_code_viewer_zoom()
+		course_dir = self.submissions_dir.parent
 		
-		def reset_zoom_code_viewer():
-			viewer.zoom_level = 1.2
-			apply_code_viewer_zoom()
+		def on_checked(future):
+			try:
+				has_folders = future.result()
+			except OSError as e:
+				messagebox.showerror("Export Error", f"Failed to read course directory:\n{e}")
+				return
+			if not has_folders:
+				messagebox.showinfo("No Submissions", f"No submission folders found in:\n{course_dir}")
+				return
+			self._choose_gradebook_path(course_dir)
 		
-		def handle_code_viewer_mouse_zoom(event):
-			if event.delta > 0:
-				zoom_in_code_viewer()
-			else:
-				zoom_out_code_viewer()
-		
-		viewer.bind("<Control-MouseWheel>", handle_code_viewer_mouse_zoom)
-		viewer.bind("<Control-plus>", lambda e: zoom_in_code_viewer())
-		viewer.bind("<Control-equal>", lambda e: zoom_in_code_viewer())
-		viewer.bind("<Control-minus>", lambda e: zoom_out_code_viewer())
-		viewer.bind("<Control-Key-0>", lambda e: reset_zoom_code_viewer())
-	
-	def _apply_python_syntax_highlighting(self, text_widget: tk.Text, code: str) -> None:
-		color_scheme = {
-			Token.Keyword: "#C586C0",              
-			Token.Keyword.Constant: "#569CD6",     
-			Token.Keyword.Namespace: "#C586C0",    
-			Token.Name.Builtin: "#4EC9B0",         
-			Token.Name.Builtin.Pseudo: "#569CD6",  
-			Token.Name.Function: "#DCDCAA",        
-			Token.Name.Class: "#4EC9B0",           
-			Token.Name.Decorator: "#DCDCAA",       
-			Token.String: "#CE9178",               
-			Token.String.Doc: "#6A9955",           
-			Token.Number: "#B5CEA8",               
-			Token.Comment: "#6A9955",              
-			Token.Comment.Single: "#6A9955",       
-			Token.Comment.Multiline: "#6A9955",    
-			Token.Operator: "#D4D4D4",             
-			Token.Punctuation: "#D4D4D4",          
-			Token.Name: "#9CDCFE",                 
-		}
+		self.dispatcher.watch_future(self.io_executor.submit(lambda: bool(find_submission_folders(course_dir))), on_checked)
+	
+	def _choose_gradebook_path(self, course_dir: Path) -> None:
+		output_file = filedialog.asksaveasfilename(
+			title="Export Gradebook",
+			initialdir=str(course_dir),
+			initialfile=f"{course_dir.name} gradebook.csv",
+			defaultextension=".csv",
+			filetypes=[("CSV files", "*.csv"), ("SQLite database", "*.db *.sqlite"), ("All files", "*.*")]
+		)
+		if not output_file:
+			return
 		
-		text_widget.tag_config("highlight_open", background="#1F303A")   
-		text_widget.tag_config("highlight_close", background="#1F3A1F")  
+		self._flush_feedback_autosave()
+		output_path = Path(output_file)
 		
-		current_font = text_widget.cget("font")
-		if isinstance(current_font, str):
-			parts = current_font.split()
+		def export():
+			index_path = CACHE_DIR / f"gradebook-{hashlib.sha1(str(course_dir.resolve()).encode('utf-8')).hexdigest()[:16]}.json"
+			rows, reread_count = collect_gradebook(course_dir, index_path)
+			write_gradebook(rows, output_path)
+			return rows, reread_count
+		
+		def on_export_done(future):
 			try:
-				font_size = int(parts[-1])
-			except (ValueError, IndexError):
-				font_size = 10
-		elif isinstance(current_font, tuple):
-			font_size = current_font[1] if len(current_font) > 1 else 10
+				rows, reread_count = future.result()
+			except Exception as e:
+				messagebox.showerror("Export Error", f"Failed to export gradebook:\n{e}")
+				return
+			graded = sum(1 for row in rows if row["grade"])
+			messagebox.showinfo("Gradebook Exported",
+				f"Exported {len(rows)} submission(s), {graded} graded, to:\n{output_path}\n\n"
+				f"{reread_count} feedback file(s) read, {len(rows) - reread_count} unchanged since the last export.")
+		
+		self.dispatcher.watch_future(self.io_executor.submit(export), on_export_done)
+	
+	def _open_dashboard(self) -> None:
+		if self.submissions_dir is not None:
+			course_dir = self.submissions_dir.parent
 		else:
-			font_size = 10
+			directory = filedialog.askdirectory(title="Select Course Directory (with the \"N - Name\" folders)", mustexist=True)
+			if not directory:
+				return
+			course_dir = Path(directory)
 		
-		for token_type, color in color_scheme.items():
-			tag_name = str(token_type)
-			if token_type in (Token.Comment, Token.Comment.Single, Token.Comment.Multiline):
-				text_widget.tag_config(tag_name, foreground=color, font=("Consolas", font_size, "italic"))
-			else:
-				text_widget.tag_config(tag_name, foreground=color)
+		def load_index():
+			folders = find_submission_folders(course_dir)
+			index_path = CACHE_DIR / f"dashboard-{hashlib.sha1(str(course_dir.resolve()).encode('utf-8')).hexdigest()[:16]}.json"
+			try:
+				scan_index = json.loads(index_path.read_text(encoding="utf-8"))
+			except (OSError, ValueError):
+				scan_index = {}
+			return folders, index_path, scan_index, {folder.name: GradingStateStore.folder_key(folder) for folder in folders}
 		
-		lines = code.split('\n')
-		for line_num, line in enumerate(lines, start=1):
-			has_open = 'open(' in line
-			has_close = '.close(' in line
+		def on_index_loaded(future):
+			try:
+				folders, index_path, scan_index, folder_keys = future.result()
+			except OSError as e:
+				messagebox.showerror("Dashboard Error", f"Failed to read course directory:\n{e}")
+				return
+			if not folders:
+				messagebox.showinfo("No Submissions", f"No submission folders found in:\n{course_dir}")
+				return
+			self._show_dashboard(course_dir, folders, index_path, scan_index, folder_keys)
+		
+		self.dispatcher.watch_future(self.io_executor.submit(load_index), on_index_loaded)
+	
+	def _show_dashboard(self, course_dir: Path, folders: list[Path], index_path: Path, scan_index: dict,
+						folder_keys: dict[str, str]) -> None:
+		names = [folder.name for folder in folders]
+		folder_by_name = {folder.name: folder for folder in folders}
+		numbers = {name: SUBMISSION_FOLDER_PATTERN.match(name).group(1) for name in names}
+		scanned = {name: scan_index.get(name, {}) for name in names}
+		
+		dashboard = tk.Toplevel(self.root)
+		dashboard.title(f"Course Dashboard - {course_dir.name}")
+		self._center_window_on_parent(dashboard, int(1100 * self.zoom_level), int(700 * self.zoom_level))
+		dashboard.render_job = None
+		dashboard.reading_state = False   # a grading-state read is on the I/O worker
+		dashboard.render_again = False
+		
+		font = self.fonts.get("main", "Consolas", 10, "bold")
+		columns = (("#", 4), ("Student", 28), ("Grade", 5), ("Points", 6), ("Feedback", 8),
+				   ("Last Run", 8), ("Stops", 5), ("Suite", 12), ("Similar To", 24))
+		
+		def format_row(values):
+			return DASHBOARD_DELIMITER.join(str(value)[:width].ljust(width) for value, (_, width) in zip(values, columns))
+		
+		top_bar = ttk.Frame(dashboard, padding=(5, 5, 5, 0))
+		top_bar.pack(fill="x")
+		status_var = tk.StringVar(value=f"{len(folders)} submissions - scanning...")
+		ttk.Label(top_bar, textvariable=status_var).pack(side="left")
+		rescan_button = ttk.Button(top_bar, text="Rescan")
+		rescan_button.pack(side="right")
+		ttk.Label(top_bar, text="Double-click a row to open it", foreground="gray").pack(side="right", padx=10)
+		
+		header = tk.Label(dashboard, text=format_row([title for title, _ in columns]), font=font,
+						  anchor="w", padx=12)
+		header.pack(fill="x", padx=5, pady=(5, 0))
+		
+		view = VirtualTableView(dashboard, ["#808080", "#000000", "#00a526", "#1E90FF", "#9370DB", "#FF8C00", "#DC143C",
+											"#00CED1", "#CC0000"], font)
+		view.MAX_VISIBLE_ROWS = 30
+		view.frame.pack(fill="both", expand=True, padx=5, pady=5)
+		view.text.tag_config("no_feedback", foreground="#A0A0A0")
+		view.text.tag_config("similar_submission", background="#FFD6D6")
+		view.text.tag_config("current_submission", background="#D6EAFF")
+		
+		def render():
+			"""Read the grading state on the I/O worker and redraw; at most one read is in flight."""
+			dashboard.render_job = None
+			if not dashboard.winfo_exists():
+				return
+			if dashboard.reading_state:
+				dashboard.render_again = True
+				return
+			dashboard.reading_state = True
+			current_folder = self.submissions_dir
 			
-			if has_open or has_close:
-				start_idx = f"{line_num}.0"
-				end_idx = f"{line_num}.end+1c"
-				
-				if has_open:
-					text_widget.tag_add("highlight_open", start_idx, end_idx)
-				if has_close:
-					text_widget.tag_add("highlight_close", start_idx, end_idx)
+			def read_state():
+				current_key = GradingStateStore.folder_key(current_folder) if current_folder else None
+				return self.grading_state.load_all(), self.grading_state.run_summaries(), current_key
+			
+			def on_state_read(future):
+				dashboard.reading_state = False
+				if not dashboard.winfo_exists():
+					return
+				try:
+					grading, runs, current_key = future.result()
+				except sqlite3.Error as e:
+					print(f"Failed to read grading state: {e}")
+				else:
+					show_rows(grading, runs, current_key)
+				if dashboard.render_again:
+					dashboard.render_again = False
+					render()
+			
+			self.dispatcher.watch_future(self.io_executor.submit(read_state), on_state_read)
+		
+		def show_rows(grading, runs, current_key):
+			lines, statuses = [], []
+			for name in names:
+				key = folder_keys[name]
+				info = scanned[name]
+				state = grading.get(key)
+				run = runs.get(key)
+				points = state.points if state else info.get("feedback_points")
+				grade = (state.grade if state else None) or info.get("feedback_grade") or ""
+				similar = info.get("similar", [])
+				if not info:
+					feedback = "..."
+				else:
+					feedback = "saved" if info.get("feedback_saved") else "-"
+				lines.append(format_row([
+					numbers[name], SUBMISSION_FOLDER_PATTERN.match(name).group(2), grade,
+					"" if points is None else f"{points:g}", feedback,
+					run.status if run else "", run.stopped_runs if run and run.stopped_runs else "",
+					(state.suite if state else None) or (run.suite if run else None) or "",
+					", ".join(f"#{numbers.get(other, '?')} {score:.0%}" for other, score in similar),
+				]))
+				if key == current_key:
+					statuses.append("current_submission")
+				elif similar:
+					statuses.append("similar_submission")
+				elif info and not info.get("feedback_saved"):
+					statuses.append("no_feedback")
+				else:
+					statuses.append(None)
+			view.set_data(lines, statuses, {}, DASHBOARD_DELIMITER)
 		
-		lexer = PythonLexer()
-		tokens = lex(code, lexer)
+		def schedule_render():
+			if dashboard.render_job is None and dashboard.winfo_exists():
+				dashboard.render_job = dashboard.after(100, render)
 		
-		position = 0
-		for token_type, token_value in tokens:
-			token_length = len(token_value)
-			if token_length > 0:
-				start_idx = f"1.0+{position}c"
-				end_idx = f"1.0+{position + token_length}c"
-				
-				tag_name = str(token_type)
-				text_widget.tag_add(tag_name, start_idx, end_idx)
-				
-			position += token_length
+		def start_scan():
+			rescan_button.config(state="disabled")
+			status_var.set(f"{len(folders)} submissions - scanning...")
+			
+			def on_row_scanned(payload):
+				name, info = payload
+				scanned[name] = {**info, "similar": scanned[name].get("similar", [])}
+				schedule_render()
+			
+			def scan_all():
+				infos, fingerprints = {}, {}
+				with ThreadPoolExecutor(max_workers=4, thread_name_prefix="dashboard") as pool:
+					for folder, (info, fingerprint) in zip(folders, pool.map(scan_submission, folders)):
+						infos[folder.name] = info
+						fingerprints[folder.name] = fingerprint
+						self.dispatcher.post(EVENT_TASK_PROGRESS, (folder.name, dict(info)), on_row_scanned)
+				similar = find_similar_submissions(fingerprints)
+				for name, info in infos.items():
+					info["similar"] = [[other, round(score, 3)] for other, score in similar.get(name, [])]
+				try:
+					index_path.parent.mkdir(parents=True, exist_ok=True)
+					atomic_write_text(index_path, json.dumps(infos))
+				except OSError as e:
+					print(f"Failed to save dashboard index: {e}")
+				return infos
+			
+			def on_scan_done(future):
+				if not dashboard.winfo_exists():
+					return
+				rescan_button.config(state="normal")
+				try:
+					infos = future.result()
+				except Exception as e:
+					status_var.set(f"Scan failed: {e}")
+					return
+				scanned.update(infos)
+				saved = sum(1 for info in infos.values() if info["feedback_saved"])
+				flagged = sum(1 for info in infos.values() if info["similar"])
+				status_var.set(f"{len(folders)} submissions - {saved} with feedback - {flagged} flagged as similar")
+				render()
+			
+			self.dispatcher.watch_future(self.background_executor.submit(scan_all), on_scan_done)
+		
+		def open_submission(event):
+			line = int(view.text.index(f"@{event.x},{event.y}").split(".")[0])
+			row = view.top + line - 1
+			if 0 <= row < len(names):
+				self._switch_submission_folder(folder_by_name[names[row]])
+				render()
+			return "break"
+		
+		view.text.bind("<Double-Button-1>", open_submission)
+		dashboard.bind("<FocusIn>", lambda e: schedule_render() if e.widget is dashboard else None)
+		rescan_button.config(command=start_scan)
+		
+		render()
+		start_scan()
+	
+	def _show_validation_report(self, course_dir: Path, results: list[tuple[Path, dict[str, list[DataIssue]]]]) -> None:
+		report = tk.Toplevel(self.root)
+		report.title(f"Data Validation - {course_dir.name}")
+		self._center_window_on_parent(report, int(900 * self.zoom_level), int(600 * self.zoom_level))
+		
+		text_widget = ScrolledText(report, wrap="none", font=self.fonts.get("main", "Consolas", 10))
+		text_widget.pack(fill="both", expand=True, padx=10, pady=10)
+		text_widget.tag_config("header", font=self.fonts.get("main", "Consolas", 10, "bold"))
+		text_widget.tag_config("pass", foreground="#228B22")
+		text_widget.tag_config("fail", foreground="#CC0000")
+		text_widget.tag_config("detail", foreground="#555555")
+		
+		name_width = max(len(folder.name) for folder, _ in results) + 2
+		header = "Submission".ljust(name_width) + "".join(f"C{number:<4}" for number in VALIDATED_CHECKLISTS) + "\n"
+		chunks = [header, "header"]
+		details = []
+		for folder, file_issues in results:
+			failed = {issue.checklist for issues in file_issues.values() for issue in issues}
+			chunks.extend((folder.name.ljust(name_width), ""))
+			for number in VALIDATED_CHECKLISTS:
+				chunks.extend(("✗    ", "fail") if number in failed else ("✓    ", "pass"))
+			if not file_issues:
+				chunks.extend(("  (no data files)", "detail"))
+			chunks.extend(("\n", ""))
+			
+			issue_lines = []
+			for file_name, issues in file_issues.items():
+				for issue in issues[:20]:
+					checklist = f"Checklist {issue.checklist}" if issue.checklist else "-"
+					issue_lines.append(f"  {file_name}:{issue.line + 1}  {checklist:<13} {issue.message}\n")
+				if len(issues) > 20:
+					issue_lines.append(f"  {file_name}: ... and {len(issues) - 20} more\n")
+			if issue_lines:
+				details.extend((f"\n{folder.name}\n", "header", "".join(issue_lines), "detail"))
+		
+		text_widget.insert("1.0", *chunks, *details)
+		text_widget.config(state="disabled")
+	
+	def _open_diff_viewer(self, left_path: Path, right_path: Path) -> None:
+		def read(path):
+			try:
+				return self.artifacts.text(path)
+			except UnicodeDecodeError:
+				return path.read_text(encoding="utf-8", errors="replace")
+		
+		def read_both():
+			return read(left_path), read(right_path)
+		
+		def on_read(future):
+			try:
+				left_content, right_content = future.result()
+			except OSError as e:
+				messagebox.showerror("Error", f"Failed to read file: {e}")
+				return
+			self._show_diff_viewer(left_path, right_path, left_content, right_content)
 		
-		text_widget.tag_raise("highlight_open")
-		text_widget.tag_raise("highlight_close")
+		self.dispatcher.watch_future(self.io_executor.submit(read_both), on_read)
+	
+	def _show_diff_viewer(self, left_path: Path, right_path: Path, left_content: str, right_content: str) -> None:
+		left_lines = left_content.split("\n")
+		right_lines = right_content.split("\n")
+		opcodes = patience_diff_opcodes(left_lines, right_lines)
+		
+		left_rows: list[int | None] = []
+		right_rows: list[int | None] = []
+		row_status: list[str] = []
+		change_rows: list[int] = []
+		for tag, i1, i2, j1, j2 in opcodes:
+			if tag != "equal":
+				change_rows.append(len(row_status))
+			for offset in range(max(i2 - i1, j2 - j1)):
+				left_rows.append(i1 + offset if i1 + offset < i2 else None)
+				right_rows.append(j1 + offset if j1 + offset < j2 else None)
+				row_status.append(tag)
+		
+		added = sum(j2 - j1 for tag, i1, i2, j1, j2 in opcodes if tag in ("insert", "replace"))
+		removed = sum(i2 - i1 for tag, i1, i2, j1, j2 in opcodes if tag in ("delete", "replace"))
+		
+		viewer = tk.Toplevel(self.root)
+		viewer.title(f"Diff - {left_path.parent.name}/{left_path.name} ↔ {right_path.parent.name}/{right_path.name}")
+		screen_width = viewer.winfo_screenwidth()
+		screen_height = viewer.winfo_screenheight()
+		viewer.geometry(f"{int(screen_width * 0.9)}x{screen_height - 80}+{self.root.winfo_x()}+{self.root.winfo_y()}")
+		viewer.configure(bg="#1E1E1E")
+		viewer.current_change = -1
+		
+		code_font = self.fonts.get("code", "Consolas", 10)
+		small_font = self.fonts.get("code", "Consolas", 9)
+		small_bold_font = self.fonts.get("code", "Consolas", 9, "bold")
+		
+		top_bar = tk.Frame(viewer, bg="#1E1E1E")
+		top_bar.pack(fill="x", padx=5, pady=(5, 0))
+		
+		stats_label = tk.Label(top_bar, text=f"+{added}  -{removed}", bg="#1E1E1E", fg="#D4D4D4",
+							   font=small_bold_font)
+		stats_label.pack(side="left", padx=5)
+		
+		nav_frame = tk.Frame(top_bar, bg="#1E1E1E")
+		nav_frame.pack(side="right", padx=5)
+		
+		change_label = tk.Label(nav_frame, text=f"0/{len(change_rows)}", bg="#1E1E1E", fg="#FF8C00",
+								font=small_bold_font, width=8)
+		change_label.pack(side="left", padx=(0, 5))
+		
+		prev_button = tk.Button(nav_frame, text="◀", bg="#3C3C3C", fg="#D4D4D4",
+								font=small_font, width=3, relief="solid", borderwidth=1)
+		prev_button.pack(side="left", padx=(0, 2))
+		
+		next_button = tk.Button(nav_frame, text="▶", bg="#3C3C3C", fg="#D4D4D4",
+								font=small_font, width=3, relief="solid", borderwidth=1)
+		next_button.pack(side="left")
+		
+		panes_frame = tk.Frame(viewer, bg="#1E1E1E")
+		panes_frame.pack(fill="both", expand=True, padx=5, pady=5)
+		panes_frame.columnconfigure(0, weight=1, uniform="pane")
+		panes_frame.columnconfigure(1, weight=1, uniform="pane")
+		panes_frame.rowconfigure(1, weight=1)
+		
+		v_scrollbar = tk.Scrollbar(panes_frame, bg="#252526", troughcolor="#1E1E1E")
+		v_scrollbar.grid(row=1, column=2, sticky="ns")
+		
+		fill_tags = {
+			"left": {"replace": "diff_change", "delete": "diff_delete", "insert": "diff_filler"},
+			"right": {"replace": "diff_change", "insert": "diff_insert", "delete": "diff_filler"},
+		}
+		scrolled_widgets: list[tk.Text] = []
+		text_widgets: list[tk.Text] = []
+		highlighters: list[LazySyntaxHighlighter] = []
+		
+		def build_pane(column: int, side: str, path: Path, content: str, source_lines: list[str], rows: list[int | None]):
+			tk.Label(panes_frame, text=str(path), bg="#252526", fg="#D4D4D4", anchor="w",
+					 font=small_font).grid(row=0, column=column, sticky="ew", padx=(0, 4))
+			
+			pane = tk.Frame(panes_frame, bg="#1E1E1E")
+			pane.grid(row=1, column=column, sticky="nsew", padx=(0, 4))
+			
+			h_scrollbar = tk.Scrollbar(pane, orient="horizontal", bg="#252526", troughcolor="#1E1E1E")
+			h_scrollbar.pack(side="bottom", fill="x")
+			
+			numbers = tk.Text(pane, wrap="none", width=5, font=code_font, bg="#1E1E1E", fg="#858585",
+							  borderwidth=0, highlightthickness=0, padx=5, takefocus=0)
+			numbers.pack(side="left", fill="y")
+			
+			text_widget = tk.Text(pane, wrap="none", xscrollcommand=h_scrollbar.set, font=code_font,
+								  bg="#1E1E1E", fg="#D4D4D4", insertbackground="#FFFFFF", selectbackground="#264F78",
+								  selectforeground="#D4D4D4", borderwidth=0, highlightthickness=0)
+			text_widget.pack(side="left", fill="both", expand=True)
+			h_scrollbar.config(command=text_widget.xview)
+			
+			aligned_code = "\n".join(source_lines[idx] if idx is not None else "" for idx in rows)
+			text_widget.insert("1.0", aligned_code)
+			numbers.insert("1.0", "\n".join(str(idx + 1) if idx is not None else "" for idx in rows))
+			
+			text_widget.tag_config("diff_change", background="#3A3A1E")
+			text_widget.tag_config("diff_delete", background="#4B1818")
+			text_widget.tag_config("diff_insert", background="#1E3A1E")
+			text_widget.tag_config("diff_filler", background="#2A2A2A")
+			ranges: dict[str, list[str]] = {}
+			for row, status in enumerate(row_status):
+				tag_name = fill_tags[side].get(status)
+				if tag_name:
+					ranges.setdefault(tag_name, []).extend((f"{row + 1}.0", f"{row + 1}.end+1c"))
+			for tag_name, indices in ranges.items():
+				text_widget.tag_add(tag_name, *indices)
+			
+			numbers.config(state="disabled")
+			text_widget.config(state="disabled")
+			
+			cached = self.highlight_cache.get(HighlightCache.content_hash(content))
+			aligned_spans = None
+			if cached is not None and "line_spans" in cached and len(cached["line_spans"]) == len(source_lines):
+				aligned_spans = [cached["line_spans"][idx] if idx is not None else [] for idx in rows]
+			highlighters.append(LazySyntaxHighlighter(text_widget, aligned_code, line_spans=aligned_spans,
+													  comment_font=self.fonts.get("code", "Consolas", 10, slant="italic")))
+			
+			scrolled_widgets.extend((numbers, text_widget))
+			text_widgets.append(text_widget)
+		
+		build_pane(0, "left", left_path, left_content, left_lines, left_rows)
+		build_pane(1, "right", right_path, right_content, right_lines, right_rows)
+		
+		viewer.syncing = False
+		
+		def sync_scroll(source: tk.Text, first: str, last: str):
+			v_scrollbar.set(first, last)
+			if viewer.syncing:
+				return
+			viewer.syncing = True
+			try:
+				for widget in scrolled_widgets:
+					if widget is not source:
+						widget.yview_moveto(first)
+			finally:
+				viewer.syncing = False
+			for highlighter in highlighters:
+				highlighter.on_scroll()
+		
+		for widget in scrolled_widgets:
+			widget.config(yscrollcommand=lambda first, last, source=widget: sync_scroll(source, first, last))
+		v_scrollbar.config(command=lambda *args: [widget.yview(*args) for widget in scrolled_widgets])
+		
+		def show_change():
+			row = change_rows[viewer.current_change]
+			text_widgets[0].yview(f"{max(1, row - 5)}.0")
+			change_label.config(text=f"{viewer.current_change + 1}/{len(change_rows)}")
+		
+		def next_change():
+			if change_rows:
+				viewer.current_change = (viewer.current_change + 1) % len(change_rows)
+				show_change()
+		
+		def prev_change():
+			if change_rows:
+				viewer.current_change = (viewer.current_change - 1) % len(change_rows)
+				show_change()
+		
+		next_button.config(command=next_change)
+		prev_button.config(command=prev_change)
+		
+		self._bind_viewer_zoom(viewer, "code")
+		viewer.bind("<F7>", lambda e: next_change())
+		viewer.bind("<Shift-F7>", lambda e: prev_change())
+		
+		def on_diff_viewer_close():
+			for highlighter in highlighters:
+				highlighter.cancel()
+			viewer.destroy()
+		
+		viewer.protocol("WM_DELETE_WINDOW", on_diff_viewer_close)
+		viewer.update_idletasks()
+		for highlighter in highlighters:
+			highlighter.start()
+		if change_rows:
+			next_change()
 	
 	def _open_files_viewer(self) -> None:
 		if self.submissions_dir is None:
 			messagebox.showwarning("No Directory", "Please browse and select a directory first.")
 			return
 		
-		if not DATA_DIR.exists() or not list(DATA_DIR.glob("*.txt")):
-			messagebox.showwarning("No Data Files", "No stored data files found. Please add files in Settings.")
-			return
-		
-		data_files_to_display = []
-		for data_file in DATA_DIR.glob("*.txt"):
-			target_file = self.submissions_dir / data_file.name
-			if target_file.exists():
-				data_files_to_display.append(target_file)
-		data_files_to_display.sort(reverse=True)
+		folder = self.submissions_dir
+		data_dir = self.suite.data_dir
 		
-		if not data_files_to_display:
-			messagebox.showinfo("No Files", "No data files found in the selected directory.\nUse 'Reset Files' to copy them.")
-			return
+		def load_data_files():
+			data_files = sorted(data_dir.glob("*.txt"), reverse=True) if data_dir.is_dir() else []
+			loaded = []
+			for data_file in data_files:
+				file_path = folder / data_file.name
+				try:
+					loaded.append((file_path, load_data_diff(self.artifacts, file_path, data_file), None))
+				except FileNotFoundError:
+					continue
+				except (OSError, UnicodeDecodeError) as e:
+					loaded.append((file_path, None, e))
+			return bool(data_files), loaded
+		
+		def on_loaded(future):
+			try:
+				has_data_files, loaded = future.result()
+			except OSError as e:
+				messagebox.showerror("Error", f"Failed to read data files: {e}")
+				return
+			if not has_data_files:
+				messagebox.showwarning("No Data Files", "No stored data files found. Please add files in Settings.")
+			elif not loaded:
+				messagebox.showinfo("No Files", "No data files found in the selected directory.\nUse 'Reset Files' to copy them.")
+			else:
+				self._show_files_viewer(folder, data_dir, loaded)
 		
+		self.dispatcher.watch_future(self.io_executor.submit(load_data_files), on_loaded)
+	
+	def _show_files_viewer(self, folder: Path, data_dir: Path, loaded: list) -> None:
 		viewer = tk.Toplevel(self.root)
 		viewer.title("Data Files Viewer")
 		
@@ -2068,8 +5731,7 @@ class PythonTesterApp:
 		main_y = self.root.winfo_y()
 		viewer.geometry(f"{window_width}x{window_height - 80}+{main_x}+{main_y}")
 		
-		viewer.zoom_level = self.files_viewer_zoom
-		viewer.text_widgets = []
+		viewer.table_views = []
 		viewer.extra_line_positions = []  
 		viewer.current_extra_line = -1
 		
@@ -2079,22 +5741,23 @@ class PythonTesterApp:
 		nav_frame = tk.Frame(top_nav_bar, bg="#1E1E1E")
 		nav_frame.pack(side="right", padx=5)
 		
-		initial_nav_font_size = int(9 * viewer.zoom_level)
+		nav_font = self.fonts.get("files", "Consolas", 9)
+		nav_bold_font = self.fonts.get("files", "Consolas", 9, "bold")
 		
 		nav_label = tk.Label(nav_frame, text="Changed/New Lines:", bg="#1E1E1E", fg="#D4D4D4", 
-							 font=("Consolas", initial_nav_font_size, "bold"))
+							 font=nav_bold_font)
 		nav_label.pack(side="left", padx=(0, 5))
 		
 		extra_line_counter = tk.Label(nav_frame, text="0/0", bg="#1E1E1E", fg="#FF8C00", 
-								  font=("Consolas", initial_nav_font_size, "bold"), width=8)
+								  font=nav_bold_font, width=8)
 		extra_line_counter.pack(side="left", padx=(0, 5))
 		
 		prev_extra_button = tk.Button(nav_frame, text="◀", bg="#3C3C3C", fg="#D4D4D4", 
-									  font=("Consolas", initial_nav_font_size), width=3, relief="solid", borderwidth=1)
+									  font=nav_font, width=3, relief="solid", borderwidth=1)
 		prev_extra_button.pack(side="left", padx=(0, 2))
 		
 		next_extra_button = tk.Button(nav_frame, text="▶", bg="#3C3C3C", fg="#D4D4D4", 
-									  font=("Consolas", initial_nav_font_size), width=3, relief="solid", borderwidth=1)
+									  font=nav_font, width=3, relief="solid", borderwidth=1)
 		next_extra_button.pack(side="left")
 		
 		main_canvas = tk.Canvas(viewer)
@@ -2126,13 +5789,24 @@ class PythonTesterApp:
 						  "#9370DB", "#FF1493", "#00CED1", "#FF4500", "#228B22"]
 		
 		file_viewers = {}
+		shown = {}
+		
+		for file_idx, (file_path, data_diff, read_error) in enumerate(loaded):
+			table_view = self._create_collapsible_csv_viewer(scrollable_frame, file_path, file_idx, rainbow_colors, data_diff, read_error, viewer)
+			if table_view:
+				file_viewers[str(file_path)] = table_view
+				shown[str(file_path)] = data_diff
+				viewer.table_views.append(table_view)
 		
-		for file_idx, file_path in enumerate(data_files_to_display):
-			base_file_path = DATA_DIR / file_path.name
-			text_widget = self._create_collapsible_csv_viewer(scrollable_frame, file_path, file_idx, rainbow_colors, base_file_path, viewer)
-			if text_widget:
-				file_viewers[str(file_path)] = text_widget
-				viewer.text_widgets.append(text_widget)
+		def validate_views():
+			reference_keys = {Path(path_str).name: data_file_keys(view.lines) for path_str, view in file_viewers.items()}
+			for path_str, view in file_viewers.items():
+				validator = get_data_validator(Path(path_str).name)
+				if validator and view.text.winfo_exists():
+					view.update_validation(validator.validate(view.lines, view.delimiter, reference_keys))
+		
+		viewer.validate_views = validate_views
+		validate_views()
 		
 		total_extra_lines = len(viewer.extra_line_positions)
 		if total_extra_lines > 0:
@@ -2142,21 +5816,18 @@ class PythonTesterApp:
 		
 		def navigate_to_extra_line():
 			if viewer.current_extra_line >= 0 and viewer.current_extra_line < len(viewer.extra_line_positions):
-				for text_widget in viewer.text_widgets:
-					if text_widget.winfo_exists():
-						text_widget.tag_remove("current_extra_line", "1.0", tk.END)
-				
-				text_widget, line_num = viewer.extra_line_positions[viewer.current_extra_line]
+				table_view, line_num = viewer.extra_line_positions[viewer.current_extra_line]
 				
-				text_widget.tag_add("current_extra_line", f"{line_num}.0", f"{line_num}.end+1c")
-				text_widget.tag_raise("current_extra_line")
+				for other_view in viewer.table_views:
+					if other_view is not table_view and other_view.current_row is not None and other_view.text.winfo_exists():
+						other_view.set_current_row(None)
 				
-				text_widget.see(f"{line_num}.0")
+				table_view.set_current_row(line_num - 1)
 				
-				text_widget.update_idletasks()
-				bbox = text_widget.bbox(f"{line_num}.0")
+				table_view.text.update_idletasks()
+				bbox = table_view.text.bbox(table_view.row_index(line_num - 1))
 				if bbox:
-					widget_y = text_widget.winfo_y()
+					widget_y = table_view.text.winfo_rooty() - scrollable_frame.winfo_rooty()
 					scroll_y = widget_y + bbox[1]
 					canvas_height = main_canvas.winfo_height()
 					scrollregion = main_canvas.cget("scrollregion").split()
@@ -2181,117 +5852,89 @@ class PythonTesterApp:
 		next_extra_button.config(command=next_extra_line)
 		prev_extra_button.config(command=prev_extra_line)
 		
-		def apply_files_viewer_zoom():
-			base_font_size = 11
-			new_font_size = int(base_font_size * viewer.zoom_level)
-			nav_font_size = int(9 * viewer.zoom_level)
-			for text_widget in viewer.text_widgets:
-				if text_widget.winfo_exists():
-					text_widget.configure(font=("Consolas", new_font_size, "bold"))
-					for i in range(len(rainbow_colors)):
-						text_widget.tag_config(f"col{i}", foreground=rainbow_colors[i], font=("Consolas", new_font_size, "bold"))
-			nav_label.configure(font=("Consolas", nav_font_size, "bold"))
-			extra_line_counter.configure(font=("Consolas", nav_font_size, "bold"))
-			prev_extra_button.configure(font=("Consolas", nav_font_size))
-			next_extra_button.configure(font=("Consolas", nav_font_size))
-			self.files_viewer_zoom = viewer.zoom_level
-			self._save_config()
-		
-		def zoom_in_files_viewer():
-			viewer.zoom_level = min(viewer.zoom_level + 0.1, 3.0)
-			apply_files_viewer_zoom()
-		
-		def zoom_out_files_viewer():
-			viewer.zoom_level = max(viewer.zoom_level - 0.1, 0.5)
-			apply_files_viewer_zoom()
-		
-		def reset_zoom_files_viewer():
-			viewer.zoom_level = 1.2
-			apply_files_viewer_zoom()
-		
-		def handle_files_viewer_mouse_zoom(event):
-			if event.delta > 0:
-				zoom_in_files_viewer()
-			else:
-				zoom_out_files_viewer()
+		self._bind_viewer_zoom(viewer, "files")
 		
-		viewer.bind("<Control-MouseWheel>", handle_files_viewer_mouse_zoom)
-		viewer.bind("<Control-plus>", lambda e: zoom_in_files_viewer())
-		viewer.bind("<Control-equal>", lambda e: zoom_in_files_viewer())
-		viewer.bind("<Control-minus>", lambda e: zoom_out_files_viewer())
-		viewer.bind("<Control-Key-0>", lambda e: reset_zoom_files_viewer())
-		
-		class FileChangeHandler(FileSystemEventHandler):
-			def __init__(self, viewer_window, file_viewers_dict, colors, counter_label):
+		class FileChangeHandler:
+			COALESCE_MS = 150
+			
+			def __init__(self, app, viewer_window, file_viewers_dict, shown, counter_label):
+				self.app = app
 				self.viewer_window = viewer_window
 				self.file_viewers = file_viewers_dict
-				self.colors = colors
 				self.counter_label = counter_label
+				self._pending: set[str] = set()
+				self._flush_scheduled = False
+				# The cached (lines, diff) each view shows; only touched by the I/O worker once the viewer is open.
+				self._shown: dict[str, tuple[list[str], RecordDiff]] = dict(shown)
+			
+			def on_file_changed(self, change):
+				if change.change != "deleted":
+					self._queue_update(change.path)
 			
-			def on_modified(self, event):
-				if event.is_directory:
+			def _queue_update(self, file_path):
+				if file_path.suffix != '.txt' or str(file_path) not in self.file_viewers:
 					return
-				
-				file_path = Path(event.src_path)
-				if file_path.suffix == '.txt' and str(file_path) in self.file_viewers:
-					self.viewer_window.after(100, lambda: self._update_file_content(file_path))
+				self._pending.add(str(file_path))
+				if not self._flush_scheduled and self.viewer_window.winfo_exists():
+					self._flush_scheduled = True
+					self.viewer_window.after(self.COALESCE_MS, self._flush_pending)
+			
+			def _flush_pending(self):
+				pending = [Path(path_str) for path_str in sorted(self._pending)]
+				self._pending.clear()
+				self._flush_scheduled = False
+				if pending:
+					self.app.dispatcher.watch_future(self.app.io_executor.submit(self._read_changes, pending), self._apply_changes)
+			
+			def _read_changes(self, pending):
+				changes = []
+				for file_path in pending:
+					try:
+						change = self._read_file_content(file_path)
+					except Exception as e:
+						print(f"Error updating {file_path}: {e}")
+						continue
+					if change is not None:
+						changes.append(change)
+				return changes
 			
-			def _update_file_content(self, file_path):
-				if str(file_path) not in self.file_viewers:
+			def _apply_changes(self, future):
+				if not self.viewer_window.winfo_exists():
 					return
-				
-				text_widget = self.file_viewers[str(file_path)]
-				if not text_widget.winfo_exists():
+				try:
+					changes = future.result()
+				except Exception as e:
+					print(f"Error updating data files: {e}")
+					return
+				for file_path, lines, record_diff in changes:
+					self._update_file_content(file_path, lines, record_diff)
+				if changes:
+					self.viewer_window.validate_views()
+			
+			def _read_file_content(self, file_path):
+				# The watcher saw this file change, so hash it even if its (mtime, size) did not move.
+				data_diff = load_data_diff(self.app.artifacts, file_path, data_dir / file_path.name, revalidate=True)
+				if data_diff is self._shown.get(str(file_path)):
+					return None
+				self._shown[str(file_path)] = data_diff
+				return (file_path, *data_diff)
+			
+			def _update_file_content(self, file_path, lines, record_diff):
+				table_view = self.file_viewers[str(file_path)]
+				if not table_view.text.winfo_exists():
 					return
 				
 				try:
-					content = file_path.read_text(encoding="utf-8")
-					lines = content.strip().split('\n')
-					
-					base_file_path = DATA_DIR / file_path.name
-					base_lines = []
-					if base_file_path.exists():
-						try:
-							base_content = base_file_path.read_text(encoding="utf-8")
-							base_lines = base_content.strip().split('\n')
-						except Exception:
-							pass
+					line_status = record_diff.status_tags()
 					
-					first_line = lines[0] if lines else ""
-					delimiter = ',' if ',' in first_line else '\t'
+					table_view.set_data(lines, line_status, record_diff.changed_fields, detect_delimiter(lines))
+					table_view.update_change_panels(record_diff)
 					
-					text_widget.config(state="normal")
-					text_widget.delete("1.0", tk.END)
-					
-					self.viewer_window.extra_line_positions = [
-						(widget, line) for widget, line in self.viewer_window.extra_line_positions 
-						if widget != text_widget
-					]
-					
-					for line_idx, line in enumerate(lines):
-						line_num = line_idx + 1
-						
-						is_extra = line_idx >= len(base_lines)
-						is_modified = False
-						
-						if not is_extra and line_idx < len(base_lines):
-							if line.strip() != base_lines[line_idx].strip():
-								is_modified = True
-						
-						columns = line.split(delimiter)
-						for col_idx, column in enumerate(columns):
-							color_idx = col_idx % len(self.colors)
-							text_widget.insert("end", column, f"col{color_idx}")
-							if col_idx < len(columns) - 1:
-								text_widget.insert("end", delimiter)
-						text_widget.insert("end", "\n")
-						
-						if is_extra:
-							text_widget.tag_add("extra_line", f"{line_num}.0", f"{line_num}.end")
-							self.viewer_window.extra_line_positions.append((text_widget, line_num))
-						elif is_modified:
-							text_widget.tag_add("modified_line", f"{line_num}.0", f"{line_num}.end")
-							self.viewer_window.extra_line_positions.append((text_widget, line_num))
+					view_order = {view: order for order, view in enumerate(self.viewer_window.table_views)}
+					self.viewer_window.extra_line_positions = sorted(
+						[(view, line) for view, line in self.viewer_window.extra_line_positions if view is not table_view]
+						+ [(table_view, line_idx + 1) for line_idx, status in enumerate(line_status) if status],
+						key=lambda position: (view_order.get(position[0], 0), position[1]))
 					
 					total_extra = len(self.viewer_window.extra_line_positions)
 					if self.viewer_window.current_extra_line >= total_extra:
@@ -2304,20 +5947,18 @@ class PythonTesterApp:
 							self.counter_label.config(text=f"{self.viewer_window.current_extra_line + 1}/{total_extra}")
 					else:
 						self.counter_label.config(text="0/0")
-					
-					text_widget.config(height=len(lines), state="disabled")
 				except Exception as e:
 					print(f"Error updating {file_path}: {e}")
 		
-		event_handler = FileChangeHandler(viewer, file_viewers, rainbow_colors, extra_line_counter)
-		observer = Observer()
-		observer.schedule(event_handler, str(self.submissions_dir), recursive=False)
-		observer.start()
+		event_handler = FileChangeHandler(self, viewer, file_viewers, shown, extra_line_counter)
+		self.dispatcher.subscribe(EVENT_FILE_CHANGED, event_handler.on_file_changed)
+		# Keep this folder watched after the user moves on to another submission.
+		self.file_watcher.pin(folder)
 		
 		def on_viewer_close():
 			viewer.unbind("<MouseWheel>")
-			observer.stop()
-			observer.join()
+			self.dispatcher.unsubscribe(EVENT_FILE_CHANGED, event_handler.on_file_changed)
+			self.file_watcher.unpin(folder)
 			viewer.destroy()
 		
 		viewer.protocol("WM_DELETE_WINDOW", on_viewer_close)
@@ -2326,32 +5967,35 @@ class PythonTesterApp:
 		if self.submissions_dir is None:
 			messagebox.showwarning("No Directory", "Please browse and select a directory first.")
 			return
-		
-		ai_file = self.submissions_dir / "ai.txt"
-		
-		if not ai_file.exists():
-			messagebox.showwarning("File Not Found", f"ai.txt not found in:\n{self.submissions_dir}")
-			return
-		
-		content = None
-		encodings_to_try = ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252', 'iso-8859-1']
-		
-		for encoding in encodings_to_try:
-			try:
-				content = ai_file.read_text(encoding=encoding)
-				break
-			except (UnicodeDecodeError, LookupError):
-				continue
-		
-		if content is None:
+		self._open_text_file(self.submissions_dir / "ai.txt")
+	
+	def _browse_text_file(self) -> None:
+		initial_dir = self.submissions_dir if self.submissions_dir is not None else BASE_DIR
+		selected_file = filedialog.askopenfilename(
+			title="Open Text File",
+			initialdir=str(initial_dir),
+			filetypes=[("Text files", "*.txt *.md *.csv *.log"), ("All files", "*.*")]
+		)
+		if selected_file:
+			self._open_text_file(Path(selected_file))
+	
+	def _open_text_file(self, path: Path) -> None:
+		def on_read(future):
 			try:
-				content = ai_file.read_text(encoding="utf-8", errors="replace")
+				content, encoding = future.result()
+			except FileNotFoundError:
+				messagebox.showwarning("File Not Found", f"{path.name} not found in:\n{path.parent}")
+				return
 			except Exception as e:
-				messagebox.showerror("Error", f"Failed to read ai.txt:\n{e}")
+				messagebox.showerror("Error", f"Failed to read {path.name}:\n{e}")
 				return
+			self._show_text_file(path, content, encoding)
 		
+		self.dispatcher.watch_future(self.io_executor.submit(load_text_file, self.artifacts, path), on_read)
+	
+	def _show_text_file(self, path: Path, content: str, encoding: str) -> None:
 		viewer = tk.Toplevel(self.root)
-		viewer.title("ai.txt")
+		viewer.title(path.name if path.parent == self.submissions_dir else f"{path.parent.name} / {path.name}")
 		
 		base_width = 600
 		base_height = 400
@@ -2359,19 +6003,27 @@ class PythonTesterApp:
 		zoomed_height = int(base_height * self.zoom_level)
 		self._center_window_on_parent(viewer, zoomed_width, zoomed_height)
 		
-		text_frame = ttk.Frame(viewer)
-		text_frame.pack(fill="both", expand=True, padx=10, pady=10)
+		status_var = tk.StringVar()
+		ttk.Label(viewer, textvariable=status_var, foreground="gray").pack(side="bottom", anchor="w", padx=10, pady=(0, 5))
+		
+		text_view = PagedTextView(viewer, self.fonts.get("main", "Consolas", 10))
+		text_view.frame.pack(fill="both", expand=True, padx=10, pady=10)
 		
-		base_font_size = 10
-		zoomed_font_size = int(base_font_size * self.zoom_level)
+		total_lines = content.count("\n") + 1
 		
-		text_widget = ScrolledText(text_frame, wrap="word", font=("Consolas", zoomed_font_size))
-		text_widget.pack(fill="both", expand=True)
+		def update_status(view):
+			status = f"{encoding} - {total_lines:,} lines"
+			if not view.fully_loaded:
+				status += f" - {view.loaded * 100 // len(content)}% loaded, scroll or Ctrl+End for more"
+			status_var.set(status)
 		
-		text_widget.insert("1.0", content)
-		text_widget.config(state="disabled")  
+		text_view.on_page = update_status
+		text_view.set_content(content)
+		update_status(text_view)
 
-	def _create_collapsible_csv_viewer(self, parent: ttk.Frame, file_path: Path, idx: int, colors: list, base_file_path: Path = None, viewer_window = None) -> tk.Text | None:
+	def _create_collapsible_csv_viewer(self, parent: ttk.Frame, file_path: Path, idx: int, colors: list,
+									   data_diff: tuple[list[str], RecordDiff] | None, read_error: Exception | None = None,
+									   viewer_window = None) -> VirtualTableView | None:
 		file_frame = ttk.LabelFrame(parent, text=file_path.name, padding=5)
 		file_frame.pack(fill="both", expand=True, padx=5, pady=5)
 		
@@ -2386,146 +6038,97 @@ class PythonTesterApp:
 		content_frame = ttk.Frame(file_frame)
 		content_frame.pack(fill="both", expand=True, pady=(5, 0))
 		
-		try:
-			content = file_path.read_text(encoding="utf-8")
-		except Exception as e:
-			error_label = ttk.Label(content_frame, text=f"Error reading file: {e}", foreground="red")
+		if read_error is not None:
+			error_label = ttk.Label(content_frame, text=f"Error reading file: {read_error}", foreground="red")
 			error_label.pack()
 			return None
+		lines, record_diff = data_diff
 		
-		lines = content.strip().split('\n')
-		num_lines = len(lines)
+		data_font = self.fonts.get("files", "Consolas", 11)
+		data_bold_font = self.fonts.get("files", "Consolas", 11, "bold")
 		
-		base_lines = []
-		diff_info = []
-		deleted_lines = []  
-		modified_lines = []  
-		if base_file_path and base_file_path.exists():
-			try:
-				base_content = base_file_path.read_text(encoding="utf-8")
-				base_lines = base_content.strip().split('\n')
-				
-				matcher = difflib.SequenceMatcher(None, base_lines, lines)
-				
-				for tag, i1, i2, j1, j2 in matcher.get_opcodes():
-					if tag == 'replace':
-						for idx, j in enumerate(range(j1, j2)):
-							diff_info.append((j, 'modified'))
-							if i1 + idx < len(base_lines):
-								modified_lines.append((j + 1, base_lines[i1 + idx]))  
-					elif tag == 'insert':
-						for j in range(j1, j2):
-							diff_info.append((j, 'added'))
-					elif tag == 'delete':
-						for i in range(i1, i2):
-							deleted_lines.append((i + 1, base_lines[i])) 
-				
-			except Exception:
-				pass
+		table_view = VirtualTableView(content_frame, colors, data_bold_font)
+		table_view.frame.pack(fill="both", expand=False, padx=5, pady=5)
 		
-		diff_map = {line_idx: status for line_idx, status in diff_info}
+		if lines:
+			line_status = record_diff.status_tags()
+			table_view.set_data(lines, line_status, record_diff.changed_fields, detect_delimiter(lines))
+			
+			if viewer_window:
+				viewer_window.extra_line_positions.extend(
+					(table_view, line_idx + 1) for line_idx, status in enumerate(line_status) if status)
+		
+		deleted_frame = ttk.Frame(content_frame)
 		
-		initial_font_size = int(11 * self.files_viewer_zoom)
+		deleted_label = ttk.Label(deleted_frame, text="🗑 Deleted Lines:", 
+								 foreground="#CC0000", font=data_bold_font)
+		deleted_label.pack(anchor="w")
 		
-		text_widget = tk.Text(content_frame, wrap="none",
-							  font=("Consolas", initial_font_size, "bold"),
-							  bg="white",
+		deleted_text = tk.Text(deleted_frame, wrap="none",
+							  font=data_font,
+							  bg="#FFE6E6",  
 							  borderwidth=2,
 							  relief="solid",
 							  padx=10,
-							  pady=10)
-		text_widget.pack(fill="both", expand=False, padx=5, pady=5)
+							  pady=5,
+							  height=1)  
+		deleted_text.pack(fill="x", pady=(5, 0))
+		deleted_text.tag_config("deleted", foreground="#CC0000")
+		
+		modified_frame = ttk.Frame(content_frame)
+		
+		modified_label = ttk.Label(modified_frame, text="📝 Original Content (Modified Lines):", 
+								   foreground="#0066CC", font=data_bold_font)
+		modified_label.pack(anchor="w")
+		
+		modified_text = tk.Text(modified_frame, wrap="none",
+							   font=data_font,
+							   bg="#E6F2FF",  
+							   borderwidth=2,
+							   relief="solid",
+							   padx=10,
+							   pady=5,
+							   height=1)  
+		modified_text.pack(fill="x", pady=(5, 0))
+		modified_text.tag_config("modified", foreground="#0066CC")
+		
+		def update_change_panels(record_diff: RecordDiff):
+			panels = (
+				(deleted_frame, deleted_text, [f"Line {line_num}: {line_content}\n" for line_num, line_content in record_diff.removed], "deleted"),
+				(modified_frame, modified_text, [f"Line {line_num} (original): {original_content}\n" for line_num, original_content in record_diff.modified], "modified"),
+			)
+			for frame, panel_text, entries, tag_name in panels:
+				panel_text.config(state="normal")
+				panel_text.delete("1.0", tk.END)
+				if entries:
+					panel_text.insert("end", "".join(entries), tag_name)
+					panel_text.config(height=min(len(entries), 5))
+					if not frame.winfo_manager():
+						if frame is deleted_frame and modified_frame.winfo_manager():
+							frame.pack(fill="x", padx=5, pady=(10, 5), before=modified_frame)
+						else:
+							frame.pack(fill="x", padx=5, pady=(10, 5))
+				elif frame.winfo_manager():
+					frame.pack_forget()
+				panel_text.config(state="disabled")
 		
-		text_widget.tag_config("extra_line", background="#FFFF99")  
-		text_widget.tag_config("modified_line", background="#FFD4A3")  
-		text_widget.tag_config("current_extra_line", background="#FFA500")  
+		update_change_panels(record_diff)
+		table_view.update_change_panels = update_change_panels
 		
-		if lines:
-			first_line = lines[0]
-			delimiter = ',' if ',' in first_line else '\t'
-			
-			for i, color in enumerate(colors):
-				text_widget.tag_config(f"col{i}", foreground=color, font=("Consolas", initial_font_size, "bold"))
-			
-			for line_idx, line in enumerate(lines):
-				line_num = line_idx + 1
-				
-				status = diff_map.get(line_idx)
-				
-				columns = line.split(delimiter)
-				for col_idx, column in enumerate(columns):
-					color_idx = col_idx % len(colors)
-					text_widget.insert("end", column, f"col{color_idx}")
-					if col_idx < len(columns) - 1:
-						text_widget.insert("end", delimiter)
-				text_widget.insert("end", "\n")
-				
-				if status == 'added':
-					text_widget.tag_add("extra_line", f"{line_num}.0", f"{line_num}.end")
-					if viewer_window:
-						viewer_window.extra_line_positions.append((text_widget, line_num))
-				elif status == 'modified':
-					text_widget.tag_add("modified_line", f"{line_num}.0", f"{line_num}.end")
-					if viewer_window:
-						viewer_window.extra_line_positions.append((text_widget, line_num))
-		
-		text_widget.config(height=num_lines, state="disabled")
-		
-		if deleted_lines:
-			deleted_frame = ttk.Frame(content_frame)
-			deleted_frame.pack(fill="x", padx=5, pady=(10, 5))
-			
-			deleted_label = ttk.Label(deleted_frame, text="🗑 Deleted Lines:", 
-									 foreground="#CC0000", font=("Consolas", initial_font_size, "bold"))
-			deleted_label.pack(anchor="w")
-			
-			deleted_text = tk.Text(deleted_frame, wrap="none",
-								  font=("Consolas", initial_font_size),
-								  bg="#FFE6E6",  
-								  borderwidth=2,
-								  relief="solid",
-								  padx=10,
-								  pady=5,
-								  height=min(len(deleted_lines), 5))  
-			deleted_text.pack(fill="x", pady=(5, 0))
-			
-			if len(deleted_lines) > 5:
-				deleted_scrollbar = ttk.Scrollbar(deleted_frame, orient="vertical", command=deleted_text.yview)
-				deleted_text.config(yscrollcommand=deleted_scrollbar.set)
-			
-			for line_num, line_content in deleted_lines:
-				deleted_text.insert("end", f"Line {line_num}: {line_content}\n", "deleted")
-			
-			deleted_text.tag_config("deleted", foreground="#CC0000")
-			deleted_text.config(state="disabled")
+		validation_label = ttk.Label(header_frame, text="", foreground="#D9534F", font=data_font)
+		validation_label.pack(side="left", padx=10)
 		
-		if modified_lines:
-			modified_frame = ttk.Frame(content_frame)
-			modified_frame.pack(fill="x", padx=5, pady=(10, 5))
-			
-			modified_label = ttk.Label(modified_frame, text="📝 Original Content (Modified Lines):", 
-									   foreground="#0066CC", font=("Consolas", initial_font_size, "bold"))
-			modified_label.pack(anchor="w")
-			
-			modified_text = tk.Text(modified_frame, wrap="none",
-								   font=("Consolas", initial_font_size),
-								   bg="#E6F2FF",  
-								   borderwidth=2,
-								   relief="solid",
-								   padx=10,
-								   pady=5,
-								   height=min(len(modified_lines), 5))  
-			modified_text.pack(fill="x", pady=(5, 0))
-			
-			if len(modified_lines) > 5:
-				modified_scrollbar = ttk.Scrollbar(modified_frame, orient="vertical", command=modified_text.yview)
-				modified_text.config(yscrollcommand=modified_scrollbar.set)
-			
-			for line_num, original_content in modified_lines:
-				modified_text.insert("end", f"Line {line_num} (original): {original_content}\n", "modified")
-			
-			modified_text.tag_config("modified", foreground="#0066CC")
-			modified_text.config(state="disabled")
+		def update_validation(issues: list[DataIssue]):
+			table_view.set_issues(issues)
+			if not issues:
+				validation_label.config(text="")
+				return
+			first = issues[0]
+			invalid_rows = len({issue.line for issue in issues})
+			checklist = f" (Checklist {first.checklist})" if first.checklist else ""
+			validation_label.config(text=f"⚠ {invalid_rows} invalid row{'s' if invalid_rows != 1 else ''} - line {first.line + 1}: {first.message}{checklist}")
+		
+		table_view.update_validation = update_validation
 		
 		def toggle_collapse():
 			if is_collapsed.get():
@@ -2539,19 +6142,13 @@ class PythonTesterApp:
 		
 		toggle_button.config(command=toggle_collapse)
 		
-		return text_widget
+		return table_view
 
 	def _save_predefined_inputs(self) -> None:
-		PREDEFINED_INPUTS_PATH.write_text(json.dumps(self.predefined_inputs, indent=2), encoding="utf-8")
+		self.predefined_inputs_store.mark_dirty()
 
 	def _reload_predefined_listbox(self) -> None:
-		self.predefined_listbox.delete(0, tk.END)
-		for i, item in enumerate(self.predefined_inputs):
-			self.predefined_listbox.insert(tk.END, item)
-			if item.strip().startswith("#"):
-				self.predefined_listbox.itemconfig(i, fg="blue", selectbackground="lightblue")
-			if item.strip().startswith("# Checklist "):
-				self.predefined_listbox.itemconfig(i, fg="green", selectbackground="lightblue")
+		self.preset_model.reload(self.predefined_inputs)
 
 	def _on_process_end(self) -> None:
 		if self.process:
@@ -2570,6 +6167,18 @@ class PythonTesterApp:
 				return
 			self._stop_process()
 
+		self._flush_feedback_autosave()
+		self.dispatcher.stop()
+		self.file_watcher.stop()
+		self.analysis_executor.shutdown(wait=False, cancel_futures=True)
+		self.background_executor.shutdown(wait=False, cancel_futures=True)
+		for future in self.fuzz_futures:
+			future.cancel()
+		self.config_store.flush()
+		self.predefined_inputs_store.flush()
+		self.io_executor.shutdown(wait=True)
+		self.highlight_cache.flush()
+		self.grading_state.close()
 		self.root.destroy()
 
 	def _setup_zoom_bindings(self) -> None:
@@ -2601,49 +6210,27 @@ class PythonTesterApp:
 		self._save_config()
 
 	def _apply_zoom(self) -> None:
-		base_font_size = 9
-		new_font_size = int(base_font_size * self.zoom_level)
-		
-		style = ttk.Style()
-		style.configure(".", font=("TkDefaultFont", new_font_size))
-		
-		text_font_size = int(10 * self.zoom_level)
-		self.output_text.configure(font=("Consolas", text_font_size))
-		
-		if self.feedback_text:
-			self.feedback_text.configure(font=("TkDefaultFont", new_font_size))
-		
-		entry_font = ("TkDefaultFont", new_font_size)
-		self.file_combo.configure(font=entry_font)
-		self.manual_entry.configure(font=entry_font)
-		self.points_adjust_entry.configure(font=entry_font)
-		
-		listbox_font = ("TkDefaultFont", new_font_size)
-		self.predefined_listbox.configure(font=listbox_font)
-		
-		points_font_size = int(10 * self.zoom_level)
-		self.points_display.configure(font=("TkDefaultFont", points_font_size, "bold"))
-		self.grade_display.configure(font=("TkDefaultFont", points_font_size, "bold"))
-		
-		label_font = ("TkDefaultFont", int(9 * self.zoom_level))
-		self.directory_label.configure(font=label_font)
-		self.feedback_status_label.configure(font=label_font)
-		
-		button_font = ("TkDefaultFont", new_font_size)
-		self.run_button.configure(font=button_font)
-		self.stop_button.configure(font=button_font)
-		self.clear_button.configure(font=button_font)
-		self.open_code_button.configure(font=button_font)
-		self.open_files_button.configure(font=button_font)
-		self.open_ai_button.configure(font=button_font)
+		self.fonts.set_zoom("main", self.zoom_level)
+
+	def _set_viewer_zoom(self, group: str, zoom: float) -> None:
+		"""Zoom every code/diff viewer ("code") or data files viewer ("files") at once."""
+		zoom = max(0.5, min(3.0, zoom))
+		if group == "code":
+			self.code_viewer_zoom = zoom
+		else:
+			self.files_viewer_zoom = zoom
+		self.fonts.set_zoom(group, zoom)
+		self._save_config()
+
+	def _bind_viewer_zoom(self, viewer: tk.Toplevel, group: str) -> None:
+		def zoom_by(step):
+			self._set_viewer_zoom(group, self.fonts.zoom[group] + step)
 		
-		menu_font = ("Segoe UI", new_font_size)
-		try:
-			self.menubar.config(font=menu_font)
-			self.file_menu.config(font=menu_font)
-			self.view_menu.config(font=menu_font)
-		except Exception:
-			pass
+		viewer.bind("<Control-MouseWheel>", lambda e: zoom_by(0.1 if e.delta > 0 else -0.1))
+		viewer.bind("<Control-plus>", lambda e: zoom_by(0.1))
+		viewer.bind("<Control-equal>", lambda e: zoom_by(0.1))
+		viewer.bind("<Control-minus>", lambda e: zoom_by(-0.1))
+		viewer.bind("<Control-Key-0>", lambda e: self._set_viewer_zoom(group, 1.2))
 
 	def _load_config(self) -> None:
 		if CONFIG_PATH.exists():
@@ -2661,28 +6248,37 @@ class PythonTesterApp:
 						self.last_opened_file = config["last_opened_file"]
 					if "current_points" in config:
 						self.current_points = max(0, min(100, int(float(config["current_points"]))))
-					if "last_file_for_points" in config:
-						self.last_file_for_points = config["last_file_for_points"]
 					if "code_viewer_zoom" in config:
 						self.code_viewer_zoom = max(0.5, min(3.0, float(config["code_viewer_zoom"])))
 					if "files_viewer_zoom" in config:
 						self.files_viewer_zoom = max(0.5, min(3.0, float(config["files_viewer_zoom"])))
+					if "last_compare_file" in config:
+						self.last_compare_file = config["last_compare_file"]
+					if "artifact_cache_mb" in config:
+						self.artifacts.set_budget(max(8, int(config["artifact_cache_mb"])) * 1024 * 1024)
+					if config.get("suite") in self.suite_library.names():
+						self.suite = self.suite_library.get(config["suite"])
 			except (json.JSONDecodeError, ValueError, KeyError):
 				self.zoom_level = 1.0
 
 	def _save_config(self) -> None:
+		self.config_store.mark_dirty()
+
+	def _config_snapshot(self) -> dict:
 		config = {
 			"zoom_level": self.zoom_level,
-			"current_points": self.current_points,
-			"last_file_for_points": self.last_file_for_points,
 			"code_viewer_zoom": self.code_viewer_zoom,
-			"files_viewer_zoom": self.files_viewer_zoom
+			"files_viewer_zoom": self.files_viewer_zoom,
+			"artifact_cache_mb": self.artifacts.max_bytes // (1024 * 1024)
 		}
 		if self.submissions_dir is not None:
 			config["submissions_dir"] = str(self.submissions_dir)
 		if hasattr(self, 'last_opened_file'):
 			config["last_opened_file"] = self.last_opened_file
-		CONFIG_PATH.write_text(json.dumps(config, indent=2), encoding="utf-8")
+		if self.last_compare_file:
+			config["last_compare_file"] = self.last_compare_file
+		config["suite"] = self.suite.name
+		return config
 
 def initialize_bundled_resources():
 	if not getattr(sys, 'frozen', False):
@@ -0,0 +1,17 @@
+import os
+
+from tester import ArtifactCache
+
+
+def test_revalidate_rereads_file_with_unchanged_signature(tmp_path):
+	path = tmp_path / "data.txt"
+	path.write_bytes(b"a;1")
+	stat = path.stat()
+	cache = ArtifactCache()
+	decode = lambda raw: raw[0].decode()
+	assert cache.load("raw", (path,), decode) == "a;1"
+
+	path.write_bytes(b"b;2")
+	os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+	assert cache.load("raw", (path,), decode) == "a;1"   # cold lookups trust the signature
+	assert cache.load("raw", (path,), decode, revalidate=True) == "b;2"
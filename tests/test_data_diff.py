@@ -0,0 +1,32 @@
+from tester import diff_data_records
+
+
+def test_whitespace_around_fields_is_not_a_change():
+	base = ["1,Ada,Lovelace", "2,Alan,Turing"]
+	lines = ["2, Alan ,Turing", "1,Ada,Lovelace "]
+	result = diff_data_records("students.txt", base, lines)
+	assert result.line_status == [None, None]
+	assert result.modified == []
+	assert result.changed_fields == {}
+
+
+def test_edited_field_is_reported():
+	result = diff_data_records("students.txt", ["1,Ada,Lovelace"], ["1, Ada ,Byron"])
+	assert result.line_status == ["modified"]
+	assert result.changed_fields == {0: [2]}
+
+
+def test_reordered_rows_with_the_same_key():
+	base = ["A0210,61835,2024-02-01,1", "A0210,61835,2025-02-01,4"]
+	result = diff_data_records("passed.txt", base, list(reversed(base)))
+	assert result.line_status == [None, None]
+	assert result.changed_fields == {}
+	assert result.removed == []
+
+
+def test_edited_duplicate_key_row_does_not_take_an_identical_rows_match():
+	base = ["A0210,61835,2024-02-01,1", "A0210,61835,2025-02-01,4"]
+	lines = ["A0210,61835,2025-06-01,2", "A0210,61835,2024-02-01,1"]
+	result = diff_data_records("passed.txt", base, lines)
+	assert result.line_status == ["modified", None]
+	assert result.changed_fields == {0: [2, 3]}
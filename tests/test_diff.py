@@ -0,0 +1,52 @@
+import random
+import time
+
+from tester import patience_diff_opcodes
+
+
+def repetitive_pair(size):
+	rng = random.Random(7)
+	a = [f"print({rng.randrange(50)})" for _ in range(size)]
+	b = list(a)
+	for _ in range(size // 20):
+		b[rng.randrange(size)] = f"print({rng.randrange(50)})"
+	for _ in range(size // 50):
+		del b[rng.randrange(len(b))]
+	return a, b
+
+
+def check_opcodes(a, b, opcodes):
+	assert opcodes[0][1] == 0 and opcodes[0][3] == 0
+	assert opcodes[-1][2] == len(a) and opcodes[-1][4] == len(b)
+	for (_, _, i2, _, j2), (_, i1, _, j1, _) in zip(opcodes, opcodes[1:]):
+		assert (i2, j2) == (i1, j1)
+	for tag, i1, i2, j1, j2 in opcodes:
+		if tag == "equal":
+			assert a[i1:i2] == b[j1:j2]
+
+
+def test_repetitive_input_diffs_in_near_linear_time():
+	a, b = repetitive_pair(20_000)
+	start = time.perf_counter()
+	opcodes = patience_diff_opcodes(a, b)
+	elapsed = time.perf_counter() - start
+	check_opcodes(a, b, opcodes)
+	assert sum(i2 - i1 for tag, i1, i2, _, _ in opcodes if tag == "equal") > 0.8 * len(b)
+	assert elapsed < 2.0
+
+
+def test_shifted_repeating_block_diffs_in_near_linear_time():
+	a = [f"print({i % 50})" for i in range(20_000)]
+	b = [f"print({(i + 25) % 50})" for i in range(10_000)] + a[:10_000]
+	start = time.perf_counter()
+	opcodes = patience_diff_opcodes(a, b)
+	elapsed = time.perf_counter() - start
+	check_opcodes(a, b, opcodes)
+	assert elapsed < 2.0
+
+
+def test_small_edit():
+	a = ["a", "b", "c", "d"]
+	b = ["a", "x", "c", "d", "e"]
+	assert patience_diff_opcodes(a, b) == [
+		("equal", 0, 1, 0, 1), ("replace", 1, 2, 1, 2), ("equal", 2, 4, 2, 4), ("insert", 4, 4, 4, 5)]
@@ -0,0 +1,29 @@
+from tester import parse_feedback
+
+
+def test_fields_on_one_line():
+	summary = parse_feedback("Nice work.\n\n=================================\n\nPoints: 85 | Grade: 4\n")
+	assert summary.points == 85
+	assert summary.grade == "4"
+	assert summary.comments == "Nice work."
+
+
+def test_values_typed_under_empty_template_labels():
+	template = "Good structure.\n\n=================================\n\nPoints:\n92\n\nGrade:\n5\n"
+	summary = parse_feedback(template)
+	assert summary.points == 92
+	assert summary.grade == "5"
+	assert summary.comments == "Good structure."
+
+
+def test_without_separator_values_are_not_comments():
+	for content in ("Missing input checks.\nPoints: 70 | Grade: 3", "Missing input checks.\nPoints:\n70\nGrade:\n3"):
+		summary = parse_feedback(content)
+		assert (summary.points, summary.grade) == (70, "3")
+		assert summary.comments == "Missing input checks."
+
+
+def test_inline_values_still_parse():
+	summary = parse_feedback("=====\nPoints: 88,5\nGrade: 4\n")
+	assert summary.points == 88.5
+	assert summary.grade == "4"
@@ -0,0 +1,48 @@
+import queue
+import time
+
+import tester
+from tester import EVENT_FILE_CHANGED, FileWatcherService
+
+
+class Dispatcher:
+	def __init__(self):
+		self.events = queue.Queue()
+
+	def post(self, kind, payload=None, callback=None):
+		self.events.put((kind, payload))
+
+
+def next_change(dispatcher, timeout=5):
+	kind, change = dispatcher.events.get(timeout=timeout)
+	assert kind == EVENT_FILE_CHANGED
+	return change
+
+
+def test_pinned_folder_stays_watched_after_switching(tmp_path, monkeypatch):
+	monkeypatch.setattr(tester, "Observer", None)   # exercise the polling fallback
+	monkeypatch.setattr(FileWatcherService, "MIN_POLL_INTERVAL", 0.05)
+	monkeypatch.setattr(FileWatcherService, "MAX_POLL_INTERVAL", 0.05)
+	first, second = tmp_path / "first", tmp_path / "second"
+	first.mkdir()
+	second.mkdir()
+	dispatcher = Dispatcher()
+	watcher = FileWatcherService(dispatcher)
+	try:
+		watcher.watch(first)
+		watcher.pin(first)
+		watcher.watch(second)
+		time.sleep(0.3)
+
+		(first / "students.txt").write_text("1,Ada")
+		change = next_change(dispatcher)
+		assert (change.change, change.path) == ("created", first / "students.txt")
+
+		watcher.unpin(first)
+		time.sleep(0.3)
+		(first / "courses.txt").write_text("A0100")
+		(second / "passed.txt").write_text("A0100,1")
+		change = next_change(dispatcher)
+		assert change.path == second / "passed.txt"
+	finally:
+		watcher.stop()
@@ -0,0 +1,28 @@
+import os
+
+import pytest
+
+from tester import write_gradebook
+
+ROW = {"number": 1, "student": "Ada", "folder": "ada", "points": 85.0, "grade": "4",
+	   "feedback_saved": True, "feedback_modified": None, "comments": "Tidy, well tested"}
+
+
+def test_csv_gradebook(tmp_path):
+	output_path = tmp_path / "grades.csv"
+	write_gradebook([ROW], output_path)
+	lines = output_path.read_text(encoding="utf-8-sig").splitlines()
+	assert lines[1] == '1,Ada,ada,85,4,yes,,"Tidy, well tested"'
+
+
+def test_failed_csv_write_leaves_no_temp_file(tmp_path, monkeypatch):
+	output_path = tmp_path / "grades.csv"
+	output_path.write_text("previous", encoding="utf-8")
+
+	def fail(_):
+		raise OSError("disk full")
+	monkeypatch.setattr(os, "fsync", fail)
+	with pytest.raises(OSError):
+		write_gradebook([ROW], output_path)
+	assert list(tmp_path.iterdir()) == [output_path]
+	assert output_path.read_text(encoding="utf-8") == "previous"
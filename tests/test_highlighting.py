@@ -0,0 +1,14 @@
+from tester import LazySyntaxHighlighter
+
+
+def test_multiline_string_is_tagged_on_every_line():
+	code = 'def f():\n    """one\n    two\n    three"""\n    return 1\n'
+	line_spans = LazySyntaxHighlighter.lex(code)
+	lines = code.split("\n")
+
+	for line_idx in (1, 2, 3):
+		doc_spans = [(start, end) for start, end, tag in line_spans[line_idx] if "String" in tag]
+		assert doc_spans, f"line {line_idx + 1} has no string span"
+		for start, end in doc_spans:
+			assert 0 <= start < end <= len(lines[line_idx])
+	assert any("Keyword" in tag for _, _, tag in line_spans[4])
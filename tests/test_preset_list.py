@@ -0,0 +1,51 @@
+from tester import PresetListModel
+
+
+class IndexedListbox:
+	"""Stand-in for tk.Listbox that, like Tk, keeps item options on row indices."""
+
+	def __init__(self):
+		self.rows = []
+		self.options = {}
+
+	def insert(self, index, *values):
+		index = len(self.rows) if index == "end" else index
+		self.rows[index:index] = values
+
+	def delete(self, first, last=None):
+		if first == 0 and last == "end":
+			self.rows.clear()
+		else:
+			del self.rows[first]
+		self.options = {index: options for index, options in self.options.items() if index < len(self.rows)}
+
+	def itemconfig(self, index, **options):
+		self.options.setdefault(index, {}).update(options)
+
+	def colour(self, index):
+		return self.options.get(index, {}).get("fg") or ""
+
+
+class Store:
+	def mark_dirty(self):
+		pass
+
+
+def colours(model):
+	return [model.listbox.colour(index) for index in range(len(model.items))]
+
+
+def test_row_colours_follow_inserts_deletes_and_moves():
+	model = PresetListModel(IndexedListbox(), Store())
+	model.reload(["# Checklist A", "1", "# note", "2"])
+	assert colours(model) == ["green", "", "blue", ""]
+
+	model.insert(0, "0")
+	assert colours(model) == ["", "green", "", "blue", ""]
+	model.move(3, 4)
+	assert colours(model) == ["", "green", "", "", "blue"]
+	model.delete(1)
+	assert colours(model) == ["", "", "", "blue"]
+	model.set(3, "3")
+	assert colours(model) == ["", "", "", ""]
+	assert model.checklist_for(3) == "No checklist found"
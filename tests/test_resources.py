@@ -0,0 +1,53 @@
+from tester import analyze_resource_handling
+
+
+def test_break_leaves_the_loop_with_the_handle_open():
+	report = analyze_resource_handling(
+		"def first_readable(paths):\n"
+		"    for path in paths:\n"
+		"        f = open(path)\n"
+		"        if f.readable():\n"
+		"            break\n"
+		"        f.close()\n")
+	assert report.partial_lines == [3]
+
+	report = analyze_resource_handling(
+		"def first(paths):\n"
+		"    for path in paths:\n"
+		"        f = open(path)\n"
+		"        break\n"
+		"    f.close()\n")
+	assert report.closed_lines == [3]
+
+
+def test_continue_skips_the_close():
+	report = analyze_resource_handling(
+		"for path in paths:\n"
+		"    f = open(path)\n"
+		"    if not f.readable():\n"
+		"        continue\n"
+		"    f.close()\n")
+	assert report.partial_lines == [2]
+
+
+def test_module_handle_closed_by_a_called_function():
+	report = analyze_resource_handling(
+		"log = open('log.txt', 'w')\n"
+		"def finish():\n"
+		"    log.close()\n"
+		"log.write('done')\n"
+		"finish()\n")
+	assert report.closed_lines == [1]
+	assert report.is_balanced
+
+
+def test_handle_passed_to_a_function_that_closes_it():
+	report = analyze_resource_handling(
+		"def done(handle):\n"
+		"    handle.close()\n"
+		"data = open('data.txt')\n"
+		"done(data)\n"
+		"other = open('other.txt')\n"
+		"print(other)\n")
+	assert report.escaped_lines == [3]
+	assert report.unclosed_lines == [5]
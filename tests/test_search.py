@@ -0,0 +1,7 @@
+from tester import SourceSearchIndex
+
+
+def test_extended_term_finds_matches_inside_previous_hits():
+	index = SourceSearchIndex("aaab\nxaab")
+	index.find("aa")
+	assert index.find("aab") == SourceSearchIndex("aaab\nxaab").find("aab") == [(1, 4), (6, 9)]